@@ -0,0 +1,81 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Build the tuning table used by ``bakeoff(_opt).evaluate()``.
+
+Times every candidate kernel over the same grid of ``(N + 1, k)`` used in
+``across-num-nodes.ipynb`` and ``across-num-values.ipynb`` and saves the
+fastest kernel at each point to the per-machine tuning table.
+"""
+
+import argparse
+import importlib
+import timeit
+
+import nb_helpers
+
+
+NUM_NODES_LIST = (2, 3, 4, 6, 8, 10, 12, 14, 16, 20, 24, 28, 32, 64)
+NUM_VALUES_LIST = (3, 9, 33, 129, 513)
+SEED = 798031893
+REPEAT = 3
+
+
+def best_time(fn, nodes, s_vals):
+    timer = timeit.Timer(lambda: fn(nodes, s_vals))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def fastest_kernel(bakeoff_module, num_nodes, num_values):
+    nodes, s_vals = nb_helpers.generate_nodes(num_nodes, num_values, SEED)
+    dimension, _ = nodes.shape
+    timings = []
+    for name in bakeoff_module.CANDIDATES:
+        # NOTE: A kernel that overflows is fast but wrong, so never let it win.
+        max_degree = bakeoff_module.VS_MAX_DEGREE.get(name, num_nodes)
+        if num_nodes - 1 > max_degree:
+            continue
+
+        fn = getattr(bakeoff_module, name)
+        timings.append((best_time(fn, nodes, s_vals), name))
+
+    _, kernel = min(timings)
+    return dimension, kernel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--package",
+        choices=("bakeoff", "bakeoff_opt"),
+        default="bakeoff_opt",
+        help="The package to tune.",
+    )
+    args = parser.parse_args()
+    bakeoff_module = importlib.import_module(args.package)
+
+    entries = []
+    for num_nodes in NUM_NODES_LIST:
+        for num_values in NUM_VALUES_LIST:
+            dimension, kernel = fastest_kernel(
+                bakeoff_module, num_nodes, num_values
+            )
+            print(f"N + 1 = {num_nodes:2d}, k = {num_values:3d}: {kernel}")
+            entries.append((dimension, num_nodes, num_values, kernel))
+
+    path = bakeoff_module.save_tuning_table(entries)
+    print(f"Saved: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,584 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run the bakeoff from the command line (no IPython required).
+
+Each record is written as a single line of JSON, e.g.
+
+.. code-block:: json
+
+   {"function": "bakeoff_opt.serial", "num_nodes": 4, "num_values": 9,
+    "dimension": 2, "seed": 798031893, "loops": 100000, "repeat": 7,
+    "timings": [...], "samples": [...], "best": ..., "average": ...,
+    "stdev": ...}
+
+where ``timings`` holds the time per loop (in seconds) for each repeat and
+``samples`` holds the time per loop for each of the (many) shorter batches
+that make up the repeats.
+Functions are named as in :func:`nb_helpers.fn_name` and inputs come from
+:func:`nb_helpers.generate_nodes`, so results can also be appended to the
+results store used by the notebooks with ``--store``.
+
+``sweep`` times the same (``d = 2``) points as the notebooks in a pool of
+worker processes. Each completed point is saved to the results store right
+away and points that are already there are skipped, so an interrupted
+sweep picks up where it left off.
+
+``compare`` checks two JSON lines files (e.g. before and after changing
+``OPTIMIZED_FCFLAGS``) for regressions, using a bootstrap confidence
+interval for the ratio of mean timings at each input. The bootstrap
+resamples the per-batch ``samples`` (``repeat * samples_per_repeat`` of
+them, 350 by default) since a few ``repeat`` means are too few for a
+reliable interval. Files written before ``samples`` was added fall back to
+``timings``; the sample size used is printed as ``n``.
+"""
+
+import argparse
+import concurrent.futures
+import fnmatch
+import itertools
+import json
+import multiprocessing
+import os
+import pathlib
+import statistics
+import sys
+import timeit
+
+import numpy as np
+
+import nb_helpers
+import results_store
+
+
+DEFAULT_NUM_NODES = (2, 4, 8, 16, 32, 64)
+DEFAULT_NUM_VALUES = (3, 9, 33, 129, 513)
+DEFAULT_SEED = 798031893
+DEFAULT_REPEAT = 7
+DEFAULT_WARMUP = 1
+DEFAULT_SAMPLES_PER_REPEAT = 50
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_NUM_RESAMPLES = 10000
+DEFAULT_BOOTSTRAP_SEED = 1729
+PACKAGE_TITLES = (
+    ("bakeoff", "Non-Optimized Implementations"),
+    ("bakeoff_opt", "Optimized Implementations"),
+    ("bakeoff_numpy", "NumPy Implementations"),
+)
+
+
+def select_functions(patterns):
+    """Select functions by (glob) name, e.g. ``bakeoff_opt.vs_*``.
+
+    Args:
+        patterns (Optional[List[str]]): The patterns to match against
+            :func:`nb_helpers.fn_name`. If empty, all functions are used.
+
+    Returns:
+        List[Callable]: The matching functions, in the order of
+        ``nb_helpers.ALL_FUNCTIONS``.
+
+    Raises:
+        ValueError: If a pattern doesn't match any function.
+    """
+    if not patterns:
+        return list(nb_helpers.ALL_FUNCTIONS)
+
+    names = [nb_helpers.fn_name(fn) for fn in nb_helpers.ALL_FUNCTIONS]
+    for pattern in patterns:
+        if not fnmatch.filter(names, pattern):
+            raise ValueError("Pattern does not match any function", pattern)
+
+    return [
+        fn
+        for name, fn in zip(names, nb_helpers.ALL_FUNCTIONS)
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def time_once(
+    fn,
+    num_nodes,
+    num_values,
+    dimension,
+    seed,
+    repeat,
+    warmup,
+    samples_per_repeat=DEFAULT_SAMPLES_PER_REPEAT,
+):
+    """Time a single function on a single input.
+
+    Mirrors ``%timeit``: ``autorange()`` picks the number of loops so that
+    each repeat takes at least 0.2 seconds. Each repeat is timed as (up
+    to) ``samples_per_repeat`` equal batches of loops, so that ``compare``
+    has many samples to resample rather than just ``repeat`` means.
+
+    Returns:
+        Dict[str, Any]: The benchmark record.
+    """
+    nodes, s_vals = nb_helpers.generate_nodes(
+        num_nodes, num_values, seed, dimension=dimension
+    )
+    for _ in range(warmup):
+        fn(nodes, s_vals)
+
+    timer = timeit.Timer(lambda: fn(nodes, s_vals))
+    loops, _ = timer.autorange()
+    batch_size = max(1, loops // samples_per_repeat)
+    num_batches = loops // batch_size
+    loops = batch_size * num_batches
+    timings = []
+    samples = []
+    for _ in range(repeat):
+        batches = [
+            timer.timeit(number=batch_size) / batch_size
+            for _ in range(num_batches)
+        ]
+        timings.append(statistics.mean(batches))
+        samples.extend(batches)
+
+    return {
+        "function": nb_helpers.fn_name(fn),
+        "num_nodes": num_nodes,
+        "num_values": num_values,
+        "dimension": dimension,
+        "seed": seed,
+        "loops": loops,
+        "repeat": repeat,
+        "timings": timings,
+        "samples": samples,
+        "best": min(timings),
+        "average": statistics.mean(timings),
+        "stdev": statistics.pstdev(timings),
+    }
+
+
+def run(args):
+    if args.cpus:
+        os.sched_setaffinity(0, args.cpus)
+
+    functions = select_functions(args.functions)
+    store = None
+    if args.store:
+        store = results_store.ResultStore()
+
+    output = sys.stdout
+    if args.output is not None:
+        output = open(args.output, "a")
+
+    grid = itertools.product(
+        args.seeds, args.dimensions, args.num_nodes, args.num_values
+    )
+    try:
+        for seed, dimension, num_nodes, num_values in grid:
+            for fn in functions:
+                record = time_once(
+                    fn,
+                    num_nodes,
+                    num_values,
+                    dimension,
+                    seed,
+                    args.repeat,
+                    args.warmup,
+                    args.samples_per_repeat,
+                )
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+                if store is not None:
+                    store.add_record(record)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if store is not None:
+            store.close()
+
+
+def physical_cores():
+    """Choose one logical CPU per physical core.
+
+    Only CPUs in the current affinity mask are considered. Hyperthread
+    siblings share a core (and its caches), so timing on both at once would
+    make the measurements interfere.
+
+    Returns:
+        List[int]: The chosen logical CPUs.
+    """
+    cores = {}
+    for cpu in sorted(os.sched_getaffinity(0)):
+        topology = pathlib.Path("/sys/devices/system/cpu", f"cpu{cpu}")
+        topology = topology / "topology"
+        try:
+            package_id = (topology / "physical_package_id").read_text()
+            core_id = (topology / "core_id").read_text()
+            core = (int(package_id), int(core_id))
+        except OSError:
+            core = cpu
+        cores.setdefault(core, cpu)
+
+    return sorted(cores.values())
+
+
+def _pin_worker(cpu_queue):
+    os.sched_setaffinity(0, {cpu_queue.get()})
+
+
+def _time_point(point, repeat, warmup, samples_per_repeat):
+    name, num_nodes, num_values, seed = point
+    return time_once(
+        nb_helpers.get_function(name),
+        num_nodes,
+        num_values,
+        results_store.DEFAULT_DIMENSION,
+        seed,
+        repeat,
+        warmup,
+        samples_per_repeat,
+    )
+
+
+def sweep(args):
+    functions = select_functions(args.functions)
+    store = results_store.ResultStore()
+    # NOTE: These are the same keys used by ``nb_helpers.time_function()``,
+    #       so a finished sweep also fills the cache used by the notebooks.
+    points = [
+        (nb_helpers.fn_name(fn), num_nodes, num_values, seed)
+        for seed, num_nodes, num_values in itertools.product(
+            args.seeds, args.num_nodes, args.num_values
+        )
+        for fn in functions
+    ]
+    pending = [point for point in points if point not in store]
+    print(
+        f"Skipping {len(points) - len(pending)} of {len(points)} point(s) "
+        "already in the results store",
+        file=sys.stderr,
+    )
+
+    cpus = physical_cores()
+    num_workers = len(cpus) if args.workers is None else args.workers
+    num_workers = max(1, min(num_workers, len(cpus)))
+    # NOTE: ``spawn`` (rather than ``fork``) gives each worker a fresh
+    #       interpreter, so no state (e.g. an open SQLite connection) leaks
+    #       from the parent.
+    context = multiprocessing.get_context("spawn")
+    cpu_queue = context.Queue()
+    for cpu in cpus[:num_workers]:
+        cpu_queue.put(cpu)
+
+    output = sys.stdout
+    if args.output is not None:
+        output = open(args.output, "a")
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=context,
+        initializer=_pin_worker,
+        initargs=(cpu_queue,),
+    )
+    futures = []
+    try:
+        for point in pending:
+            futures.append(
+                executor.submit(
+                    _time_point,
+                    point,
+                    args.repeat,
+                    args.warmup,
+                    args.samples_per_repeat,
+                )
+            )
+        for future in concurrent.futures.as_completed(futures):
+            record = future.result()
+            # NOTE: Each point is committed as soon as it finishes, so an
+            #       interrupted sweep can be resumed by re-running it.
+            store.add_record(record)
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        # NOTE: ``shutdown(cancel_futures=True)`` needs Python 3.9, so the
+        #       pending points are cancelled one at a time instead.
+        for future in futures:
+            future.cancel()
+        try:
+            executor.shutdown(wait=False)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+            store.close()
+
+
+def load_records(path):
+    """Load the records in a JSON lines file, keyed by input.
+
+    If an input was timed more than once, the last record wins.
+
+    Returns:
+        Dict[Tuple[str, int, int, int, int], Dict[str, Any]]: The records,
+        keyed by ``(function, num_nodes, num_values, dimension, seed)``.
+    """
+    records = {}
+    with open(path, "r") as file_obj:
+        for line in file_obj:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            key = (
+                record["function"],
+                record["num_nodes"],
+                record["num_values"],
+                record["dimension"],
+                record["seed"],
+            )
+            records[key] = record
+
+    return records
+
+
+def bootstrap_ratio(baseline, candidate, num_resamples, confidence, seed):
+    """Bootstrap a confidence interval for a ratio of mean timings.
+
+    Args:
+        baseline (List[float]): The per-loop timing samples of the
+            baseline.
+        candidate (List[float]): The per-loop timing samples of the
+            candidate.
+        num_resamples (int): The number of bootstrap resamples.
+        confidence (float): The confidence level, e.g. ``0.95``.
+        seed (int): The seed for the resampling.
+
+    Returns:
+        Tuple[float, float, float]: The ratio of the candidate mean to the
+        baseline mean (i.e. ``> 1`` means slower) and the lower and upper
+        bounds of its (percentile) confidence interval.
+    """
+    baseline = np.asarray(baseline)
+    candidate = np.asarray(candidate)
+    random_state = np.random.RandomState(seed=seed)
+    baseline_means = random_state.choice(
+        baseline, size=(num_resamples, baseline.size)
+    ).mean(axis=1)
+    candidate_means = random_state.choice(
+        candidate, size=(num_resamples, candidate.size)
+    ).mean(axis=1)
+    ratios = candidate_means / baseline_means
+
+    tail = 50.0 * (1.0 - confidence)
+    low, high = np.percentile(ratios, [tail, 100.0 - tail])
+    return candidate.mean() / baseline.mean(), low, high
+
+
+def _samples(record):
+    # NOTE: Records written before ``samples`` was added only have the
+    #       ``repeat`` per-repeat means.
+    return record.get("samples", record["timings"])
+
+
+def _print_comparisons(title, rows, confidence):
+    print(title)
+    print("-" * len(title))
+    max_width = max(len(row[0]) for row in rows)
+    print(
+        f"{'':{max_width}}  {'N + 1':>5}  {'k':>5}  {'d':>2}  "
+        f"{'seed':>10}  {'n':>5}  {'ratio':>6}  {confidence:.0%} CI"
+    )
+    for row in rows:
+        name, num_nodes, num_values, dimension, seed, size = row[:6]
+        ratio, low, high, flag = row[6:]
+        line = (
+            f"{name:{max_width}}  {num_nodes:5d}  {num_values:5d}  "
+            f"{dimension:2d}  {seed:10d}  {size:5d}  {ratio:6.3f}  "
+            f"[{low:.3f}, {high:.3f}]  {flag}"
+        )
+        print(line.rstrip())
+
+
+def compare(args):
+    baseline = load_records(args.baseline)
+    candidate = load_records(args.candidate)
+    common = sorted(set(baseline).intersection(candidate))
+    if not common:
+        raise ValueError("No inputs in common", args.baseline, args.candidate)
+
+    # NOTE: Grouped by package, as in ``nb_helpers.compare_bakeoff_times()``.
+    groups = {package: [] for package, _ in PACKAGE_TITLES}
+    num_regressions = 0
+    for key in common:
+        function, num_nodes, num_values, dimension, seed = key
+        baseline_samples = _samples(baseline[key])
+        candidate_samples = _samples(candidate[key])
+        ratio, low, high = bootstrap_ratio(
+            baseline_samples,
+            candidate_samples,
+            args.num_resamples,
+            args.confidence,
+            args.bootstrap_seed,
+        )
+        flag = ""
+        # NOTE: Only flag a change if the **whole** confidence interval is
+        #       past the threshold.
+        if low > 1.0 + args.threshold:
+            flag = "REGRESSION"
+            num_regressions += 1
+        elif high < 1.0 - args.threshold:
+            flag = "improvement"
+
+        package, _, name = function.partition(".")
+        size = min(len(baseline_samples), len(candidate_samples))
+        groups.setdefault(package, []).append(
+            (
+                name,
+                num_nodes,
+                num_values,
+                dimension,
+                seed,
+                size,
+                ratio,
+                low,
+                high,
+                flag,
+            )
+        )
+
+    titles = dict(PACKAGE_TITLES)
+    sections = [
+        (titles.get(package, package), rows)
+        for package, rows in groups.items()
+        if rows
+    ]
+    for index, (title, rows) in enumerate(sections):
+        if index:
+            print("")
+        _print_comparisons(title, rows, args.confidence)
+
+    print("")
+    print(
+        f"{num_regressions} regression(s) out of {len(common)} comparison(s) "
+        f"(threshold: {args.threshold:.1%})"
+    )
+    if num_regressions:
+        sys.exit(1)
+
+
+def _add_grid_arguments(subparser):
+    subparser.add_argument(
+        "--functions",
+        nargs="+",
+        metavar="PATTERN",
+        help=(
+            "Glob patterns for the functions to time, e.g. "
+            "'bakeoff_opt.*' (default: all)."
+        ),
+    )
+    subparser.add_argument(
+        "--num-nodes", nargs="+", type=int, default=DEFAULT_NUM_NODES
+    )
+    subparser.add_argument(
+        "--num-values", nargs="+", type=int, default=DEFAULT_NUM_VALUES
+    )
+    subparser.add_argument(
+        "--seeds", nargs="+", type=int, default=(DEFAULT_SEED,)
+    )
+    subparser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    subparser.add_argument(
+        "--samples-per-repeat",
+        type=int,
+        default=DEFAULT_SAMPLES_PER_REPEAT,
+        help="Number of timed batches each repeat is split into.",
+    )
+    subparser.add_argument(
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        help="Number of untimed calls before timing each input.",
+    )
+    subparser.add_argument(
+        "--output",
+        help="Append JSON lines to this file (default: stdout).",
+    )
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Time functions over a grid of inputs."
+    )
+    _add_grid_arguments(run_parser)
+    run_parser.add_argument("--dimensions", nargs="+", type=int, default=(2,))
+    run_parser.add_argument(
+        "--cpus",
+        nargs="+",
+        type=int,
+        help="Pin the benchmark to these CPUs (Linux only).",
+    )
+    run_parser.add_argument(
+        "--store",
+        action="store_true",
+        help="Also append results to the results store.",
+    )
+    run_parser.set_defaults(handler=run)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help=(
+            "Time (d = 2) points in parallel, one pinned worker per "
+            "physical core, skipping points already in the results store."
+        ),
+    )
+    _add_grid_arguments(sweep_parser)
+    sweep_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: one per physical core).",
+    )
+    sweep_parser.set_defaults(handler=sweep)
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help=(
+            "Compare two JSON lines result files and exit non-zero if the "
+            "candidate has any regression."
+        ),
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown that counts as a regression.",
+    )
+    compare_parser.add_argument(
+        "--confidence", type=float, default=DEFAULT_CONFIDENCE
+    )
+    compare_parser.add_argument(
+        "--num-resamples", type=int, default=DEFAULT_NUM_RESAMPLES
+    )
+    compare_parser.add_argument(
+        "--bootstrap-seed", type=int, default=DEFAULT_BOOTSTRAP_SEED
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    return parser
+
+
+def main():
+    parser = get_parser()
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
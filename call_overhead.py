@@ -0,0 +1,68 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the per-call overhead of the wrappers with and without ``out=``.
+
+For tiny inputs (``N = 4``, ``k = 9``) the Fortran work is negligible, so
+the time per call is almost entirely spent in the wrapper.
+
+This only compares allocating against ``out=`` in the current build. The
+older wrappers (which called ``np.shape()`` and always allocated) no
+longer exist, so comparing against them means building an older checkout
+and timing its (allocating) wrappers in the same way.
+"""
+
+import timeit
+
+import numpy as np
+
+import nb_helpers
+
+
+NUM_NODES = 4
+NUM_VALUES = 9
+SEED = 2753024933
+REPEAT = 7
+
+
+def per_call(fn, *args, **kwargs):
+    timer = timeit.Timer(lambda: fn(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def main():
+    nodes, s_vals = nb_helpers.generate_nodes(NUM_NODES, NUM_VALUES, SEED)
+    dimension, _ = nodes.shape
+    out = np.empty((dimension, NUM_VALUES), order="F")
+
+    functions = nb_helpers.BAKEOFF_FUNCTIONS + nb_helpers.BAKEOFF_OPT_FUNCTIONS
+    names = [nb_helpers.fn_name(fn) for fn in functions]
+    max_width = max(len(name) for name in names)
+
+    print(
+        f"Number of Nodes: {NUM_NODES}, "
+        f"Number of Input Values: {NUM_VALUES}"
+    )
+    print(f"{'':{max_width}}  allocate    out=      saved")
+    for name, fn in zip(names, functions):
+        allocate = per_call(fn, nodes, s_vals)
+        in_place = per_call(fn, nodes, s_vals, out=out)
+        saved = allocate - in_place
+        print(
+            f"{name:{max_width}}  {1e9 * allocate:7.1f}ns "
+            f"{1e9 * in_place:7.1f}ns {1e9 * saved:7.1f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
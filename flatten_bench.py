@@ -0,0 +1,91 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare adaptive flattening against uniform sampling.
+
+For each curve (from :func:`nb_helpers.generate_nodes`, so coordinates are
+in ``[0, 1000)``, roughly pixels) and tolerance, uniform sampling uses the
+fewest evenly spaced values for which **every** piece passes the same
+:func:`bakeoff_opt.flatness_bound` test that :func:`bakeoff_opt.flatten`
+uses, so both polylines come with the same guarantee.
+"""
+
+import timeit
+
+import bakeoff_opt
+import numpy as np
+
+import nb_helpers
+
+
+NUM_NODES = (4, 8, 16)
+TOLERANCES = (1.0, 0.1, 0.01)
+SEED = 1109857041
+REPEAT = 7
+
+
+def per_call(fn, *args, **kwargs):
+    timer = timeit.Timer(lambda: fn(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def is_flat(nodes, num_pieces, tolerance):
+    s_vals = np.linspace(0.0, 1.0, num_pieces + 1)
+    pieces = bakeoff_opt.subdivide_many(nodes, s_vals[1:-1])
+    return np.all(bakeoff_opt.flatness_bound(pieces) <= tolerance)
+
+
+def uniform_pieces(nodes, tolerance):
+    """Find the fewest uniform pieces that are all within ``tolerance``.
+
+    Doubles until the pieces are flat enough and then bisects (assuming
+    that more pieces are never less flat).
+    """
+    high = 1
+    while not is_flat(nodes, high, tolerance):
+        high *= 2
+    low = high // 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if is_flat(nodes, middle, tolerance):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def main():
+    print(
+        "N + 1  tolerance  adaptive   uniform   saved    flatten     "
+        "uniform"
+    )
+    for num_nodes in NUM_NODES:
+        nodes, _ = nb_helpers.generate_nodes(num_nodes, 2, SEED)
+        for tolerance in TOLERANCES:
+            _, s_vals = bakeoff_opt.flatten(nodes, tolerance)
+            (adaptive,) = s_vals.shape
+            uniform = uniform_pieces(nodes, tolerance) + 1
+            uniform_s_vals = np.linspace(0.0, 1.0, uniform)
+            saved = 1.0 - adaptive / uniform
+
+            flatten_time = per_call(bakeoff_opt.flatten, nodes, tolerance)
+            uniform_time = per_call(bakeoff_opt.serial, nodes, uniform_s_vals)
+            print(
+                f"{num_nodes:5d}  {tolerance:9.2g}  {adaptive:8d}  "
+                f"{uniform:8d}  {100 * saved:5.1f}%  "
+                f"{1e6 * flatten_time:8.1f}us  {1e6 * uniform_time:8.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,17 +10,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import pathlib
-import pickle
-
 import bakeoff
+import bakeoff_numpy
 import bakeoff_opt
 import matplotlib.pyplot as plt
 import numpy as np
 
+import results_store
+
 
-HERE = pathlib.Path(__file__).resolve().parent
-STORED_RESULTS = HERE / "timeit_results.pkl"
 BAKEOFF_FUNCTIONS = (
     bakeoff.forall1,
     bakeoff.forall2,
@@ -31,10 +29,15 @@ BAKEOFF_FUNCTIONS = (
     bakeoff.spread1,
     bakeoff.spread2,
     bakeoff.spread3,
+    bakeoff.tiled,
     bakeoff.serial,
+    bakeoff.simd,
+    bakeoff.specialized,
     bakeoff.vs_algorithm32,
     bakeoff.vs_algorithm53,
     bakeoff.vs_algorithm64,
+    bakeoff.vs_algorithm_stable,
+    bakeoff.compensated,
 )
 BAKEOFF_OPT_FUNCTIONS = (
     bakeoff_opt.forall1,
@@ -46,20 +49,57 @@ BAKEOFF_OPT_FUNCTIONS = (
     bakeoff_opt.spread1,
     bakeoff_opt.spread2,
     bakeoff_opt.spread3,
+    bakeoff_opt.tiled,
     bakeoff_opt.serial,
+    bakeoff_opt.simd,
+    bakeoff_opt.specialized,
     bakeoff_opt.vs_algorithm32,
     bakeoff_opt.vs_algorithm53,
     bakeoff_opt.vs_algorithm64,
+    bakeoff_opt.vs_algorithm_stable,
+    bakeoff_opt.compensated,
+)
+BAKEOFF_NUMPY_FUNCTIONS = (
+    bakeoff_numpy.forall1,
+    bakeoff_numpy.forall2,
+    bakeoff_numpy.forall3,
+    bakeoff_numpy.do1,
+    bakeoff_numpy.do2,
+    bakeoff_numpy.do3,
+    bakeoff_numpy.spread1,
+    bakeoff_numpy.spread2,
+    bakeoff_numpy.spread3,
+    bakeoff_numpy.serial,
+    bakeoff_numpy.vs_algorithm32,
+    bakeoff_numpy.vs_algorithm53,
+    bakeoff_numpy.vs_algorithm64,
+    bakeoff_numpy.vs_algorithm_stable,
+)
+ALL_FUNCTIONS = (
+    BAKEOFF_FUNCTIONS + BAKEOFF_OPT_FUNCTIONS + BAKEOFF_NUMPY_FUNCTIONS
 )
+# NOTE: Surfaces are timed in ``d = 3`` (rather than the ``d = 2`` used for
+#       curves), so their results are stored under this dimension.
+SURFACE_DIMENSION = 3
 
 
 def fn_name(fn):
-    return f"{fn.__module__.replace('._binary', '')}.{fn.__qualname__}"
+    package, _, _ = fn.__module__.partition(".")
+    return f"{package}.{fn.__qualname__}"
+
+
+def get_function(name):
+    """Look up a function by its :func:`fn_name`."""
+    for fn in ALL_FUNCTIONS + SURFACE_FUNCTIONS:
+        if fn_name(fn) == name:
+            return fn
+
+    raise KeyError(name)
 
 
 def verify_implementations(nodes, s_vals, substring_match=None):
     points = bakeoff.serial(nodes, s_vals)
-    functions = BAKEOFF_FUNCTIONS + BAKEOFF_OPT_FUNCTIONS
+    functions = ALL_FUNCTIONS
 
     equals = {}
     for fn in functions:
@@ -83,18 +123,104 @@ def verify_implementations(nodes, s_vals, substring_match=None):
     }
 
 
-def generate_nodes(num_nodes, num_values, seed):
+def ulp_error(points, reference):
+    """Compute the largest error in units in the last place (ULPs).
+
+    The spacing is measured at each value of ``reference``, so an error of
+    ``0.5`` means ``points`` is correctly rounded.
+    """
+    error = np.abs(points - reference)
+    return np.max(error / np.spacing(np.abs(reference)))
+
+
+def generate_nodes(num_nodes, num_values, seed, dimension=2):
     # TODO: Cache outputs?
+    # NOTE: The coordinates are drawn in order, so the first two rows are
+    #       the same for any ``dimension``.
     random_state = np.random.RandomState(seed=seed)
-    x = sorted(random_state.randint(1000, size=num_nodes))
-    y = sorted(random_state.randint(1000, size=num_nodes))
-    nodes = np.asfortranarray([x, y], dtype=np.float64)
+    coordinates = [
+        sorted(random_state.randint(1000, size=num_nodes))
+        for _ in range(dimension)
+    ]
+    nodes = np.asfortranarray(coordinates, dtype=np.float64)
 
     s_vals = np.linspace(0.0, 1.0, num_values)
 
     return nodes, s_vals
 
 
+def generate_surface_nodes(
+    num_nodes, num_values, seed, dimension=SURFACE_DIMENSION
+):
+    """Generate a random tensor-product surface and a ``(u, v)`` grid.
+
+    The surface has ``num_nodes`` nodes in each direction (so the nodes
+    have shape ``(d, num_nodes, num_nodes)``) and the grid has
+    ``num_values`` values in each direction.
+    """
+    random_state = np.random.RandomState(seed=seed)
+    nodes = random_state.randint(
+        1000, size=(dimension, num_nodes, num_nodes)
+    ).astype(np.float64, order="F")
+
+    u_vals = np.linspace(0.0, 1.0, num_values)
+    v_vals = np.linspace(0.0, 1.0, num_values)
+
+    return nodes, u_vals, v_vals
+
+
+def _surface_functions(package):
+    """Build the surface layouts to compare for a single package.
+
+    The functions are reported as members of ``package`` (e.g.
+    ``bakeoff_opt.surface_grid_serial``), so :func:`fn_name` tells the two
+    builds apart and the results store records the right build flags.
+    """
+
+    def surface_grid_serial(nodes, u_vals, v_vals):
+        return package.surface_grid(nodes, u_vals, v_vals, kernel="serial")
+
+    def surface_grid_simd(nodes, u_vals, v_vals):
+        return package.surface_grid(nodes, u_vals, v_vals, kernel="simd")
+
+    def surface_grid_vs_algorithm_stable(nodes, u_vals, v_vals):
+        return package.surface_grid(
+            nodes, u_vals, v_vals, kernel="vs_algorithm_stable"
+        )
+
+    def surface_points_grid(nodes, u_vals, v_vals):
+        """Evaluate on a grid by flattening it into scattered ``(u, v)``.
+
+        This does the full 2D reduction for every grid point, i.e. what
+        ``surface_grid`` avoids.
+        """
+        dimension, _, _ = nodes.shape
+        (num_u,) = u_vals.shape
+        (num_v,) = v_vals.shape
+        u_grid, v_grid = np.meshgrid(u_vals, v_vals, indexing="ij")
+        evaluated = package.surface_points(
+            nodes, u_grid.ravel(order="F"), v_grid.ravel(order="F")
+        )
+        return evaluated.reshape((dimension, num_u, num_v), order="F")
+
+    functions = (
+        surface_grid_serial,
+        surface_grid_simd,
+        surface_grid_vs_algorithm_stable,
+        surface_points_grid,
+    )
+    for fn in functions:
+        fn.__module__ = package.__name__
+        fn.__qualname__ = fn.__name__
+
+    return functions
+
+
+BAKEOFF_SURFACE_FUNCTIONS = _surface_functions(bakeoff)
+BAKEOFF_OPT_SURFACE_FUNCTIONS = _surface_functions(bakeoff_opt)
+SURFACE_FUNCTIONS = BAKEOFF_SURFACE_FUNCTIONS + BAKEOFF_OPT_SURFACE_FUNCTIONS
+
+
 def _compare_pair(name_timeit_result):
     _, timeit_result = name_timeit_result
     # Sort by average, break (very unlikely) ties with stdev.
@@ -109,20 +235,19 @@ def sort_results(timeit_results):
     return sorted(timeit_results, key=_compare_pair)
 
 
-def get_timeit_results():
-    # Load previous results from disk.
-    # NOTE: This is a bad idea if these benchmarks are being
-    #       run on multiple machines.
-    if not STORED_RESULTS.is_file():
-        return {}
-
-    with open(STORED_RESULTS, "rb") as file_obj:
-        return pickle.load(file_obj)
+def get_timeit_results(host=None):
+    # NOTE: Results are tagged with a host fingerprint, so by default only
+    #       results from this machine are reused. Pass ``host`` (e.g.
+    #       ``"legacy"`` for an imported ``timeit_results.pkl``) to read
+    #       another machine's results. Such a store is read-only, so every
+    #       input timed with it must already be in it.
+    return results_store.ResultStore(host=host)
 
 
 def store_timeit_results(results_cache):
-    with open(STORED_RESULTS, "wb") as file_obj:
-        pickle.dump(results_cache, file_obj)
+    # NOTE: Each result is committed as soon as it is added, so there is
+    #       nothing left to write.
+    results_cache.close()
 
 
 def timeit(get_ipython, fn, *args, **kwargs):
@@ -144,11 +269,20 @@ def timeit(get_ipython, fn, *args, **kwargs):
     return timeit_result
 
 
-def time_function(get_ipython, results_cache, fn, num_nodes, num_values, seed):
-    key = (fn_name(fn), num_nodes, num_values, seed)
+def time_function(
+    get_ipython,
+    results_cache,
+    fn,
+    num_nodes,
+    num_values,
+    seed,
+    generate=generate_nodes,
+    dimension=results_store.DEFAULT_DIMENSION,
+):
+    key = (fn_name(fn), num_nodes, num_values, seed, dimension)
     if key not in results_cache:
-        nodes, s_vals = generate_nodes(num_nodes, num_values, seed)
-        results_cache[key] = timeit(get_ipython, fn, nodes, s_vals)
+        inputs = generate(num_nodes, num_values, seed, dimension=dimension)
+        results_cache[key] = timeit(get_ipython, fn, *inputs)
 
     return results_cache[key]
 
@@ -159,7 +293,14 @@ def new_axis():
 
 
 def plot_data_nodes(
-    get_ipython, results_cache, functions, num_nodes_list, num_values, seed
+    get_ipython,
+    results_cache,
+    functions,
+    num_nodes_list,
+    num_values,
+    seed,
+    generate=generate_nodes,
+    dimension=results_store.DEFAULT_DIMENSION,
 ):
     ax = new_axis()
 
@@ -170,7 +311,14 @@ def plot_data_nodes(
         y_above = []
         for num_nodes in num_nodes_list:
             timeit_result = time_function(
-                get_ipython, results_cache, fn, num_nodes, num_values, seed
+                get_ipython,
+                results_cache,
+                fn,
+                num_nodes,
+                num_values,
+                seed,
+                generate=generate,
+                dimension=dimension,
             )
             # 2 std deviations ~= 95%
             below = timeit_result.average - 2.0 * timeit_result.stdev
@@ -243,6 +391,46 @@ def compare_bakeoff_times(
         seed,
     )
 
+    print("")
+
+    print("NumPy Implementations")
+    print("---------------------")
+    _compare_times(
+        get_ipython,
+        results_cache,
+        BAKEOFF_NUMPY_FUNCTIONS,
+        num_nodes,
+        num_values,
+        seed,
+    )
+
+
+def compare_accuracy(get_ipython, results_cache, num_nodes, num_values, seed):
+    """Report throughput and accuracy for every implementation.
+
+    The reference is ``bakeoff.compensated``, which is accurate to roughly
+    twice the working precision (and is built without ``-ffast-math`` even
+    in ``bakeoff_opt``), so the ULP error for each implementation is
+    essentially its error against the exact result.
+    """
+    nodes, s_vals = generate_nodes(num_nodes, num_values, seed)
+    reference = bakeoff.compensated(nodes, s_vals)
+
+    rows = []
+    for fn in ALL_FUNCTIONS:
+        timeit_result = time_function(
+            get_ipython, results_cache, fn, num_nodes, num_values, seed
+        )
+        ulps = ulp_error(fn(nodes, s_vals), reference)
+        rows.append((fn_name(fn), timeit_result.average, ulps))
+
+    rows.sort(key=lambda row: row[1])
+    max_width = max(len(name) for name, _, _ in rows)
+    print(f"{'':{max_width}}  {'values / s':>12}  {'max ULPs':>10}")
+    for name, average, ulps in rows:
+        throughput = num_values / average
+        print(f"{name:{max_width}}  {throughput:12.4e}  {ulps:10.3g}")
+
 
 def plot_data_values(
     get_ipython, results_cache, functions, num_nodes, num_values_list, seed
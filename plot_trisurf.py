@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
 import collections
 
 import matplotlib
@@ -41,25 +42,38 @@ def plot_3d(log_N_vals, log_k_vals, log_timeit_vals, fn_name):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Plot runtime surfaces.")
+    parser.add_argument(
+        "--host",
+        help=(
+            "Host fingerprint to plot results for (default: this machine; "
+            "use `legacy` for an imported `timeit_results.pkl`)."
+        ),
+    )
+    args = parser.parse_args()
+
     matplotlib.rc("mathtext", fontset="cm", rm="serif")
 
-    results_cache = nb_helpers.get_timeit_results()
+    results_cache = nb_helpers.get_timeit_results(host=args.host)
     log_N_vals = collections.defaultdict(list)
     log_k_vals = collections.defaultdict(list)
     log_timeit_vals = collections.defaultdict(list)
 
-    for key, timeit_result in results_cache.items():
-        fn_name, num_nodes, num_values, _ = key
-        log_N_vals[fn_name].append(np.log2(num_nodes))
-        log_k_vals[fn_name].append(np.log2(num_values))
-        log_timeit_vals[fn_name].append(np.log2(timeit_result.average))
-
     selected_functions = (
         "bakeoff_opt.forall1",
         "bakeoff_opt.serial",
         "bakeoff_opt.spread1",
         "bakeoff_opt.vs_algorithm64",
     )
+    for fn_name in selected_functions:
+        # NOTE: Only the rows for ``fn_name`` are read from the store.
+        for key, timeit_result in results_cache.query(function=fn_name):
+            _, num_nodes, num_values, _ = key
+            log_N_vals[fn_name].append(np.log2(num_nodes))
+            log_k_vals[fn_name].append(np.log2(num_values))
+            log_timeit_vals[fn_name].append(np.log2(timeit_result.average))
+
+    nb_helpers.store_timeit_results(results_cache)
     for fn_name in selected_functions:
         plot_3d(log_N_vals, log_k_vals, log_timeit_vals, fn_name)
 
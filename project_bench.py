@@ -0,0 +1,93 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the throughput (queries / second) of closest point queries.
+
+Compares :func:`bakeoff_opt.project` (on one thread and on every CPU)
+against the brute force approach it replaces: evaluating ``serial`` on a
+dense grid and searching it with NumPy. The brute force search is slow,
+so it is only run on the first ``NUM_BRUTE_FORCE`` queries, which are also
+used to report the largest distance error of ``project`` relative to the
+brute force answer (negative when ``project`` finds a closer point than
+the grid).
+"""
+
+import os
+import time
+
+import bakeoff_opt
+import numpy as np
+
+import nb_helpers
+
+
+NUM_NODES = (4, 8, 16)
+NUM_QUERIES = 2 ** 18
+NUM_DENSE = 4097
+NUM_BRUTE_FORCE = 8192
+# NOTE: Chunks keep the brute force ``(NUM_DENSE, chunk)`` array of squared
+#       distances small.
+DENSE_CHUNK_SIZE = 256
+SEED = 3871260047
+
+
+def brute_force(nodes, points):
+    dense = bakeoff_opt.serial(nodes, np.linspace(0.0, 1.0, NUM_DENSE))
+    _, num_points = points.shape
+    distances = np.empty(num_points)
+    for start in range(0, num_points, DENSE_CHUNK_SIZE):
+        chunk = points[:, start : start + DENSE_CHUNK_SIZE]
+        differences = dense[:, :, np.newaxis] - chunk[:, np.newaxis, :]
+        squared = np.sum(differences * differences, axis=0)
+        distances[start : start + DENSE_CHUNK_SIZE] = np.sqrt(
+            np.min(squared, axis=0)
+        )
+    return distances
+
+
+def throughput(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    duration = time.perf_counter() - start
+    return result, duration
+
+
+def main():
+    num_threads = os.cpu_count()
+    random_state = np.random.RandomState(seed=SEED)
+    print(f"Number of Queries: {NUM_QUERIES}, Number of CPUs: {num_threads}")
+    print("N + 1  project (1 thread)  project (all)  brute force  max error")
+    for num_nodes in NUM_NODES:
+        nodes, _ = nb_helpers.generate_nodes(num_nodes, 2, SEED)
+        points = random_state.uniform(0.0, 1000.0, size=(2, NUM_QUERIES))
+        points = np.asfortranarray(points)
+
+        _, single = throughput(
+            bakeoff_opt.project, nodes, points, num_threads=1
+        )
+        (_, closest), parallel = throughput(
+            bakeoff_opt.project, nodes, points
+        )
+        distances = np.sqrt(np.sum((closest - points) ** 2, axis=0))
+        expected, dense = throughput(
+            brute_force, nodes, points[:, :NUM_BRUTE_FORCE]
+        )
+        max_error = np.max(distances[:NUM_BRUTE_FORCE] - expected)
+        print(
+            f"{num_nodes:5d}  {NUM_QUERIES / single:15.3g}/s  "
+            f"{NUM_QUERIES / parallel:11.3g}/s  "
+            f"{NUM_BRUTE_FORCE / dense:9.3g}/s  {max_error:9.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Append-only SQLite store for benchmark results.
+
+Every timing is stored as a new row, tagged with a fingerprint of the host
+that produced it, the flags / compiler used to build the Fortran kernel
+(via ``bakeoff(_opt).compiler_options(kernel)`` and
+``compiler_version()``), a timestamp and the raw per-loop timings. Rows
+are committed as they are written, so a sweep that is interrupted keeps
+everything timed so far.
+
+Lookups return the most recent row for a given key, so re-timing a
+function never needs to delete anything.
+"""
+
+import argparse
+import datetime
+import functools
+import hashlib
+import importlib
+import json
+import os
+import pathlib
+import pickle
+import platform
+import sqlite3
+import statistics
+import tempfile
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+DEFAULT_PATH = HERE / "timeit_results.sqlite3"
+LEGACY_PICKLE = HERE / "timeit_results.pkl"
+LEGACY_HOST = "legacy"
+# NOTE: The curve notebooks (and ``timeit_results.pkl``) only use ``d = 2``.
+DEFAULT_DIMENSION = 2
+SCHEMA = """\
+CREATE TABLE IF NOT EXISTS hosts (
+    fingerprint TEXT PRIMARY KEY,
+    hostname TEXT,
+    machine TEXT,
+    processor TEXT,
+    cpu_count INTEGER,
+    platform TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    function TEXT NOT NULL,
+    num_nodes INTEGER NOT NULL,
+    num_values INTEGER NOT NULL,
+    dimension INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    host TEXT NOT NULL REFERENCES hosts (fingerprint),
+    fcflags TEXT,
+    compiler TEXT,
+    created TEXT NOT NULL,
+    loops INTEGER NOT NULL,
+    repeat INTEGER NOT NULL,
+    timings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_key ON results (
+    host, function, num_nodes, num_values, dimension, seed
+);
+"""
+LATEST_QUERY = """\
+SELECT function, num_nodes, num_values, seed, loops, repeat, timings
+FROM results
+WHERE id IN (
+    SELECT MAX(id) FROM results
+    WHERE {where}
+    GROUP BY function, num_nodes, num_values, dimension, seed
+)
+ORDER BY function, num_nodes, num_values, seed
+"""
+TIME_UNITS = (
+    (1.0, "s"),
+    (1e-3, "ms"),
+    (1e-6, "\N{MICRO SIGN}s"),
+    (1e-9, "ns"),
+)
+
+
+def _processor():
+    """Get the CPU model name (falls back to :func:`platform.processor`)."""
+    cpuinfo = pathlib.Path("/proc/cpuinfo")
+    if cpuinfo.is_file():
+        for line in cpuinfo.read_text().splitlines():
+            if line.startswith("model name"):
+                _, _, model_name = line.partition(":")
+                return model_name.strip()
+
+    return platform.processor()
+
+
+@functools.lru_cache(maxsize=1)
+def host_info():
+    """Describe the current host.
+
+    Returns:
+        Dict[str, Any]: The host description, including a ``fingerprint``
+        that is stable across runs on the same machine.
+    """
+    info = {
+        "hostname": platform.node(),
+        "machine": platform.machine(),
+        "processor": _processor(),
+        "cpu_count": os.cpu_count(),
+        "platform": platform.platform(),
+    }
+    # NOTE: ``platform`` includes the kernel version, which changes with
+    #       updates, so it is left out of the fingerprint.
+    identity = [info[key] for key in ("hostname", "machine", "processor")]
+    identity.append(info["cpu_count"])
+    digest = hashlib.sha256(json.dumps(identity).encode("utf-8"))
+    info["fingerprint"] = digest.hexdigest()[:16]
+    return info
+
+
+@functools.lru_cache(maxsize=None)
+def build_info(function):
+    """Get the compiler flags / version used to build a function.
+
+    Args:
+        function (str): The function, e.g. ``bakeoff_opt.simd``. The flags
+            are those of the object file the kernel lives in (some are
+            compiled with extra flags, see ``compiler_options()``).
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The compiler options and
+        version (both :data:`None` for packages without Fortran code, e.g.
+        ``bakeoff_numpy``).
+    """
+    package_name, _, kernel = function.partition(".")
+    package = importlib.import_module(package_name)
+    if not hasattr(package, "compiler_options"):
+        return None, None
+
+    return package.compiler_options(kernel), package.compiler_version()
+
+
+def _split_key(key):
+    """Split a results key into its columns.
+
+    Keys are either ``(fn_name, num_nodes, num_values, seed)`` (for
+    ``d = 2``, as in ``timeit_results.pkl``) or
+    ``(fn_name, num_nodes, num_values, seed, dimension)``.
+
+    Returns:
+        Tuple[str, int, int, int, int]: The ``function``, ``num_nodes``,
+        ``num_values``, ``dimension`` and ``seed``.
+    """
+    if len(key) == 4:
+        function, num_nodes, num_values, seed = key
+        dimension = DEFAULT_DIMENSION
+    else:
+        function, num_nodes, num_values, seed, dimension = key
+
+    return function, num_nodes, num_values, dimension, seed
+
+
+def _format_time(seconds):
+    for scale, unit in TIME_UNITS:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+
+    scale, unit = TIME_UNITS[-1]
+    return f"{seconds / scale:.3g} {unit}"
+
+
+class StoredResult:
+    """A single stored timing.
+
+    Has the same ``loops``, ``repeat``, ``timings``, ``best``, ``worst``,
+    ``average`` and ``stdev`` attributes as IPython's ``TimeitResult``, so
+    it can be used anywhere the notebooks used one.
+
+    Args:
+        loops (int): The number of loops per repeat.
+        repeat (int): The number of repeats.
+        timings (List[float]): The time per loop (in seconds) for each
+            repeat.
+    """
+
+    def __init__(self, loops, repeat, timings):
+        self.loops = loops
+        self.repeat = repeat
+        self.timings = timings
+
+    @property
+    def best(self):
+        return min(self.timings)
+
+    @property
+    def worst(self):
+        return max(self.timings)
+
+    @property
+    def average(self):
+        return statistics.mean(self.timings)
+
+    @property
+    def stdev(self):
+        return statistics.pstdev(self.timings)
+
+    def __str__(self):
+        return (
+            f"{_format_time(self.average)} \N{PLUS-MINUS SIGN} "
+            f"{_format_time(self.stdev)} per loop (mean \N{PLUS-MINUS SIGN} "
+            f"std. dev. of {self.repeat} runs, {self.loops:,} loops each)"
+        )
+
+    def __repr__(self):
+        return f"<StoredResult : {self}>"
+
+
+class ResultStore:
+    """Benchmark results for a single host.
+
+    Acts like the ``dict`` that used to be pickled in
+    ``timeit_results.pkl``, i.e. it maps
+    ``(fn_name, num_nodes, num_values, seed)`` to a timing (for
+    ``d = 2``). A fifth entry in the key gives the dimension for any
+    other ``d`` (e.g. the ``d = 3`` surfaces in ``surface-layouts.ipynb``).
+    Unlike the ``dict``, each assignment is written (and committed)
+    immediately and only rows from ``host`` are visible.
+
+    New timings are always from the current host, so a store opened for
+    another ``host`` is read-only.
+
+    Args:
+        path (Optional[pathlib.Path]): The SQLite database.
+        host (Optional[str]): The host fingerprint to read results for.
+            Defaults to the current host.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, host=None):
+        self.path = pathlib.Path(path)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(SCHEMA)
+        info = host_info()
+        self._add_host(info)
+        self.host = info["fingerprint"] if host is None else host
+        self.read_only = self.host != info["fingerprint"]
+
+    def _add_host(self, info):
+        self.connection.execute(
+            "INSERT OR IGNORE INTO hosts VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                info["fingerprint"],
+                info.get("hostname"),
+                info.get("machine"),
+                info.get("processor"),
+                info.get("cpu_count"),
+                info.get("platform"),
+            ),
+        )
+        self.connection.commit()
+
+    def add(
+        self,
+        function,
+        num_nodes,
+        num_values,
+        dimension,
+        seed,
+        loops,
+        repeat,
+        timings,
+    ):
+        """Append a single timing for the current host (and commit it).
+
+        The build flags and compiler version are looked up for ``function``
+        (e.g. ``bakeoff_opt.serial``) with :func:`build_info`.
+
+        Raises:
+            ValueError: If the store is read-only (i.e. was opened for
+                another host's results).
+        """
+        if self.read_only:
+            raise ValueError(
+                "Results store is read-only, it was opened for another host",
+                self.host,
+            )
+
+        host = host_info()["fingerprint"]
+        fcflags, compiler = build_info(function)
+        created = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+        self.connection.execute(
+            "INSERT INTO results (function, num_nodes, num_values, "
+            "dimension, seed, host, fcflags, compiler, created, loops, "
+            "repeat, timings) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                function,
+                num_nodes,
+                num_values,
+                dimension,
+                seed,
+                host,
+                fcflags,
+                compiler,
+                created,
+                loops,
+                repeat,
+                json.dumps(list(timings)),
+            ),
+        )
+        self.connection.commit()
+
+    def add_record(self, record):
+        """Append a record produced by ``bench.py run``."""
+        self.add(
+            record["function"],
+            record["num_nodes"],
+            record["num_values"],
+            record["dimension"],
+            record["seed"],
+            record["loops"],
+            record["repeat"],
+            record["timings"],
+        )
+
+    def query(
+        self,
+        function=None,
+        num_nodes=None,
+        num_values=None,
+        dimension=DEFAULT_DIMENSION,
+    ):
+        """Get the most recent timings matching the given filters.
+
+        Any filter left as :data:`None` matches everything.
+
+        Yields:
+            Tuple[Tuple[str, int, int, int], StoredResult]: The key
+            ``(fn_name, num_nodes, num_values, seed)`` and the timing.
+        """
+        clauses = ["host = ?", "dimension = ?"]
+        params = [self.host, dimension]
+        filters = (
+            ("function", function),
+            ("num_nodes", num_nodes),
+            ("num_values", num_values),
+        )
+        for column, value in filters:
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        sql = LATEST_QUERY.format(where=" AND ".join(clauses))
+        for row in self.connection.execute(sql, params):
+            function, num_nodes, num_values, seed, loops, repeat, timings = row
+            key = (function, num_nodes, num_values, seed)
+            yield key, StoredResult(loops, repeat, json.loads(timings))
+
+    def _latest(self, key, host=None):
+        if host is None:
+            host = self.host
+        function, num_nodes, num_values, dimension, seed = _split_key(key)
+        row = self.connection.execute(
+            "SELECT loops, repeat, timings FROM results WHERE host = ? AND "
+            "function = ? AND num_nodes = ? AND num_values = ? AND "
+            "dimension = ? AND seed = ? ORDER BY id DESC LIMIT 1",
+            (host, function, num_nodes, num_values, dimension, seed),
+        ).fetchone()
+        if row is None:
+            return None
+
+        loops, repeat, timings = row
+        return StoredResult(loops, repeat, json.loads(timings))
+
+    def __contains__(self, key):
+        return self._latest(key) is not None
+
+    def __getitem__(self, key):
+        result = self._latest(key)
+        if result is None:
+            raise KeyError(key)
+        return result
+
+    def __setitem__(self, key, timeit_result):
+        function, num_nodes, num_values, dimension, seed = _split_key(key)
+        self.add(
+            function,
+            num_nodes,
+            num_values,
+            dimension,
+            seed,
+            timeit_result.loops,
+            timeit_result.repeat,
+            timeit_result.timings,
+        )
+
+    def items(self):
+        return self.query()
+
+    def close(self):
+        self.connection.close()
+
+    def import_pickle(self, path=LEGACY_PICKLE, host=LEGACY_HOST):
+        """Import the results from a legacy ``timeit_results.pkl``.
+
+        The pickle has no host information, so the results are stored under
+        ``host`` (``"legacy"`` by default; pass the current fingerprint if
+        the pickle is known to come from this machine). Keys that were
+        already imported for ``host`` are skipped.
+
+        Returns:
+            int: The number of results imported.
+        """
+        with open(path, "rb") as file_obj:
+            results_cache = pickle.load(file_obj)
+
+        if host == LEGACY_HOST:
+            self._add_host({"fingerprint": LEGACY_HOST})
+        modified = datetime.datetime.fromtimestamp(
+            os.path.getmtime(path), datetime.timezone.utc
+        )
+        created = modified.isoformat()
+        num_imported = 0
+        for key, timeit_result in results_cache.items():
+            if self._latest(key, host=host) is not None:
+                continue
+
+            function, num_nodes, num_values, seed = key
+            # NOTE: The build flags are unknown for legacy results, so this
+            #       bypasses ``add()`` (which would look up the current ones).
+            self.connection.execute(
+                "INSERT INTO results (function, num_nodes, num_values, "
+                "dimension, seed, host, created, loops, repeat, timings) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    function,
+                    num_nodes,
+                    num_values,
+                    DEFAULT_DIMENSION,
+                    seed,
+                    host,
+                    created,
+                    timeit_result.loops,
+                    timeit_result.repeat,
+                    json.dumps(list(timeit_result.timings)),
+                ),
+            )
+            num_imported += 1
+
+        self.connection.commit()
+        return num_imported
+
+
+def verify():
+    """Check a round trip through a scratch store (for each kind of host)."""
+    timeit_result = StoredResult(10, 3, [1.0, 2.0, 3.0])
+    # NOTE: ``results_store`` has no ``compiler_options()``, so the build
+    #       flags are simply left empty.
+    key = ("results_store.verify", 4, 9, 1234)
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "results.sqlite3"
+
+        store = ResultStore(path=path)
+        store[key] = timeit_result
+        assert key in store
+        assert store[key].timings == timeit_result.timings
+        surface_key = key + (3,)
+        assert surface_key not in store
+        store[surface_key] = timeit_result
+        assert surface_key in store
+        store.close()
+
+        store = ResultStore(path=path, host=LEGACY_HOST)
+        assert store.read_only
+        assert key not in store
+        try:
+            store[key] = timeit_result
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Wrote to a store for another host")
+        assert key not in store
+        store.close()
+
+    print("Verified: results_store")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser(
+        "import-pickle", help="Import a legacy `timeit_results.pkl`."
+    )
+    import_parser.add_argument("pickle", nargs="?", default=LEGACY_PICKLE)
+    import_parser.add_argument(
+        "--host",
+        default=LEGACY_HOST,
+        help="Host fingerprint to store the results under.",
+    )
+    subparsers.add_parser("host", help="Print the current host fingerprint.")
+    subparsers.add_parser(
+        "verify", help="Verify the store against a scratch database."
+    )
+    args = parser.parse_args()
+
+    if args.command == "host":
+        print(json.dumps(host_info(), indent=2))
+        return
+    if args.command == "verify":
+        verify()
+        return
+
+    store = ResultStore()
+    num_imported = store.import_pickle(args.pickle, host=args.host)
+    store.close()
+    print(f"Imported {num_imported} result(s) into {DEFAULT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
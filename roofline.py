@@ -0,0 +1,351 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collect hardware counters per kernel call and place kernels on a roofline.
+
+For each kernel and input this records (as a line of JSON):
+
+* the wall-clock time per call (via ``timeit``)
+* the FLOPs per call, counted analytically from ``(N + 1, k, d)``
+* cycles, instructions and cache misses per call, from ``perf stat``
+* the bytes moved per call, estimated as last level cache misses times the
+  cache line size
+
+and from those the achieved GFLOP/s and arithmetic intensity (FLOPs / byte).
+
+``perf stat`` can only count a whole process, so each kernel is run in a
+child process twice: once calling the kernel ``loops`` times and once not
+calling it at all. The difference (divided by ``loops``) removes the cost
+of starting Python and importing the packages. If ``perf`` is unavailable
+(or not permitted, see ``/proc/sys/kernel/perf_event_paranoid``) the
+counter fields are ``null`` and only timings / FLOPs are reported.
+
+The roofline itself is measured: memory bandwidth via a large array copy
+and peak compute via a BLAS matrix multiply.
+"""
+
+import argparse
+import itertools
+import json
+import shutil
+import subprocess
+import sys
+import timeit
+
+import numpy as np
+
+import nb_helpers
+
+
+DEFAULT_FUNCTIONS = (
+    "bakeoff_opt.forall1",
+    "bakeoff_opt.forall2",
+    "bakeoff_opt.forall3",
+    "bakeoff_opt.spread1",
+    "bakeoff_opt.spread2",
+    "bakeoff_opt.spread3",
+    "bakeoff_opt.serial",
+    "bakeoff_opt.simd",
+    "bakeoff_opt.tiled",
+    "bakeoff_opt.vs_algorithm64",
+)
+DEFAULT_NUM_NODES = (4, 16, 64)
+DEFAULT_NUM_VALUES = (33, 513, 8193)
+SEED = 798031893
+# NOTE: ``LLC-load-misses`` isn't supported everywhere (e.g. in many VMs),
+#       in which case ``cache-misses`` (usually also the last level cache)
+#       is used to estimate the bytes moved.
+PERF_EVENTS = ("cycles", "instructions", "cache-misses", "LLC-load-misses")
+CACHE_LINE_BYTES = 64
+BANDWIDTH_BYTES = 256 * 1024 * 1024
+PEAK_MATRIX_SIZE = 2048
+
+
+def flop_count(name, num_nodes, num_values, dimension):
+    """Count the floating point operations for one kernel call.
+
+    Args:
+        name (str): The kernel name (without the package), e.g. ``forall1``.
+        num_nodes (int): The number of nodes ``N + 1``.
+        num_values (int): The number of parameter values ``k``.
+        dimension (int): The dimension ``d``.
+
+    Returns:
+        int: The number of FLOPs (additions and multiplications).
+    """
+    degree = num_nodes - 1
+    if name.startswith("vs_algorithm_stable"):
+        # Each of the ``N`` steps updates ``one_less_pow`` and
+        # ``s * binom_ratio`` (one division) and then does two
+        # multiplications and one addition per coordinate.
+        per_value = degree * (3 * dimension + 3)
+    elif name.startswith("vs_algorithm"):
+        # ``N - 1`` Horner steps, each updating ``s_pow`` and the binomial
+        # product and doing three operations per coordinate, plus the first
+        # and last terms.
+        per_value = (degree - 1) * (3 * dimension + 2) + 3 * dimension + 1
+    else:
+        # Level ``i`` of de Casteljau does ``i`` convex combinations (two
+        # multiplications and an addition) per coordinate.
+        per_value = 3 * dimension * degree * (degree + 1) // 2
+
+    return per_value * num_values
+
+
+def parse_perf_csv(output):
+    """Parse the output of ``perf stat -x ,``.
+
+    Args:
+        output (str): The (``stderr``) output of ``perf stat``.
+
+    Returns:
+        Dict[str, Optional[int]]: The count for each event in
+        :data:`PERF_EVENTS` (:data:`None` if it was not counted).
+    """
+    counts = dict.fromkeys(PERF_EVENTS)
+    for line in output.splitlines():
+        parts = line.split(",")
+        if len(parts) < 3:
+            continue
+        # NOTE: Events may have a modifier, e.g. ``cycles:u``.
+        event, _, _ = parts[2].partition(":")
+        if event not in counts:
+            continue
+        try:
+            counts[event] = int(float(parts[0]))
+        except ValueError:
+            # E.g. ``<not supported>`` or ``<not counted>``.
+            counts[event] = None
+
+    return counts
+
+
+def perf_counts(function, num_nodes, num_values, dimension, loops):
+    """Run ``loops`` kernel calls in a child process under ``perf stat``."""
+    cmd = [
+        "perf",
+        "stat",
+        "-x",
+        ",",
+        "-e",
+        ",".join(PERF_EVENTS),
+        "--",
+        sys.executable,
+        __file__,
+        "call",
+        function,
+        str(num_nodes),
+        str(num_values),
+        str(dimension),
+        str(loops),
+    ]
+    completed = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+    )
+    return parse_perf_csv(completed.stderr.decode("utf-8"))
+
+
+def counters_per_call(function, num_nodes, num_values, dimension, loops):
+    """Get hardware counters for a single call (or :data:`None` values)."""
+    if shutil.which("perf") is None:
+        return dict.fromkeys(PERF_EVENTS)
+
+    try:
+        with_calls = perf_counts(
+            function, num_nodes, num_values, dimension, loops
+        )
+        without_calls = perf_counts(
+            function, num_nodes, num_values, dimension, 0
+        )
+    except subprocess.CalledProcessError:
+        return dict.fromkeys(PERF_EVENTS)
+
+    per_call = {}
+    for event in PERF_EVENTS:
+        if with_calls[event] is None or without_calls[event] is None:
+            per_call[event] = None
+        else:
+            difference = with_calls[event] - without_calls[event]
+            per_call[event] = max(difference, 0) / loops
+
+    return per_call
+
+
+def measure(function, num_nodes, num_values, dimension):
+    fn = nb_helpers.get_function(function)
+    nodes, s_vals = nb_helpers.generate_nodes(
+        num_nodes, num_values, SEED, dimension=dimension
+    )
+    timer = timeit.Timer(lambda: fn(nodes, s_vals))
+    loops, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=3, number=loops)) / loops
+
+    counters = counters_per_call(
+        function, num_nodes, num_values, dimension, loops
+    )
+    misses = counters["LLC-load-misses"]
+    if misses is None:
+        misses = counters["cache-misses"]
+    bytes_moved = None if misses is None else misses * CACHE_LINE_BYTES
+
+    _, _, name = function.partition(".")
+    flops = flop_count(name, num_nodes, num_values, dimension)
+    intensity = None
+    if bytes_moved:
+        intensity = flops / bytes_moved
+
+    return {
+        "function": function,
+        "num_nodes": num_nodes,
+        "num_values": num_values,
+        "dimension": dimension,
+        "seconds": seconds,
+        "flops": flops,
+        "gflops_per_second": 1e-9 * flops / seconds,
+        "cycles": counters["cycles"],
+        "instructions": counters["instructions"],
+        "cache_misses": counters["cache-misses"],
+        "llc_load_misses": counters["LLC-load-misses"],
+        "bytes_moved": bytes_moved,
+        "arithmetic_intensity": intensity,
+    }
+
+
+def measure_roofline():
+    """Measure the memory bandwidth and peak compute of this machine.
+
+    Returns:
+        Dict[str, float]: The bandwidth (bytes per second) and peak
+        compute (FLOPs per second).
+    """
+    source = np.ones(BANDWIDTH_BYTES // 8)
+    destination = np.empty_like(source)
+    timer = timeit.Timer(lambda: np.copyto(destination, source))
+    copy_seconds = min(timer.repeat(repeat=5, number=1))
+    # NOTE: A copy reads and writes every byte.
+    bandwidth = 2 * BANDWIDTH_BYTES / copy_seconds
+
+    matrix = np.ones((PEAK_MATRIX_SIZE, PEAK_MATRIX_SIZE))
+    timer = timeit.Timer(lambda: matrix @ matrix)
+    matmul_seconds = min(timer.repeat(repeat=3, number=1))
+    peak = 2 * PEAK_MATRIX_SIZE ** 3 / matmul_seconds
+
+    return {"bandwidth": bandwidth, "peak_flops_per_second": peak}
+
+
+def plot_roofline(roofline, records):
+    import matplotlib.pyplot as plt
+
+    figure = plt.figure(figsize=(18, 12), dpi=80)
+    ax = figure.gca()
+
+    bandwidth = 1e-9 * roofline["bandwidth"]
+    peak = 1e-9 * roofline["peak_flops_per_second"]
+    intensities = np.logspace(-3, 3, 200)
+    ax.loglog(
+        intensities,
+        np.minimum(peak, bandwidth * intensities),
+        color="black",
+        label=f"roofline ({bandwidth:.1f} GB/s, {peak:.1f} GFLOP/s)",
+    )
+
+    for function in sorted(set(record["function"] for record in records)):
+        points = [
+            (record["arithmetic_intensity"], record["gflops_per_second"])
+            for record in records
+            if record["function"] == function
+            and record["arithmetic_intensity"] is not None
+        ]
+        if points:
+            x_vals, y_vals = zip(*points)
+            ax.loglog(x_vals, y_vals, marker="o", linestyle="", label=function)
+
+    ax.set_xlabel("Arithmetic Intensity (FLOPs / byte)")
+    ax.set_ylabel("Achieved GFLOP/s")
+    ax.legend()
+    plt.show()
+
+
+def run(args):
+    roofline = measure_roofline()
+    print(json.dumps({"roofline": roofline}))
+
+    if shutil.which("perf") is None:
+        print(
+            "`perf` not found, hardware counters will not be recorded",
+            file=sys.stderr,
+        )
+
+    records = []
+    grid = itertools.product(args.functions, args.num_nodes, args.num_values)
+    for function, num_nodes, num_values in grid:
+        record = measure(function, num_nodes, num_values, args.dimension)
+        records.append(record)
+        print(json.dumps(record), flush=True)
+
+    if args.plot:
+        plot_roofline(roofline, records)
+
+
+def call(args):
+    # NOTE: This is the child process run under ``perf stat``.
+    fn = nb_helpers.get_function(args.function)
+    nodes, s_vals = nb_helpers.generate_nodes(
+        args.num_nodes, args.num_values, SEED, dimension=args.dimension
+    )
+    for _ in range(args.loops):
+        fn(nodes, s_vals)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Measure kernels and the roofline."
+    )
+    run_parser.add_argument(
+        "--functions", nargs="+", default=DEFAULT_FUNCTIONS
+    )
+    run_parser.add_argument(
+        "--num-nodes", nargs="+", type=int, default=DEFAULT_NUM_NODES
+    )
+    run_parser.add_argument(
+        "--num-values", nargs="+", type=int, default=DEFAULT_NUM_VALUES
+    )
+    run_parser.add_argument("--dimension", type=int, default=2)
+    run_parser.add_argument(
+        "--plot", action="store_true", help="Plot the roofline."
+    )
+    run_parser.set_defaults(handler=run)
+
+    call_parser = subparsers.add_parser(
+        "call", help="Call a kernel in a loop (used under `perf stat`)."
+    )
+    call_parser.add_argument("function")
+    call_parser.add_argument("num_nodes", type=int)
+    call_parser.add_argument("num_values", type=int)
+    call_parser.add_argument("dimension", type=int)
+    call_parser.add_argument("loops", type=int)
+    call_parser.set_defaults(handler=call)
+
+    return parser
+
+
+def main():
+    parser = get_parser()
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
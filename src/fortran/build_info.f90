@@ -0,0 +1,70 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module build_info
+
+  ! Exposes how the Fortran object files were compiled, so that benchmark
+  ! results can be tagged with the flags (e.g. ``-O3 -march=native``) and
+  ! compiler that produced them. The modules that the ``Makefile`` compiles
+  ! with extra flags (``compensated_`` and ``simd_``) use ``copy_string`` to
+  ! expose their own flags.
+
+  use, intrinsic :: iso_c_binding, only: c_char, c_int
+  use, intrinsic :: iso_fortran_env, only: compiler_options, compiler_version
+  implicit none
+  public copy_string, get_compiler_options, get_compiler_version
+
+contains
+
+  subroutine copy_string(value, buffer_size, buffer, length)
+
+    character(len=*), intent(in) :: value
+    integer(c_int), intent(in) :: buffer_size
+    character(c_char), intent(inout) :: buffer(buffer_size)
+    integer(c_int), intent(out) :: length
+    ! Variables outside of signature.
+    integer(c_int) :: i
+
+    length = min(len(value), buffer_size)
+    do i = 1, length
+       buffer(i) = value(i:i)
+    end do
+
+  end subroutine copy_string
+
+  subroutine get_compiler_options(buffer_size, buffer, length) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_compiler_options')
+
+    integer(c_int), intent(in) :: buffer_size
+    character(c_char), intent(inout) :: buffer(buffer_size)
+    integer(c_int), intent(out) :: length
+
+    call copy_string(compiler_options(), buffer_size, buffer, length)
+
+  end subroutine get_compiler_options
+
+  subroutine get_compiler_version(buffer_size, buffer, length) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_compiler_version')
+
+    integer(c_int), intent(in) :: buffer_size
+    character(c_char), intent(inout) :: buffer(buffer_size)
+    integer(c_int), intent(out) :: length
+
+    call copy_string(compiler_version(), buffer_size, buffer, length)
+
+  end subroutine get_compiler_version
+
+end module build_info
@@ -0,0 +1,162 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module compensated_
+
+  ! Compensated de Casteljau (CompDeCasteljau from Graillat, Langlois and
+  ! Louvet, "Algorithms for accurate, validated and fast polynomial
+  ! evaluation"). The rounding error of every operation is captured with an
+  ! error-free transformation and the errors are run through the same
+  ! reduction, so the result is as accurate as if it were computed in twice
+  ! the working precision and then rounded.
+  !
+  ! NOTE: The error-free transformations rely on the exact order of floating
+  !       point operations, so this module **must not** be compiled with
+  !       ``-ffast-math`` (the ``Makefile`` turns it off for this file).
+
+  use, intrinsic :: iso_c_binding, only: c_char, c_double, c_int
+  use, intrinsic :: iso_fortran_env, only: compiler_options
+  use types, only: dp
+  use build_info, only: copy_string
+  implicit none
+  private split, two_sum, two_prod
+  public compensated_inner, compensated_outer
+  public compensated_compiler_options
+
+  ! 2^27 + 1, used to split a double into two 26-bit halves.
+  real(c_double), parameter :: SPLIT_FACTOR = 134217729.0_dp
+
+contains
+
+  elemental subroutine split(a, a_hi, a_lo)
+
+    real(c_double), intent(in) :: a
+    real(c_double), intent(out) :: a_hi, a_lo
+    ! Variables outside of signature.
+    real(c_double) :: c
+
+    c = SPLIT_FACTOR * a
+    a_hi = c - (c - a)
+    a_lo = a - a_hi
+
+  end subroutine split
+
+  elemental subroutine two_sum(a, b, sum_, error)
+
+    real(c_double), intent(in) :: a, b
+    real(c_double), intent(out) :: sum_, error
+    ! Variables outside of signature.
+    real(c_double) :: z
+
+    sum_ = a + b
+    z = sum_ - a
+    error = (a - (sum_ - z)) + (b - z)
+
+  end subroutine two_sum
+
+  elemental subroutine two_prod(a, b, product_, error)
+
+    real(c_double), intent(in) :: a, b
+    real(c_double), intent(out) :: product_, error
+    ! Variables outside of signature.
+    real(c_double) :: a_hi, a_lo, b_hi, b_lo
+
+    product_ = a * b
+    call split(a, a_hi, a_lo)
+    call split(b, b_hi, b_lo)
+    error = a_lo * b_lo - ( &
+         ((product_ - a_hi * b_hi) - a_lo * b_hi) - a_hi * b_lo)
+
+  end subroutine two_prod
+
+  subroutine compensated_inner( &
+       num_nodes, dimension_, nodes, s_val, evaluated)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(out) :: evaluated(dimension_)
+    ! Variables outside of signature.
+    real(c_double) :: one_less, one_less_error
+    real(c_double) :: workspace(dimension_, num_nodes)
+    real(c_double) :: errors(dimension_, num_nodes)
+    real(c_double) :: product1(dimension_, num_nodes)
+    real(c_double) :: product1_error(dimension_, num_nodes)
+    real(c_double) :: product2(dimension_, num_nodes)
+    real(c_double) :: product2_error(dimension_, num_nodes)
+    real(c_double) :: sum_error(dimension_, num_nodes)
+    integer(c_int) :: i
+
+    call two_sum(1.0_dp, -s_val, one_less, one_less_error)
+
+    workspace = nodes
+    errors = 0.0_dp
+    do i = num_nodes - 1, 1, -1
+       call two_prod( &
+            one_less, workspace(:, 1:i), product1(:, 1:i), &
+            product1_error(:, 1:i))
+       call two_prod( &
+            s_val, workspace(:, 2:i + 1), product2(:, 1:i), &
+            product2_error(:, 1:i))
+       ! NOTE: ``errors(:, 1:i)`` must be updated before ``workspace(:, 1:i)``
+       !       is overwritten since it uses the previous level.
+       errors(:, 1:i) = ( &
+            one_less * errors(:, 1:i) + s_val * errors(:, 2:i + 1) + &
+            (product1_error(:, 1:i) + product2_error(:, 1:i) + &
+            one_less_error * workspace(:, 1:i)))
+       call two_sum( &
+            product1(:, 1:i), product2(:, 1:i), workspace(:, 1:i), &
+            sum_error(:, 1:i))
+       errors(:, 1:i) = errors(:, 1:i) + sum_error(:, 1:i)
+    end do
+    evaluated = workspace(:, 1) + errors(:, 1)
+
+  end subroutine compensated_inner
+
+  subroutine compensated_outer( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_compensated')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       call compensated_inner( &
+            num_nodes, dimension_, nodes, s_vals(j), evaluated(:, j))
+    end do
+
+  end subroutine compensated_outer
+
+  subroutine compensated_compiler_options(buffer_size, buffer, length) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_compensated_compiler_options')
+
+    ! The ``Makefile`` compiles this module with its own flags, so
+    ! ``build_info`` doesn't describe it.
+
+    integer(c_int), intent(in) :: buffer_size
+    character(c_char), intent(inout) :: buffer(buffer_size)
+    integer(c_int), intent(out) :: length
+
+    call copy_string(compiler_options(), buffer_size, buffer, length)
+
+  end subroutine compensated_compiler_options
+
+end module compensated_
@@ -0,0 +1,216 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module derivative_
+
+  ! Evaluate points **and** derivatives in a single pass. When ``m + 1``
+  ! values remain in the de Casteljau reduction they are the control
+  ! points (at ``s``) of a degree ``m`` curve, so the ``m``-th derivative
+  ! is ``N! / (N - m)!`` times their ``m``-th forward difference. Both
+  ! kernels reduce the nodes down to ``num_derivatives + 1`` values and
+  ! then share the last (derivative producing) levels.
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use types, only: dp
+  use vs_algorithm, only: rescale_period, node_exponent, rescale
+  implicit none
+  private finish_with_derivatives, stable_windows
+  public serial_with_derivative, vs_algorithm_with_derivative
+
+contains
+
+  subroutine finish_with_derivatives( &
+       degree, dimension_, num_reduced, s_val, reduced, num_derivatives, &
+       evaluated, derivatives)
+
+    ! ``reduced`` holds ``num_reduced`` (at most 3) values of the reduction
+    ! and any derivative of order ``num_reduced`` or higher is zero.
+
+    integer(c_int), intent(in) :: degree, dimension_, num_reduced
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(inout) :: reduced(dimension_, num_reduced)
+    integer(c_int), intent(in) :: num_derivatives
+    real(c_double), intent(out) :: evaluated(dimension_)
+    real(c_double), intent(out) :: derivatives(dimension_, num_derivatives)
+    ! Variables outside of signature.
+    real(c_double) :: one_less
+    integer(c_int) :: i
+
+    one_less = 1.0_dp - s_val
+    derivatives = 0.0_dp
+
+    do i = num_reduced - 1, 1, -1
+       if (i == 2) then
+          derivatives(:, 2) = real(degree * (degree - 1), dp) * ( &
+               reduced(:, 3) - 2.0_dp * reduced(:, 2) + reduced(:, 1))
+       else if (i == 1) then
+          derivatives(:, 1) = real(degree, dp) * ( &
+               reduced(:, 2) - reduced(:, 1))
+       end if
+       reduced(:, 1:i) = ( &
+            one_less * reduced(:, 1:i) + &
+            s_val * reduced(:, 2:i + 1))
+    end do
+    evaluated = reduced(:, 1)
+
+  end subroutine finish_with_derivatives
+
+  subroutine stable_windows( &
+       num_nodes, dimension_, nodes, num_reduced, period, node_shift, &
+       s_val, reduced)
+
+    ! Runs the ``vs_algorithm_stable`` recurrence for a single ``s_val`` in
+    ! ``[0, 1/2]`` on the ``num_reduced`` overlapping windows
+    ! ``nodes(:, w:w + reduced_degree)`` at once (they share every power of
+    ! ``1 - s`` and every binomial ratio). As in ``stable_inner``, ``nodes``
+    ! are divided by ``2**node_shift`` and for high degrees the values are
+    ! periodically rescaled by a power of two so that nothing underflows.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_reduced, period, node_shift
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(out) :: reduced(dimension_, num_reduced)
+    ! Variables outside of signature.
+    real(c_double) :: one_less, one_less_pow, binom_ratio
+    integer(c_int) :: reduced_degree, scale_exponent, next_rescale, i
+
+    reduced_degree = num_nodes - num_reduced
+    one_less = 1.0_dp - s_val
+    one_less_pow = 1.0_dp
+    scale_exponent = node_shift
+    reduced = nodes(:, reduced_degree + 1:num_nodes)
+
+    if (reduced_degree < period) then
+       do i = reduced_degree, 1, -1
+          one_less_pow = one_less_pow * one_less
+          binom_ratio = real(reduced_degree - i + 1, dp) / i
+          reduced = ( &
+               one_less_pow * nodes(:, i:i + num_reduced - 1) + &
+               s_val * binom_ratio * reduced)
+       end do
+    else
+       next_rescale = reduced_degree - period
+       do i = reduced_degree, 1, -1
+          one_less_pow = one_less_pow * one_less
+          binom_ratio = real(reduced_degree - i + 1, dp) / i
+          reduced = ( &
+               one_less_pow * nodes(:, i:i + num_reduced - 1) + &
+               s_val * binom_ratio * reduced)
+          if (i == next_rescale) then
+             call rescale( &
+                  dimension_ * num_reduced, reduced, one_less_pow, &
+                  scale_exponent)
+             next_rescale = next_rescale - period
+          end if
+       end do
+    end if
+
+    if (scale_exponent /= 0) then
+       reduced = scale(reduced, scale_exponent)
+    end if
+
+  end subroutine stable_windows
+
+  subroutine serial_with_derivative( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, num_derivatives, &
+       evaluated, derivatives) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_with_derivative')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    integer(c_int), intent(in) :: num_derivatives
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    real(c_double), intent(out) :: &
+         derivatives(dimension_, num_vals, num_derivatives)
+    ! Variables outside of signature.
+    real(c_double) :: one_less
+    real(c_double) :: workspace(dimension_, num_nodes)
+    real(c_double) :: derivatives_j(dimension_, num_derivatives)
+    integer(c_int) :: num_reduced, i, j
+
+    num_reduced = min(num_derivatives, num_nodes - 1) + 1
+    do j = 1, num_vals
+       one_less = 1.0_dp - s_vals(j)
+       workspace = nodes
+       do i = num_nodes - 1, num_reduced, -1
+          workspace(:, 1:i) = ( &
+               one_less * workspace(:, 1:i) + &
+               s_vals(j) * workspace(:, 2:i + 1))
+       end do
+       call finish_with_derivatives( &
+            num_nodes - 1, dimension_, num_reduced, s_vals(j), &
+            workspace(:, 1:num_reduced), num_derivatives, &
+            evaluated(:, j), derivatives_j)
+       derivatives(:, j, :) = derivatives_j
+    end do
+
+  end subroutine serial_with_derivative
+
+  subroutine vs_algorithm_with_derivative( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, num_derivatives, &
+       evaluated, derivatives) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm_with_derivative')
+
+    ! Gets the values that ``serial_with_derivative`` gets from de
+    ! Casteljau from ``stable_windows`` instead. For ``s > 1/2`` the nodes
+    ! are reversed (which reverses the order of the windows as well).
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    integer(c_int), intent(in) :: num_derivatives
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    real(c_double), intent(out) :: &
+         derivatives(dimension_, num_vals, num_derivatives)
+    ! Variables outside of signature.
+    real(c_double), allocatable :: scaled(:, :), reversed(:, :)
+    real(c_double) :: &
+         reduced(dimension_, min(num_derivatives, num_nodes - 1) + 1)
+    real(c_double) :: derivatives_j(dimension_, num_derivatives)
+    integer(c_int) :: num_reduced, period, node_shift, j
+
+    num_reduced = size(reduced, 2)
+    period = rescale_period(num_nodes - num_reduced)
+    node_shift = node_exponent(num_nodes, dimension_, nodes)
+    allocate(scaled(dimension_, num_nodes))
+    allocate(reversed(dimension_, num_nodes))
+    scaled = scale(nodes, -node_shift)
+    reversed = scaled(:, num_nodes:1:-1)
+
+    do j = 1, num_vals
+       if (s_vals(j) <= 0.5_dp) then
+          call stable_windows( &
+               num_nodes, dimension_, scaled, num_reduced, period, &
+               node_shift, s_vals(j), reduced)
+       else
+          call stable_windows( &
+               num_nodes, dimension_, reversed, num_reduced, period, &
+               node_shift, 1.0_dp - s_vals(j), reduced)
+          reduced = reduced(:, num_reduced:1:-1)
+       end if
+       call finish_with_derivatives( &
+            num_nodes - 1, dimension_, num_reduced, s_vals(j), reduced, &
+            num_derivatives, evaluated(:, j), derivatives_j)
+       derivatives(:, j, :) = derivatives_j
+    end do
+
+  end subroutine vs_algorithm_with_derivative
+
+end module derivative_
@@ -15,7 +15,8 @@ module do_
   use, intrinsic :: iso_c_binding, only: c_double, c_int
   use types, only: dp
   implicit none
-  public do1, do2, do3
+  public do1, do2, do3, do3_omp
+  public do1_batch, do2_batch, do3_batch
 
 contains
 
@@ -32,9 +33,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(num_vals, dimension_, num_nodes)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(num_vals, dimension_, num_nodes))
+
     one_less = 1.0_dp - s_vals
 
     do j = 1, num_vals
@@ -65,9 +68,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(dimension_, num_vals, num_nodes)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(dimension_, num_vals, num_nodes))
+
     one_less = 1.0_dp - s_vals
 
     do j = 1, num_vals
@@ -98,9 +103,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(dimension_, num_nodes, num_vals)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(dimension_, num_nodes, num_vals))
+
     one_less = 1.0_dp - s_vals
 
     do j = 1, num_vals
@@ -118,4 +125,119 @@ contains
 
   end subroutine do3
 
+  subroutine do3_omp( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, num_threads, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_do3_omp')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    integer(c_int), intent(in) :: num_threads
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: one_less(num_vals)
+    real(c_double), allocatable :: workspace(:, :, :)
+    integer(c_int) :: i, j
+
+    allocate(workspace(dimension_, num_nodes, num_vals))
+
+    one_less = 1.0_dp - s_vals
+
+#ifndef _OPENMP
+    ! NOTE: Without ``-fopenmp`` the directives are comments, so reference
+    !       ``num_threads`` to avoid ``-Wunused-dummy-argument``.
+    if (num_threads < 1) continue
+#endif
+    ! NOTE: The loops are interchanged relative to ``do3`` so that each
+    !       thread reduces a contiguous chunk of ``workspace(:, :, j)``.
+    !$omp parallel do num_threads(num_threads) private(i)
+    do j = 1, num_vals
+       workspace(:, :, j) = nodes
+       do i = num_nodes - 1, 1, -1
+          workspace(:, 1:i, j) = ( &
+               one_less(j) * workspace(:, 1:i, j) + &
+               s_vals(j) * workspace(:, 2:i + 1, j))
+       end do
+       evaluated(:, j) = workspace(:, 1, j)
+    end do
+    !$omp end parallel do
+
+  end subroutine do3_omp
+
+  subroutine do1_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_do1_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call do1( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine do1_batch
+
+  subroutine do2_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_do2_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call do2( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine do2_batch
+
+  subroutine do3_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_do3_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call do3( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine do3_batch
+
 end module do_
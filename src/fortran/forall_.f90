@@ -16,6 +16,7 @@ module forall_
   use types, only: dp
   implicit none
   public forall1, forall2, forall3
+  public forall1_batch, forall2_batch, forall3_batch
 
 contains
 
@@ -32,9 +33,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(num_vals, dimension_, num_nodes)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(num_vals, dimension_, num_nodes))
+
     one_less = 1.0_dp - s_vals
 
     forall (j = 1:num_vals)
@@ -65,9 +68,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(dimension_, num_vals, num_nodes)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(dimension_, num_vals, num_nodes))
+
     one_less = 1.0_dp - s_vals
 
     forall (j = 1:num_vals)
@@ -98,9 +103,11 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: workspace(dimension_, num_nodes, num_vals)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i, j
 
+    allocate(workspace(dimension_, num_nodes, num_vals))
+
     one_less = 1.0_dp - s_vals
 
     forall (j = 1:num_vals)
@@ -118,4 +125,76 @@ contains
 
   end subroutine forall3
 
+  subroutine forall1_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_forall1_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call forall1( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine forall1_batch
+
+  subroutine forall2_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_forall2_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call forall2( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine forall2_batch
+
+  subroutine forall3_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_forall3_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call forall3( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine forall3_batch
+
 end module forall_
@@ -12,10 +12,11 @@
 
 module serial_
 
-  use, intrinsic :: iso_c_binding, only: c_double, c_int
-  use types, only: dp
+  use, intrinsic :: iso_c_binding, only: c_double, c_float, c_int
+  use types, only: dp, sp
   implicit none
-  public serial_inner, serial_outer
+  public serial_inner, serial_outer, serial_omp, serial_batch
+  public serial_single_inner, serial_single, serial_mixed
 
 contains
 
@@ -67,4 +68,132 @@ contains
 
   end subroutine serial_outer
 
+  subroutine serial_omp( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, num_threads, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_omp')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    integer(c_int), intent(in) :: num_threads
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    integer(c_int) :: j
+
+#ifndef _OPENMP
+    ! NOTE: Without ``-fopenmp`` the directives are comments, so reference
+    !       ``num_threads`` to avoid ``-Wunused-dummy-argument``.
+    if (num_threads < 1) continue
+#endif
+    !$omp parallel do num_threads(num_threads)
+    do j = 1, num_vals
+       call serial_inner( &
+            num_nodes, dimension_, nodes, s_vals(j), evaluated(:, j))
+    end do
+    !$omp end parallel do
+
+  end subroutine serial_omp
+
+  subroutine serial_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call serial_outer( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine serial_batch
+
+  subroutine serial_single_inner( &
+       num_nodes, dimension_, nodes, s_val, evaluated)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_float), intent(in) :: s_val
+    real(c_float), intent(out) :: evaluated(dimension_)
+    ! Variables outside of signature.
+    real(c_float) :: one_less
+    real(c_float) :: workspace(dimension_, num_nodes)
+    integer(c_int) :: i
+
+    one_less = 1.0_sp - s_val
+
+    workspace = nodes
+    do i = num_nodes - 1, 1, -1
+       workspace(:, 1:i) = ( &
+            one_less * workspace(:, 1:i) + &
+            s_val * workspace(:, 2:i + 1))
+    end do
+    evaluated = workspace(:, 1)
+
+  end subroutine serial_single_inner
+
+  subroutine serial_single( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_single')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_float), intent(in) :: s_vals(num_vals)
+    real(c_float), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       call serial_single_inner( &
+            num_nodes, dimension_, nodes, s_vals(j), evaluated(:, j))
+    end do
+
+  end subroutine serial_single
+
+  subroutine serial_mixed( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_mixed')
+
+    ! Single precision inputs and outputs, but (like ``serial_outer``) every
+    ! intermediate value is computed in double precision.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_float), intent(in) :: s_vals(num_vals)
+    real(c_float), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: nodes_dp(dimension_, num_nodes)
+    real(c_double) :: evaluated_dp(dimension_)
+    integer(c_int) :: j
+
+    nodes_dp = real(nodes, dp)
+    do j = 1, num_vals
+       call serial_inner( &
+            num_nodes, dimension_, nodes_dp, real(s_vals(j), dp), &
+            evaluated_dp)
+       evaluated(:, j) = real(evaluated_dp, sp)
+    end do
+
+  end subroutine serial_mixed
+
 end module serial_
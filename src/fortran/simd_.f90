@@ -0,0 +1,238 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module simd_
+
+  ! De Casteljau's algorithm vectorized explicitly across values of ``s``.
+  ! The values are processed in blocks of ``LANES`` and, one coordinate at
+  ! a time, the workspace is stored as ``(LANES, num_nodes)``, i.e. the
+  ! transpose of a ``(num_nodes, num_vals)`` structure-of-arrays block. So
+  ! every update in the reduction is a single contiguous sweep over the
+  ! lanes (marked with ``!$omp simd``, which needs ``-fopenmp-simd``) that
+  ! does not depend on the compiler auto-vectorizing array syntax.
+  !
+  ! ``simd_single`` does the same in single precision, so twice as many
+  ! values fit in a vector, and ``simd_mixed`` stores single precision
+  ! inputs and outputs but does the reduction in double precision.
+
+  use, intrinsic :: iso_c_binding, only: c_char, c_double, c_float, c_int
+  use, intrinsic :: iso_fortran_env, only: compiler_options
+  use types, only: dp, sp
+  use build_info, only: copy_string
+  implicit none
+  private evaluate_block, evaluate_block_single
+  public simd, simd_batch, simd_single, simd_mixed, simd_compiler_options
+
+  ! 8 doubles (or 16 singles) fill one AVX-512 register (or two AVX2
+  ! registers).
+  integer(c_int), parameter :: LANES = 8
+  integer(c_int), parameter :: LANES_SINGLE = 16
+
+contains
+
+  subroutine evaluate_block( &
+       num_nodes, dimension_, nodes, s_block, evaluated)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_double), intent(in) :: s_block(LANES)
+    real(c_double), intent(out) :: evaluated(LANES, dimension_)
+    ! Variables outside of signature.
+    real(c_double) :: one_less(LANES)
+    real(c_double) :: workspace(LANES, num_nodes)
+    integer(c_int) :: d, i, m, lane
+
+    one_less = 1.0_dp - s_block
+
+    do d = 1, dimension_
+       do m = 1, num_nodes
+          workspace(:, m) = nodes(d, m)
+       end do
+
+       do i = num_nodes - 1, 1, -1
+          do m = 1, i
+             !$omp simd
+             do lane = 1, LANES
+                workspace(lane, m) = ( &
+                     one_less(lane) * workspace(lane, m) + &
+                     s_block(lane) * workspace(lane, m + 1))
+             end do
+          end do
+       end do
+       evaluated(:, d) = workspace(:, 1)
+    end do
+
+  end subroutine evaluate_block
+
+  subroutine evaluate_block_single( &
+       num_nodes, dimension_, nodes, s_block, evaluated)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_float), intent(in) :: s_block(LANES_SINGLE)
+    real(c_float), intent(out) :: evaluated(LANES_SINGLE, dimension_)
+    ! Variables outside of signature.
+    real(c_float) :: one_less(LANES_SINGLE)
+    real(c_float) :: workspace(LANES_SINGLE, num_nodes)
+    integer(c_int) :: d, i, m, lane
+
+    one_less = 1.0_sp - s_block
+
+    do d = 1, dimension_
+       do m = 1, num_nodes
+          workspace(:, m) = nodes(d, m)
+       end do
+
+       do i = num_nodes - 1, 1, -1
+          do m = 1, i
+             !$omp simd
+             do lane = 1, LANES_SINGLE
+                workspace(lane, m) = ( &
+                     one_less(lane) * workspace(lane, m) + &
+                     s_block(lane) * workspace(lane, m + 1))
+             end do
+          end do
+       end do
+       evaluated(:, d) = workspace(:, 1)
+    end do
+
+  end subroutine evaluate_block_single
+
+  subroutine simd( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_simd')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_block(LANES)
+    real(c_double) :: block_evaluated(LANES, dimension_)
+    integer(c_int) :: start, width
+
+    do start = 1, num_vals, LANES
+       width = min(LANES, num_vals - start + 1)
+       ! NOTE: The last block is padded with ``s = 0`` so that every block
+       !       is a full vector; the padded lanes are discarded.
+       s_block = 0.0_dp
+       s_block(:width) = s_vals(start:start + width - 1)
+       call evaluate_block( &
+            num_nodes, dimension_, nodes, s_block, block_evaluated)
+       evaluated(:, start:start + width - 1) = &
+            TRANSPOSE(block_evaluated(:width, :))
+    end do
+
+  end subroutine simd
+
+  subroutine simd_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_simd_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call simd( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine simd_batch
+
+  subroutine simd_single( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_simd_single')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_float), intent(in) :: s_vals(num_vals)
+    real(c_float), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_float) :: s_block(LANES_SINGLE)
+    real(c_float) :: block_evaluated(LANES_SINGLE, dimension_)
+    integer(c_int) :: start, width
+
+    do start = 1, num_vals, LANES_SINGLE
+       width = min(LANES_SINGLE, num_vals - start + 1)
+       s_block = 0.0_sp
+       s_block(:width) = s_vals(start:start + width - 1)
+       call evaluate_block_single( &
+            num_nodes, dimension_, nodes, s_block, block_evaluated)
+       evaluated(:, start:start + width - 1) = &
+            TRANSPOSE(block_evaluated(:width, :))
+    end do
+
+  end subroutine simd_single
+
+  subroutine simd_mixed( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_simd_mixed')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_float), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_float), intent(in) :: s_vals(num_vals)
+    real(c_float), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: nodes_dp(dimension_, num_nodes)
+    real(c_double) :: s_block(LANES)
+    real(c_double) :: block_evaluated(LANES, dimension_)
+    integer(c_int) :: start, width
+
+    nodes_dp = real(nodes, dp)
+    do start = 1, num_vals, LANES
+       width = min(LANES, num_vals - start + 1)
+       s_block = 0.0_dp
+       s_block(:width) = real(s_vals(start:start + width - 1), dp)
+       call evaluate_block( &
+            num_nodes, dimension_, nodes_dp, s_block, block_evaluated)
+       evaluated(:, start:start + width - 1) = &
+            real(TRANSPOSE(block_evaluated(:width, :)), sp)
+    end do
+
+  end subroutine simd_mixed
+
+  subroutine simd_compiler_options(buffer_size, buffer, length) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_simd_compiler_options')
+
+    ! The ``Makefile`` compiles this module with its own flags, so
+    ! ``build_info`` doesn't describe it.
+
+    integer(c_int), intent(in) :: buffer_size
+    character(c_char), intent(inout) :: buffer(buffer_size)
+    integer(c_int), intent(out) :: length
+
+    call copy_string(compiler_options(), buffer_size, buffer, length)
+
+  end subroutine simd_compiler_options
+
+end module simd_
@@ -0,0 +1,638 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+! NOTE: This is a generated file (from ``specialized_template.j2``).
+
+module specialized_
+
+  ! De Casteljau's algorithm fully unrolled for each low degree curve in
+  ! 2 and 3 dimensions. Every node is a scalar local (``x1``, ``y1``, ...)
+  ! so there are no loops over ``num_nodes``, no array slice temporaries
+  ! and no ``workspace`` copy. The arithmetic is the same as in
+  ! ``serial_inner``, in the same order. ``specialized`` routes to these
+  ! kernels and falls back to ``serial`` for every other shape.
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use types, only: dp
+  use serial_, only: serial_outer
+  implicit none
+  private &
+       serial_d2_n2, &
+       serial_d2_n3, &
+       serial_d2_n4, &
+       serial_d2_n5, &
+       serial_d2_n6, &
+       serial_d3_n2, &
+       serial_d3_n3, &
+       serial_d3_n4, &
+       serial_d3_n5, &
+       serial_d3_n6
+  public specialized, specialized_batch
+
+contains
+
+  subroutine serial_d2_n2( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(2, 2)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(2, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2
+    real(c_double) :: y1, y2
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+    end do
+
+  end subroutine serial_d2_n2
+
+  subroutine serial_d2_n3( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(2, 3)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(2, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3
+    real(c_double) :: y1, y2, y3
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+    end do
+
+  end subroutine serial_d2_n3
+
+  subroutine serial_d2_n4( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(2, 4)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(2, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4
+    real(c_double) :: y1, y2, y3, y4
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+    end do
+
+  end subroutine serial_d2_n4
+
+  subroutine serial_d2_n5( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(2, 5)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(2, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4, x5
+    real(c_double) :: y1, y2, y3, y4, y5
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       x5 = nodes(1, 5)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       y5 = nodes(2, 5)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+    end do
+
+  end subroutine serial_d2_n5
+
+  subroutine serial_d2_n6( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(2, 6)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(2, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4, x5, x6
+    real(c_double) :: y1, y2, y3, y4, y5, y6
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       x5 = nodes(1, 5)
+       x6 = nodes(1, 6)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       y5 = nodes(2, 5)
+       y6 = nodes(2, 6)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       x5 = one_less * x5 + s_val * x6
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       y5 = one_less * y5 + s_val * y6
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+    end do
+
+  end subroutine serial_d2_n6
+
+  subroutine serial_d3_n2( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(3, 2)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(3, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2
+    real(c_double) :: y1, y2
+    real(c_double) :: z1, z2
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       z1 = nodes(3, 1)
+       z2 = nodes(3, 2)
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       z1 = one_less * z1 + s_val * z2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+       evaluated(3, j) = z1
+    end do
+
+  end subroutine serial_d3_n2
+
+  subroutine serial_d3_n3( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(3, 3)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(3, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3
+    real(c_double) :: y1, y2, y3
+    real(c_double) :: z1, z2, z3
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       z1 = nodes(3, 1)
+       z2 = nodes(3, 2)
+       z3 = nodes(3, 3)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       z1 = one_less * z1 + s_val * z2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+       evaluated(3, j) = z1
+    end do
+
+  end subroutine serial_d3_n3
+
+  subroutine serial_d3_n4( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(3, 4)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(3, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4
+    real(c_double) :: y1, y2, y3, y4
+    real(c_double) :: z1, z2, z3, z4
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       z1 = nodes(3, 1)
+       z2 = nodes(3, 2)
+       z3 = nodes(3, 3)
+       z4 = nodes(3, 4)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       z1 = one_less * z1 + s_val * z2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+       evaluated(3, j) = z1
+    end do
+
+  end subroutine serial_d3_n4
+
+  subroutine serial_d3_n5( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(3, 5)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(3, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4, x5
+    real(c_double) :: y1, y2, y3, y4, y5
+    real(c_double) :: z1, z2, z3, z4, z5
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       x5 = nodes(1, 5)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       y5 = nodes(2, 5)
+       z1 = nodes(3, 1)
+       z2 = nodes(3, 2)
+       z3 = nodes(3, 3)
+       z4 = nodes(3, 4)
+       z5 = nodes(3, 5)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       z4 = one_less * z4 + s_val * z5
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       z1 = one_less * z1 + s_val * z2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+       evaluated(3, j) = z1
+    end do
+
+  end subroutine serial_d3_n5
+
+  subroutine serial_d3_n6( &
+       num_vals, nodes, s_vals, evaluated)
+
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: nodes(3, 6)
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(3, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: s_val, one_less
+    real(c_double) :: x1, x2, x3, x4, x5, x6
+    real(c_double) :: y1, y2, y3, y4, y5, y6
+    real(c_double) :: z1, z2, z3, z4, z5, z6
+    integer(c_int) :: j
+
+    do j = 1, num_vals
+       s_val = s_vals(j)
+       one_less = 1.0_dp - s_val
+       x1 = nodes(1, 1)
+       x2 = nodes(1, 2)
+       x3 = nodes(1, 3)
+       x4 = nodes(1, 4)
+       x5 = nodes(1, 5)
+       x6 = nodes(1, 6)
+       y1 = nodes(2, 1)
+       y2 = nodes(2, 2)
+       y3 = nodes(2, 3)
+       y4 = nodes(2, 4)
+       y5 = nodes(2, 5)
+       y6 = nodes(2, 6)
+       z1 = nodes(3, 1)
+       z2 = nodes(3, 2)
+       z3 = nodes(3, 3)
+       z4 = nodes(3, 4)
+       z5 = nodes(3, 5)
+       z6 = nodes(3, 6)
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       x5 = one_less * x5 + s_val * x6
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       y5 = one_less * y5 + s_val * y6
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       z4 = one_less * z4 + s_val * z5
+       z5 = one_less * z5 + s_val * z6
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       x4 = one_less * x4 + s_val * x5
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       y4 = one_less * y4 + s_val * y5
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       z4 = one_less * z4 + s_val * z5
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       x3 = one_less * x3 + s_val * x4
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       y3 = one_less * y3 + s_val * y4
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       z3 = one_less * z3 + s_val * z4
+       x1 = one_less * x1 + s_val * x2
+       x2 = one_less * x2 + s_val * x3
+       y1 = one_less * y1 + s_val * y2
+       y2 = one_less * y2 + s_val * y3
+       z1 = one_less * z1 + s_val * z2
+       z2 = one_less * z2 + s_val * z3
+       x1 = one_less * x1 + s_val * x2
+       y1 = one_less * y1 + s_val * y2
+       z1 = one_less * z1 + s_val * z2
+       evaluated(1, j) = x1
+       evaluated(2, j) = y1
+       evaluated(3, j) = z1
+    end do
+
+  end subroutine serial_d3_n6
+
+  subroutine specialized( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_specialized')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+
+    select case (dimension_)
+    case (2)
+       select case (num_nodes)
+       case (2)
+          call serial_d2_n2( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (3)
+          call serial_d2_n3( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (4)
+          call serial_d2_n4( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (5)
+          call serial_d2_n5( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (6)
+          call serial_d2_n6( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       end select
+    case (3)
+       select case (num_nodes)
+       case (2)
+          call serial_d3_n2( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (3)
+          call serial_d3_n3( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (4)
+          call serial_d3_n4( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (5)
+          call serial_d3_n5( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       case (6)
+          call serial_d3_n6( &
+               num_vals, nodes, s_vals, evaluated)
+          return
+       end select
+    end select
+
+    call serial_outer( &
+         num_nodes, dimension_, nodes, num_vals, s_vals, evaluated)
+
+  end subroutine specialized
+
+  subroutine specialized_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_specialized_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call specialized( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine specialized_batch
+
+end module specialized_
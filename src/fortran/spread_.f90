@@ -16,6 +16,7 @@ module spread_
   use types, only: dp
   implicit none
   public spread1, spread2, spread3
+  public spread1_batch, spread2_batch, spread3_batch
 
 contains
 
@@ -32,11 +33,16 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: broadcast_s(num_vals, dimension_, num_nodes)
-    real(c_double) :: broadcast_one_less(num_vals, dimension_, num_nodes)
-    real(c_double) :: workspace(num_vals, dimension_, num_nodes)
+    real(c_double), allocatable :: broadcast_s(:, :, :)
+    real(c_double), allocatable :: broadcast_one_less(:, :, :)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i
 
+    allocate( &
+         broadcast_s(num_vals, dimension_, num_nodes), &
+         broadcast_one_less(num_vals, dimension_, num_nodes), &
+         workspace(num_vals, dimension_, num_nodes))
+
     one_less = 1.0_dp - s_vals
     ! s_vals:                        [num_vals]
     ! SPREAD(s_vals, 2, dimension_): [num_vals, dimension_]
@@ -67,11 +73,16 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: broadcast_s(dimension_, num_vals, num_nodes)
-    real(c_double) :: broadcast_one_less(dimension_, num_vals, num_nodes)
-    real(c_double) :: workspace(dimension_, num_vals, num_nodes)
+    real(c_double), allocatable :: broadcast_s(:, :, :)
+    real(c_double), allocatable :: broadcast_one_less(:, :, :)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i
 
+    allocate( &
+         broadcast_s(dimension_, num_vals, num_nodes), &
+         broadcast_one_less(dimension_, num_vals, num_nodes), &
+         workspace(dimension_, num_vals, num_nodes))
+
     one_less = 1.0_dp - s_vals
     ! s_vals:                        [num_vals]
     ! SPREAD(s_vals, 1, dimension_): [dimension_, num_vals]
@@ -102,11 +113,16 @@ contains
     real(c_double), intent(out) :: evaluated(dimension_, num_vals)
     ! Variables outside of signature.
     real(c_double) :: one_less(num_vals)
-    real(c_double) :: broadcast_s(dimension_, num_nodes, num_vals)
-    real(c_double) :: broadcast_one_less(dimension_, num_nodes, num_vals)
-    real(c_double) :: workspace(dimension_, num_nodes, num_vals)
+    real(c_double), allocatable :: broadcast_s(:, :, :)
+    real(c_double), allocatable :: broadcast_one_less(:, :, :)
+    real(c_double), allocatable :: workspace(:, :, :)
     integer(c_int) :: i
 
+    allocate( &
+         broadcast_s(dimension_, num_nodes, num_vals), &
+         broadcast_one_less(dimension_, num_nodes, num_vals), &
+         workspace(dimension_, num_nodes, num_vals))
+
     one_less = 1.0_dp - s_vals
     ! s_vals:                        [num_vals]
     ! SPREAD(s_vals, 1, dimension_): [dimension_, num_vals]
@@ -124,4 +140,76 @@ contains
 
   end subroutine spread3
 
+  subroutine spread1_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_spread1_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call spread1( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine spread1_batch
+
+  subroutine spread2_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_spread2_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call spread2( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine spread2_batch
+
+  subroutine spread3_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_spread3_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call spread3( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine spread3_batch
+
 end module spread_
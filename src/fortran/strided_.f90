@@ -0,0 +1,140 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module strided_
+
+  ! Variants of ``serial`` and ``vs_algorithm_stable`` that read ``nodes``
+  ! and ``s_vals`` through arbitrary (element) strides, BLAS style. Node
+  ! ``(i, j)`` is ``nodes(first + (i - 1) * inc_dim + (j - 1) * inc_node)``
+  ! and value ``j`` is ``s_vals(first + (j - 1) * inc_s)``. As in BLAS, the
+  ! arrays start at their **lowest** address, so for a negative increment
+  ! ``first`` is past the start of the array.
+  !
+  ! The nodes are gathered once into a small ``(dimension_, num_nodes)``
+  ! array (``serial_inner`` makes such a copy for every value anyway).
+  ! ``s_vals``, which is typically much larger, is never copied in full:
+  ! ``vs_algorithm_stable_strided`` gathers it ``S_CHUNK`` values at a time
+  ! so the vectorized contiguous kernel can be used on each chunk.
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use serial_, only: serial_inner
+  use vs_algorithm, only: vs_algorithm_stable
+  implicit none
+  private first_index, gather_nodes
+  public serial_strided, vs_algorithm_stable_strided
+
+  integer(c_int), parameter :: S_CHUNK = 256
+
+contains
+
+  pure function first_index(count, inc) result(first)
+
+    integer(c_int), intent(in) :: count, inc
+    integer(c_int) :: first
+
+    first = 1
+    if (inc < 0) then
+       first = 1 - (count - 1) * inc
+    end if
+
+  end function first_index
+
+  subroutine gather_nodes( &
+       num_nodes, dimension_, nodes, inc_node, inc_dim, gathered)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(*)
+    integer(c_int), intent(in) :: inc_node, inc_dim
+    real(c_double), intent(out) :: gathered(dimension_, num_nodes)
+    ! Variables outside of signature.
+    integer(c_int) :: first, index_, i, j
+
+    first = ( &
+         first_index(dimension_, inc_dim) + &
+         first_index(num_nodes, inc_node) - 1)
+    do j = 1, num_nodes
+       do i = 1, dimension_
+          index_ = first + (i - 1) * inc_dim + (j - 1) * inc_node
+          gathered(i, j) = nodes(index_)
+       end do
+    end do
+
+  end subroutine gather_nodes
+
+  subroutine serial_strided( &
+       num_nodes, dimension_, nodes, inc_node, inc_dim, num_vals, s_vals, &
+       inc_s, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_serial_strided')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(*)
+    integer(c_int), intent(in) :: inc_node, inc_dim, num_vals
+    real(c_double), intent(in) :: s_vals(*)
+    integer(c_int), intent(in) :: inc_s
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: gathered(dimension_, num_nodes)
+    integer(c_int) :: first, j
+
+    call gather_nodes( &
+         num_nodes, dimension_, nodes, inc_node, inc_dim, gathered)
+    first = first_index(num_vals, inc_s)
+    do j = 1, num_vals
+       call serial_inner( &
+            num_nodes, dimension_, gathered, &
+            s_vals(first + (j - 1) * inc_s), evaluated(:, j))
+    end do
+
+  end subroutine serial_strided
+
+  subroutine vs_algorithm_stable_strided( &
+       num_nodes, dimension_, nodes, inc_node, inc_dim, num_vals, s_vals, &
+       inc_s, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm_stable_strided')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(*)
+    integer(c_int), intent(in) :: inc_node, inc_dim, num_vals
+    real(c_double), intent(in) :: s_vals(*)
+    integer(c_int), intent(in) :: inc_s
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: gathered(dimension_, num_nodes)
+    real(c_double) :: chunk(S_CHUNK)
+    integer(c_int) :: first, start, width, j
+
+    call gather_nodes( &
+         num_nodes, dimension_, nodes, inc_node, inc_dim, gathered)
+    if (inc_s == 1) then
+       call vs_algorithm_stable( &
+            num_nodes, dimension_, gathered, num_vals, s_vals, evaluated)
+       return
+    end if
+
+    first = first_index(num_vals, inc_s)
+    do start = 1, num_vals, S_CHUNK
+       width = min(S_CHUNK, num_vals - start + 1)
+       do j = 1, width
+          chunk(j) = s_vals(first + (start + j - 2) * inc_s)
+       end do
+       call vs_algorithm_stable( &
+            num_nodes, dimension_, gathered, width, chunk, &
+            evaluated(:, start:start + width - 1))
+    end do
+
+  end subroutine vs_algorithm_stable_strided
+
+end module strided_
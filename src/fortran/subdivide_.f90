@@ -0,0 +1,113 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module subdivide_
+
+  ! Split curves with the de Casteljau triangle that ``serial_inner``
+  ! computes (and discards). The first value of each level of the
+  ! reduction is a node of the left piece ``[0, s]`` and the last value is
+  ! a node of the right piece ``[s, 1]``, so both come from one pass.
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use types, only: dp
+  implicit none
+  private split
+  public subdivide, subdivide_many
+
+contains
+
+  subroutine split( &
+       num_nodes, dimension_, nodes, s_val, left, right)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(out) :: left(dimension_, num_nodes)
+    real(c_double), intent(out) :: right(dimension_, num_nodes)
+    ! Variables outside of signature.
+    real(c_double) :: one_less
+    real(c_double) :: workspace(dimension_, num_nodes)
+    integer(c_int) :: i
+
+    one_less = 1.0_dp - s_val
+
+    workspace = nodes
+    left(:, 1) = workspace(:, 1)
+    right(:, num_nodes) = workspace(:, num_nodes)
+    do i = num_nodes - 1, 1, -1
+       workspace(:, 1:i) = ( &
+            one_less * workspace(:, 1:i) + &
+            s_val * workspace(:, 2:i + 1))
+       left(:, num_nodes - i + 1) = workspace(:, 1)
+       right(:, i) = workspace(:, i)
+    end do
+
+  end subroutine split
+
+  subroutine subdivide( &
+       num_nodes, dimension_, nodes, s_val, pieces) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_subdivide')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(out) :: pieces(dimension_, num_nodes, 2)
+
+    call split( &
+         num_nodes, dimension_, nodes, s_val, pieces(:, :, 1), &
+         pieces(:, :, 2))
+
+  end subroutine subdivide
+
+  subroutine subdivide_many( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, pieces) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_subdivide_many')
+
+    ! Splits at each of the (sorted) ``s_vals`` in turn. The rest of the
+    ! curve after splitting at ``s_prev`` is re-parameterized over
+    ! ``[s_prev, 1]``, so the next split is at the local parameter
+    ! ``(s - s_prev) / (1 - s_prev)``.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         pieces(dimension_, num_nodes, num_vals + 1)
+    ! Variables outside of signature.
+    real(c_double) :: s_prev, local_s
+    real(c_double) :: remaining(dimension_, num_nodes)
+    integer(c_int) :: j
+
+    s_prev = 0.0_dp
+    pieces(:, :, 1) = nodes
+    do j = 1, num_vals
+       ! NOTE: Once ``s_prev == 1`` the rest of the curve is a single point
+       !       and every remaining piece is that point.
+       local_s = 0.0_dp
+       if (s_prev < 1.0_dp) then
+          local_s = (s_vals(j) - s_prev) / (1.0_dp - s_prev)
+       end if
+       remaining = pieces(:, :, j)
+       call split( &
+            num_nodes, dimension_, remaining, local_s, pieces(:, :, j), &
+            pieces(:, :, j + 1))
+       s_prev = s_vals(j)
+    end do
+
+  end subroutine subdivide_many
+
+end module subdivide_
@@ -0,0 +1,61 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module surface_
+
+  ! Tensor-product Bezier surfaces, with ``nodes(:, i, j)`` the control
+  ! point in row ``i`` (of ``num_nodes_u``) and column ``j`` (of
+  ! ``num_nodes_v``). A surface point is a curve point twice over: each
+  ! column is reduced to a single point at ``u`` and the resulting curve
+  ! (one node per column) is reduced at ``v``.
+  !
+  ! ``surface_points`` does both reductions for every ``(u, v)`` pair, so
+  ! it suits scattered pairs. On a grid, the reductions can be shared
+  ! (see ``surface_grid`` in the Python package).
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use serial_, only: serial_inner
+  implicit none
+  public surface_points
+
+contains
+
+  subroutine surface_points( &
+       num_nodes_u, num_nodes_v, dimension_, nodes, num_vals, u_vals, &
+       v_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_surface_points')
+
+    integer(c_int), intent(in) :: num_nodes_u, num_nodes_v, dimension_
+    real(c_double), intent(in) :: &
+         nodes(dimension_, num_nodes_u, num_nodes_v)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: u_vals(num_vals), v_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: reduced(dimension_, num_nodes_v)
+    integer(c_int) :: j, k
+
+    do k = 1, num_vals
+       do j = 1, num_nodes_v
+          call serial_inner( &
+               num_nodes_u, dimension_, nodes(:, :, j), u_vals(k), &
+               reduced(:, j))
+       end do
+       call serial_inner( &
+            num_nodes_v, dimension_, reduced, v_vals(k), evaluated(:, k))
+    end do
+
+  end subroutine surface_points
+
+end module surface_
@@ -0,0 +1,74 @@
+! Licensed under the Apache License, Version 2.0 (the "License");
+! you may not use this file except in compliance with the License.
+! You may obtain a copy of the License at
+!
+!     https://www.apache.org/licenses/LICENSE-2.0
+!
+! Unless required by applicable law or agreed to in writing, software
+! distributed under the License is distributed on an "AS IS" BASIS,
+! WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+! See the License for the specific language governing permissions and
+! limitations under the License.
+
+module tiled_
+
+  ! Cache-blocked de Casteljau. The values of ``s`` are processed in tiles
+  ! of ``tile_size`` and a single ``(tile_size, num_nodes)`` buffer is
+  ! reused for every tile and every coordinate, so the working set is
+  ! ``tile_size * num_nodes`` doubles (rather than the
+  ! ``num_vals * dimension_ * num_nodes`` of the ``do*`` / ``forall*`` /
+  ! ``spread*`` kernels) and can be chosen to fit in L1.
+
+  use, intrinsic :: iso_c_binding, only: c_double, c_int
+  use types, only: dp
+  implicit none
+  public tiled
+
+contains
+
+  subroutine tiled( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, tile_size, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_tiled')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    integer(c_int), intent(in) :: tile_size
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double), allocatable :: workspace(:, :)
+    real(c_double), allocatable :: one_less(:)
+    integer(c_int) :: start, width, d, i, m
+
+    allocate(workspace(tile_size, num_nodes))
+    allocate(one_less(tile_size))
+
+    do start = 1, num_vals, tile_size
+       width = min(tile_size, num_vals - start + 1)
+       one_less(:width) = 1.0_dp - s_vals(start:start + width - 1)
+
+       do d = 1, dimension_
+          ! NOTE: Each node is loaded once per tile and coordinate.
+          do m = 1, num_nodes
+             workspace(:width, m) = nodes(d, m)
+          end do
+
+          do i = num_nodes - 1, 1, -1
+             do m = 1, i
+                workspace(:width, m) = ( &
+                     one_less(:width) * workspace(:width, m) + &
+                     s_vals(start:start + width - 1) * &
+                     workspace(:width, m + 1))
+             end do
+          end do
+          evaluated(d, start:start + width - 1) = workspace(:width, 1)
+       end do
+    end do
+
+  end subroutine tiled
+
+end module tiled_
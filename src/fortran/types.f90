@@ -14,8 +14,9 @@ module types
 
   implicit none
   private
-  public dp
+  public dp, sp
 
   integer, parameter :: dp = kind(0.d0)
+  integer, parameter :: sp = kind(0.0)
 
 end module types
@@ -16,10 +16,88 @@ module vs_algorithm
        c_double, c_int, c_int32_t, c_int64_t
   use types, only: dp
   implicit none
-  public vs_algorithm32, vs_algorithm53, vs_algorithm64
+  public vs_algorithm32, vs_algorithm53, vs_algorithm64, vs_algorithm_stable
+  public &
+       vs_algorithm32_batch, vs_algorithm53_batch, vs_algorithm64_batch, &
+       vs_algorithm_stable_batch
+  private stable_steps, stable_inner
+  public rescale_period, node_exponent, rescale
+
+  ! NOTE: ``rescale`` brings the running values in ``vs_algorithm_stable``
+  !       back near one once they leave ``2**(+/-RESCALE_BITS)``.
+  integer(c_int), parameter :: RESCALE_BITS = 256
+  real(c_double), parameter :: RESCALE_MIN = 2.0_dp**(-RESCALE_BITS)
+  real(c_double), parameter :: RESCALE_MAX = 2.0_dp**RESCALE_BITS
 
 contains
 
+  pure function rescale_period(degree) result(period)
+
+    ! The number of steps between calls to ``rescale``. In one step, the
+    ! largest running value shrinks by at most a factor of two (since
+    ! ``1 - s >= 1/2``) and grows by at most a factor of ``degree`` (since
+    ! ``s * binom_ratio + 1 <= degree / 2 + 1``), so in ``period`` steps it
+    ! moves by at most ``2**512`` and never leaves the normal range.
+
+    integer(c_int), intent(in) :: degree
+    integer(c_int) :: period
+
+    period = 512 / exponent(real(max(degree, 2), dp))
+
+  end function rescale_period
+
+  pure function node_exponent(num_nodes, dimension_, nodes) result(shift)
+
+    ! The power of two to divide the nodes by so that the largest is in
+    ! ``[1/2, 1)``. (Dividing by a power of two is exact, so this doesn't
+    ! change the result.)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int) :: shift
+    ! Variables outside of signature.
+    real(c_double) :: largest
+
+    shift = 0
+    largest = maxval(abs(nodes))
+    ! NOTE: Leave zero, ``NaN`` and infinite values alone.
+    if (largest > 0.0_dp .and. largest <= huge(largest)) then
+       shift = exponent(largest)
+    end if
+
+  end function node_exponent
+
+  pure subroutine rescale(num_values, values, one_less_pow, scale_exponent)
+
+    ! ``values`` and ``one_less_pow`` are stored divided by
+    ! ``2**scale_exponent`` (and combine nodes that are at most one, see
+    ! ``node_exponent``). When the largest of them leaves
+    ! ``[RESCALE_MIN, RESCALE_MAX]``, both are multiplied by the power of two
+    ! (which is exact) that brings it back near one.
+
+    integer(c_int), intent(in) :: num_values
+    real(c_double), intent(inout) :: values(num_values), one_less_pow
+    integer(c_int), intent(inout) :: scale_exponent
+    ! Variables outside of signature.
+    real(c_double) :: largest
+    integer(c_int) :: shift
+
+    largest = max(maxval(abs(values)), one_less_pow)
+    if (RESCALE_MIN <= largest .and. largest <= RESCALE_MAX) then
+       return
+    end if
+    ! NOTE: Leave ``NaN`` and infinite values alone.
+    if (.not. largest <= huge(largest)) then
+       return
+    end if
+
+    shift = exponent(largest)
+    values = scale(values, -shift)
+    one_less_pow = scale(one_less_pow, -shift)
+    scale_exponent = scale_exponent + shift
+
+  end subroutine rescale
+
   subroutine vs_algorithm32( &
        num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
        bind(c, name='BAKEOFF&
@@ -146,4 +224,226 @@ contains
 
   end subroutine vs_algorithm64
 
+  pure subroutine stable_steps( &
+       num_nodes, dimension_, nodes, first, last, s_val, one_less, &
+       one_less_pow, evaluated)
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: first, last
+    real(c_double), intent(in) :: s_val, one_less
+    real(c_double), intent(inout) :: one_less_pow, evaluated(dimension_)
+    ! Variables outside of signature.
+    real(c_double) :: binom_ratio
+    integer(c_int) :: degree, i
+
+    degree = num_nodes - 1
+    do i = first, last, -1
+       one_less_pow = one_less_pow * one_less
+       binom_ratio = real(degree - i + 1, dp) / i
+       evaluated = ( &
+            one_less_pow * nodes(:, i) + &
+            s_val * binom_ratio * evaluated)
+    end do
+
+  end subroutine stable_steps
+
+  subroutine stable_inner( &
+       num_nodes, dimension_, nodes, period, s_val, evaluated)
+
+    ! Evaluates at a single ``s_val`` in ``[0, 1/2]`` for degrees of at least
+    ! ``period``, with ``nodes`` already divided by ``2**node_exponent``.
+    ! ``evaluated`` and ``(1 - s)**m`` are stored divided by
+    ! ``2**scale_exponent`` and ``rescale`` moves powers of two into
+    ! ``scale_exponent`` after every block of ``period`` steps.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: period
+    real(c_double), intent(in) :: s_val
+    real(c_double), intent(out) :: evaluated(dimension_)
+    ! Variables outside of signature.
+    real(c_double) :: one_less, one_less_pow
+    integer(c_int) :: degree, scale_exponent, block_start
+
+    degree = num_nodes - 1
+    one_less = 1.0_dp - s_val
+    one_less_pow = 1.0_dp
+    scale_exponent = 0
+    evaluated = nodes(:, num_nodes)
+    do block_start = degree, 1, -period
+       call stable_steps( &
+            num_nodes, dimension_, nodes, block_start, &
+            max(block_start - period + 1, 1), s_val, one_less, &
+            one_less_pow, evaluated)
+       call rescale(dimension_, evaluated, one_less_pow, scale_exponent)
+    end do
+    evaluated = scale(evaluated, scale_exponent)
+
+  end subroutine stable_inner
+
+  subroutine vs_algorithm_stable( &
+       num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm_stable')
+
+    ! Uses Horner's method in ``s / (1 - s)`` (as in ``vs_algorithm*``) but
+    ! multiplies by ``(1 - s)`` at every step and carries the ratio of
+    ! consecutive binomial coefficients rather than the coefficients
+    ! themselves. For ``s > 1/2`` the nodes are reversed and ``1 - s`` is
+    ! used instead so that ``s / (1 - s)`` never exceeds one.
+    !
+    ! Even so, ``(1 - s)**m`` and the accumulated value underflow for high
+    ! degrees (``2**(-m)`` is subnormal once ``m > 1022``), so from
+    ! ``rescale_period`` on, ``stable_inner`` periodically rescales them by a
+    ! power of two. This keeps the kernel accurate for any degree.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: evaluated(dimension_, num_vals)
+    ! Variables outside of signature.
+    real(c_double) :: one_less_pow
+    real(c_double), allocatable :: scaled(:, :), reversed(:, :)
+    integer(c_int) :: degree, period, node_shift, j
+
+    degree = num_nodes - 1
+    period = rescale_period(degree)
+    allocate(reversed(dimension_, num_nodes))
+    if (degree >= period) then
+       node_shift = node_exponent(num_nodes, dimension_, nodes)
+       allocate(scaled(dimension_, num_nodes))
+       scaled = scale(nodes, -node_shift)
+       reversed = scaled(:, num_nodes:1:-1)
+       do j = 1, num_vals
+          if (s_vals(j) <= 0.5_dp) then
+             call stable_inner( &
+                  num_nodes, dimension_, scaled, period, s_vals(j), &
+                  evaluated(:, j))
+          else
+             call stable_inner( &
+                  num_nodes, dimension_, reversed, period, &
+                  1.0_dp - s_vals(j), evaluated(:, j))
+          end if
+       end do
+       evaluated = scale(evaluated, node_shift)
+       return
+    end if
+
+    reversed = nodes(:, num_nodes:1:-1)
+    do j = 1, num_vals
+       one_less_pow = 1.0_dp
+       if (s_vals(j) <= 0.5_dp) then
+          evaluated(:, j) = nodes(:, num_nodes)
+          call stable_steps( &
+               num_nodes, dimension_, nodes, degree, 1, s_vals(j), &
+               1.0_dp - s_vals(j), one_less_pow, evaluated(:, j))
+       else
+          evaluated(:, j) = reversed(:, num_nodes)
+          call stable_steps( &
+               num_nodes, dimension_, reversed, degree, 1, &
+               1.0_dp - s_vals(j), s_vals(j), one_less_pow, evaluated(:, j))
+       end if
+    end do
+
+  end subroutine vs_algorithm_stable
+
+  subroutine vs_algorithm32_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm32_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call vs_algorithm32( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine vs_algorithm32_batch
+
+  subroutine vs_algorithm53_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm53_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call vs_algorithm53( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine vs_algorithm53_batch
+
+  subroutine vs_algorithm64_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm64_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call vs_algorithm64( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine vs_algorithm64_batch
+
+  subroutine vs_algorithm_stable_batch( &
+       num_nodes, dimension_, num_curves, nodes, num_vals, s_vals, &
+       evaluated) &
+       bind(c, name='BAKEOFF&
+       &OPT&
+       &_vs_algorithm_stable_batch')
+
+    integer(c_int), intent(in) :: num_nodes, dimension_, num_curves
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes, num_curves)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(dimension_, num_vals, num_curves)
+    ! Variables outside of signature.
+    integer(c_int) :: c
+
+    do c = 1, num_curves
+       call vs_algorithm_stable( &
+            num_nodes, dimension_, nodes(:, :, c), num_vals, s_vals, &
+            evaluated(:, :, c))
+    end do
+
+  end subroutine vs_algorithm_stable_batch
+
 end module vs_algorithm
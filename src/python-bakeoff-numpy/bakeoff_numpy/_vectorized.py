@@ -0,0 +1,387 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pure NumPy versions of the Fortran kernels.
+
+Each function has the same signature and (up to floating point
+associativity) the same arithmetic as the Fortran kernel of the same name.
+The suffix ``1``, ``2`` or ``3`` picks the memory layout of the
+workspace, exactly as in the Fortran modules:
+
+* ``1``: ``(k, d, N + 1)``
+* ``2``: ``(d, k, N + 1)``
+* ``3``: ``(d, N + 1, k)``
+
+(all Fortran-ordered). The arithmetic is always done on a ``(d, k, N + 1)``
+view of the workspace, so only the strides differ between layouts.
+"""
+
+import numpy as np
+
+
+__all__ = (
+    "do1",
+    "do2",
+    "do3",
+    "forall1",
+    "forall2",
+    "forall3",
+    "serial",
+    "spread1",
+    "spread2",
+    "spread3",
+    "vs_algorithm32",
+    "vs_algorithm53",
+    "vs_algorithm64",
+    "vs_algorithm_stable",
+)
+# NOTE: Each permutation is its own inverse, so it maps the ``(d, k, N + 1)``
+#       view shape to the storage shape **and** the storage back to the view.
+LAYOUT_AXES = {1: (1, 0, 2), 2: (0, 1, 2), 3: (0, 2, 1)}
+# NOTE: As in the Fortran kernel, the running values in
+#       ``vs_algorithm_stable`` are kept within ``2**(+/-RESCALE_BITS)``.
+RESCALE_BITS = 256
+RESCALE_MIN = 2.0 ** -RESCALE_BITS
+RESCALE_MAX = 2.0 ** RESCALE_BITS
+
+
+def _prepare_out(out, dimension, num_vals):
+    if out is None:
+        return np.empty((dimension, num_vals), order="F")
+
+    if out.shape != (dimension, num_vals):
+        raise ValueError(
+            "`out` has the wrong shape", out.shape, (dimension, num_vals)
+        )
+    return out
+
+
+def _new_workspace(dimension, num_vals, num_nodes, layout):
+    """Allocate a workspace and return a ``(d, k, N + 1)`` view of it."""
+    axes = LAYOUT_AXES[layout]
+    view_shape = (dimension, num_vals, num_nodes)
+    storage_shape = tuple(view_shape[axis] for axis in axes)
+    storage = np.empty(storage_shape, order="F")
+    return storage.transpose(axes)
+
+
+def _forall(nodes, s_vals, out, layout):
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    out = _prepare_out(out, dimension, num_vals)
+
+    # NOTE: Broadcasting against these views plays the role of the implicit
+    #       ``j`` index in the ``forall`` statement.
+    one_less = (1.0 - s_vals)[np.newaxis, :, np.newaxis]
+    broadcast_s = s_vals[np.newaxis, :, np.newaxis]
+    workspace = _new_workspace(dimension, num_vals, num_nodes, layout)
+    scratch = _new_workspace(dimension, num_vals, num_nodes, layout)
+
+    workspace[...] = nodes[:, np.newaxis, :]
+    for i in range(num_nodes - 1, 0, -1):
+        # NOTE: ``scratch`` must be filled before ``workspace[:, :, :i]`` is
+        #       updated since the two slices overlap.
+        np.multiply(
+            broadcast_s, workspace[:, :, 1 : i + 1], out=scratch[:, :, :i]
+        )
+        workspace[:, :, :i] *= one_less
+        workspace[:, :, :i] += scratch[:, :, :i]
+    out[...] = workspace[:, :, 0]
+
+    return out
+
+
+def forall1(nodes, s_vals, out=None):
+    return _forall(nodes, s_vals, out, 1)
+
+
+def forall2(nodes, s_vals, out=None):
+    return _forall(nodes, s_vals, out, 2)
+
+
+def forall3(nodes, s_vals, out=None):
+    return _forall(nodes, s_vals, out, 3)
+
+
+def _do(nodes, s_vals, out, layout):
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    out = _prepare_out(out, dimension, num_vals)
+
+    one_less = 1.0 - s_vals
+    workspace = _new_workspace(dimension, num_vals, num_nodes, layout)
+    scratch = np.empty((dimension, num_nodes), order="F")
+
+    for j in range(num_vals):
+        workspace[:, j, :] = nodes
+
+    for i in range(num_nodes - 1, 0, -1):
+        for j in range(num_vals):
+            np.multiply(
+                s_vals[j], workspace[:, j, 1 : i + 1], out=scratch[:, :i]
+            )
+            workspace[:, j, :i] *= one_less[j]
+            workspace[:, j, :i] += scratch[:, :i]
+    out[...] = workspace[:, :, 0]
+
+    return out
+
+
+def do1(nodes, s_vals, out=None):
+    return _do(nodes, s_vals, out, 1)
+
+
+def do2(nodes, s_vals, out=None):
+    return _do(nodes, s_vals, out, 2)
+
+
+def do3(nodes, s_vals, out=None):
+    return _do(nodes, s_vals, out, 3)
+
+
+def _spread(nodes, s_vals, out, layout):
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    out = _prepare_out(out, dimension, num_vals)
+
+    # NOTE: Unlike ``_forall()``, the broadcast arrays are materialized (as
+    #       ``SPREAD()`` does in Fortran) in the same layout as the workspace.
+    broadcast_s = _new_workspace(dimension, num_vals, num_nodes, layout)
+    broadcast_one_less = _new_workspace(
+        dimension, num_vals, num_nodes, layout
+    )
+    workspace = _new_workspace(dimension, num_vals, num_nodes, layout)
+    scratch = _new_workspace(dimension, num_vals, num_nodes, layout)
+
+    broadcast_s[...] = s_vals[np.newaxis, :, np.newaxis]
+    broadcast_one_less[...] = (1.0 - s_vals)[np.newaxis, :, np.newaxis]
+    workspace[...] = nodes[:, np.newaxis, :]
+    for i in range(num_nodes - 1, 0, -1):
+        np.multiply(
+            broadcast_s[:, :, 1 : i + 1],
+            workspace[:, :, 1 : i + 1],
+            out=scratch[:, :, :i],
+        )
+        workspace[:, :, :i] *= broadcast_one_less[:, :, :i]
+        workspace[:, :, :i] += scratch[:, :, :i]
+    out[...] = workspace[:, :, 0]
+
+    return out
+
+
+def spread1(nodes, s_vals, out=None):
+    return _spread(nodes, s_vals, out, 1)
+
+
+def spread2(nodes, s_vals, out=None):
+    return _spread(nodes, s_vals, out, 2)
+
+
+def spread3(nodes, s_vals, out=None):
+    return _spread(nodes, s_vals, out, 3)
+
+
+def serial(nodes, s_vals, out=None):
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    out = _prepare_out(out, dimension, num_vals)
+
+    workspace = np.empty((dimension, num_nodes), order="F")
+    scratch = np.empty((dimension, num_nodes), order="F")
+    for j in range(num_vals):
+        s_val = s_vals[j]
+        one_less = 1.0 - s_val
+        workspace[...] = nodes
+        for i in range(num_nodes - 1, 0, -1):
+            np.multiply(s_val, workspace[:, 1 : i + 1], out=scratch[:, :i])
+            workspace[:, :i] *= one_less
+            workspace[:, :i] += scratch[:, :i]
+        out[:, j] = workspace[:, 0]
+
+    return out
+
+
+def _as_signed(value, bits):
+    """Wrap a Python integer to a ``bits``-bit two's complement integer."""
+    value &= (1 << bits) - 1
+    if value >= 1 << (bits - 1):
+        value -= 1 << bits
+    return value
+
+
+def _truncated_divide(numerator, denominator):
+    """Integer division that rounds towards zero (as Fortran does)."""
+    quotient = abs(numerator) // denominator
+    return quotient if numerator >= 0 else -quotient
+
+
+def _vs_algorithm(nodes, s_vals, out, next_binom):
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    evaluated = _prepare_out(out, dimension, num_vals)
+
+    one_less = 1.0 - s_vals
+    s_pow = np.ones(num_vals)
+    binom_val = 1
+
+    np.multiply(one_less, nodes[:, :1], out=evaluated)
+    for i in range(2, num_nodes):
+        s_pow *= s_vals
+        binom_val = next_binom(binom_val, num_nodes - i + 1, i - 1)
+        evaluated += (float(binom_val) * s_pow) * nodes[:, i - 1 : i]
+        evaluated *= one_less
+
+    evaluated += (s_pow * s_vals) * nodes[:, num_nodes - 1 : num_nodes]
+
+    return evaluated
+
+
+def _next_binom32(binom_val, numerator, denominator):
+    product = _as_signed(binom_val * numerator, 32)
+    return _truncated_divide(product, denominator)
+
+
+def _next_binom53(binom_val, numerator, denominator):
+    return (binom_val * numerator) / denominator
+
+
+def _next_binom64(binom_val, numerator, denominator):
+    product = _as_signed(binom_val * numerator, 64)
+    return _truncated_divide(product, denominator)
+
+
+def vs_algorithm32(nodes, s_vals, out=None):
+    return _vs_algorithm(nodes, s_vals, out, _next_binom32)
+
+
+def vs_algorithm53(nodes, s_vals, out=None):
+    return _vs_algorithm(nodes, s_vals, out, _next_binom53)
+
+
+def vs_algorithm64(nodes, s_vals, out=None):
+    return _vs_algorithm(nodes, s_vals, out, _next_binom64)
+
+
+def _rescale_period(degree):
+    """The number of steps between calls to :func:`_rescale`.
+
+    Mirrors ``rescale_period`` in ``vs_algorithm.f90``.
+    """
+    _, exponent = np.frexp(float(max(degree, 2)))
+    return 512 // int(exponent)
+
+
+def _node_exponent(nodes):
+    """The power of two that brings the largest node into ``[1/2, 1)``.
+
+    Mirrors ``node_exponent`` in ``vs_algorithm.f90``.
+    """
+    largest = np.max(np.abs(nodes))
+    # NOTE: Leave zero, ``NaN`` and infinite values alone.
+    if not 0.0 < largest < np.inf:
+        return 0
+
+    _, shift = np.frexp(largest)
+    return int(shift)
+
+
+def _rescale(evaluated, one_less_pow, scale_exponent):
+    """Move powers of two from the running values into ``scale_exponent``.
+
+    Mirrors ``rescale`` in ``vs_algorithm.f90``: for each value of ``s``
+    where the largest of ``evaluated`` and ``one_less_pow`` has left
+    ``[RESCALE_MIN, RESCALE_MAX]``, both are multiplied (exactly) by the
+    power of two that brings it back near one.
+    """
+    largest = np.maximum(np.max(np.abs(evaluated), axis=0), one_less_pow)
+    drifted = (largest < RESCALE_MIN) | (largest > RESCALE_MAX)
+    # NOTE: Leave ``NaN`` and infinite values alone.
+    drifted &= np.isfinite(largest)
+    if not np.any(drifted):
+        return
+
+    _, shift = np.frexp(largest)
+    shift = np.where(drifted, shift, 0)
+    evaluated[...] = np.ldexp(evaluated, -shift)
+    one_less_pow[...] = np.ldexp(one_less_pow, -shift)
+    scale_exponent += shift
+
+
+def _stable_steps(nodes, s_vals, one_less, first, last, one_less_pow, out):
+    """Run the steps ``first, first - 1, ..., last`` of the recurrence."""
+    _, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    for i in range(first, last - 1, -1):
+        one_less_pow *= one_less
+        binom_ratio = (degree - i + 1) / i
+        out *= s_vals * binom_ratio
+        out += one_less_pow * nodes[:, i - 1 : i]
+
+
+def _stable_half(nodes, s_vals, one_less):
+    """Evaluate the scaled Horner recurrence for ``s_vals`` in ``[0, 1/2]``.
+
+    As in the Fortran kernel, for degrees of at least
+    :func:`_rescale_period` the nodes are divided by ``2**node_exponent``
+    and the running values are rescaled after every ``period`` steps so
+    that nothing underflows.
+    """
+    dimension, num_nodes = nodes.shape
+    degree = num_nodes - 1
+
+    one_less_pow = np.ones(s_vals.shape)
+    evaluated = np.empty((dimension,) + s_vals.shape, order="F")
+    period = _rescale_period(degree)
+    if degree < period:
+        evaluated[...] = nodes[:, degree : degree + 1]
+        _stable_steps(
+            nodes, s_vals, one_less, degree, 1, one_less_pow, evaluated
+        )
+        return evaluated
+
+    node_shift = _node_exponent(nodes)
+    nodes = np.ldexp(nodes, -node_shift)
+    # NOTE: ``evaluated`` and ``one_less_pow`` are stored divided by
+    #       ``2**scale_exponent``.
+    scale_exponent = np.full(s_vals.shape, node_shift)
+    evaluated[...] = nodes[:, degree : degree + 1]
+    for block_start in range(degree, 0, -period):
+        block_end = max(block_start - period + 1, 1)
+        _stable_steps(
+            nodes,
+            s_vals,
+            one_less,
+            block_start,
+            block_end,
+            one_less_pow,
+            evaluated,
+        )
+        _rescale(evaluated, one_less_pow, scale_exponent)
+
+    return np.ldexp(evaluated, scale_exponent)
+
+
+def vs_algorithm_stable(nodes, s_vals, out=None):
+    dimension, _ = nodes.shape
+    (num_vals,) = s_vals.shape
+    out = _prepare_out(out, dimension, num_vals)
+
+    lower = s_vals <= 0.5
+    upper = ~lower
+    out[:, lower] = _stable_half(nodes, s_vals[lower], 1.0 - s_vals[lower])
+    # NOTE: For ``s > 1/2`` the nodes are reversed and the roles of ``s`` and
+    #       ``1 - s`` are swapped so that ``s / (1 - s)`` never exceeds one.
+    out[:, upper] = _stable_half(
+        nodes[:, ::-1], 1.0 - s_vals[upper], s_vals[upper]
+    )
+
+    return out
@@ -0,0 +1,28 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import setuptools
+
+
+def main():
+    # NOTE: Unlike ``bakeoff`` and ``bakeoff_opt`` there is no extension
+    #       module, so this does not need ``setup_shared.py`` (or
+    #       ``gfortran``).
+    setuptools.setup(
+        name="bakeoff_numpy",
+        packages=["bakeoff_numpy"],
+        install_requires=["numpy"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import fractions
+
+import numpy as np
+
+import bakeoff_numpy
+
+
+def exact_bernstein(nodes, s_val):
+    """Evaluate a curve exactly (with rational arithmetic), then round.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, shape ``(d, N + 1)``.
+        s_val (float): The value of ``s``.
+
+    Returns:
+        numpy.ndarray: The (correctly rounded) point on the curve.
+    """
+    _, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    s_exact = fractions.Fraction(s_val)
+    one_less = 1 - s_exact
+    weights = []
+    binom = 1
+    for j in range(num_nodes):
+        weights.append(binom * s_exact ** j * one_less ** (degree - j))
+        binom = binom * (degree - j) // (j + 1)
+    return np.array(
+        [
+            float(
+                sum(
+                    weight * fractions.Fraction(node)
+                    for weight, node in zip(weights, row)
+                )
+            )
+            for row in nodes
+        ]
+    )
+
+
+def main():
+    print(f"Verifying: {bakeoff_numpy}")
+    functions = (
+        bakeoff_numpy.forall1,
+        bakeoff_numpy.forall2,
+        bakeoff_numpy.forall3,
+        bakeoff_numpy.do1,
+        bakeoff_numpy.do2,
+        bakeoff_numpy.do3,
+        bakeoff_numpy.spread1,
+        bakeoff_numpy.spread2,
+        bakeoff_numpy.spread3,
+        bakeoff_numpy.serial,
+        bakeoff_numpy.vs_algorithm32,
+        bakeoff_numpy.vs_algorithm53,
+        bakeoff_numpy.vs_algorithm64,
+        bakeoff_numpy.vs_algorithm_stable,
+    )
+    nodes = np.asfortranarray([[1.0, 1.0, 2.0, 2.0], [0.0, 1.0, 0.0, 1.0]])
+    s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+    expected = np.asfortranarray([[1.0, 1.5, 2.0], [0.0, 0.5, 1.0]])
+    for fn in functions:
+        evaluated = fn(nodes, s_vals)
+        assert np.all(evaluated == expected)
+        print(f"Verified: {fn.__name__}")
+
+    # NOTE: Every kernel does the same arithmetic per value of ``s`` (just
+    #       with a different memory layout), so on a larger input they agree
+    #       with ``serial`` up to the reassociation in ``vs_algorithm*``.
+    random_state = np.random.RandomState(seed=1071373349)
+    nodes = np.asfortranarray(random_state.uniform(-1.0, 1.0, size=(3, 17)))
+    s_vals = np.linspace(0.0, 1.0, 65)
+    expected = bakeoff_numpy.serial(nodes, s_vals)
+    for fn in functions:
+        evaluated = fn(nodes, s_vals)
+        assert np.allclose(evaluated, expected, rtol=0.0, atol=1e-13)
+    print("Verified: agreement with `serial`")
+
+    out = np.empty(expected.shape, order="F")
+    for fn in functions:
+        evaluated = fn(nodes, s_vals, out=out)
+        assert evaluated is out
+        assert np.allclose(out, expected, rtol=0.0, atol=1e-13)
+    try:
+        bakeoff_numpy.serial(nodes, s_vals, out=out[:, 1:])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("`out` with the wrong shape was accepted")
+    print("Verified: out=")
+
+    # NOTE: For these degrees ``(1 - s)**N`` underflows (e.g. ``2**(-1024)``
+    #       at ``s = 1/2``), so this exercises the rescaling in
+    #       ``vs_algorithm_stable``.
+    s_vals = np.linspace(0.0, 1.0, 9)
+    for degree in (1024, 2048):
+        nodes = np.asfortranarray(
+            random_state.uniform(-1000.0, 1000.0, size=(2, degree + 1))
+        )
+        expected = np.column_stack(
+            [exact_bernstein(nodes, s_val) for s_val in s_vals]
+        )
+        evaluated = bakeoff_numpy.vs_algorithm_stable(nodes, s_vals)
+        scale = np.max(np.abs(nodes))
+        assert np.allclose(evaluated, expected, rtol=0.0, atol=1e-13 * scale)
+    print("Verified: vs_algorithm_stable (high degree)")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,3 +11,25 @@
 # limitations under the License.
 
 from bakeoff_opt._binary import *
+from bakeoff_opt._blocked import evaluate_blocked
+from bakeoff_opt._dispatch import CANDIDATES
+from bakeoff_opt._dispatch import VS_MAX_DEGREE
+from bakeoff_opt._dispatch import evaluate
+from bakeoff_opt._dispatch import load_tuning_table
+from bakeoff_opt._dispatch import save_tuning_table
+from bakeoff_opt._dispatch import select_kernel
+from bakeoff_opt._dispatch import tuning_table_path
+from bakeoff_opt._flatten import DEFAULT_MAX_DEPTH
+from bakeoff_opt._flatten import flatness_bound
+from bakeoff_opt._flatten import flatten
+from bakeoff_opt._plan import BernsteinPlan
+from bakeoff_opt._plan import get_plan
+from bakeoff_opt._project import DEFAULT_NUM_GRID
+from bakeoff_opt._project import DEFAULT_NUM_ITERATIONS
+from bakeoff_opt._project import DEFAULT_PROJECT_CHUNK_SIZE
+from bakeoff_opt._project import project
+from bakeoff_opt._stream import DEFAULT_CHUNK_SIZE
+from bakeoff_opt._stream import evaluate_stream
+from bakeoff_opt._stream import evaluate_stream_into
+from bakeoff_opt._stream import iter_chunks
+from bakeoff_opt._surface import surface_grid
@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import numpy as np
+
+from . import _binary
+from . import _dispatch
+
+
+# NOTE: Pieces are never split below a width of ``2**-DEFAULT_MAX_DEPTH``,
+#       so an unreachable tolerance (e.g. one below the rounding error in
+#       the nodes) still terminates.
+DEFAULT_MAX_DEPTH = 24
+# NOTE: Splitting a piece into at most this many parts per round keeps the
+#       first few rounds from committing to a uniform split based on the
+#       flattest (or least flat) part of the curve.
+MAX_PARTS = 8
+
+
+def flatness_bound(pieces):
+    """Bound the distance from each curve in a batch to its chord.
+
+    For a degree ``N`` curve with control points ``Q_0, ..., Q_N``, the
+    distance between ``B(t)`` and ``(1 - t) Q_0 + t Q_N`` is at most
+    ``N (N - 1) / 8`` times the largest second difference
+    ``|Q_{i + 2} - 2 Q_{i + 1} + Q_i|``, so this also bounds the chordal
+    error of replacing the curve with a line segment.
+
+    Args:
+        pieces (numpy.ndarray): The nodes of the curves, with shape
+            ``(d, N + 1, m)`` (e.g. from :func:`subdivide_many`).
+
+    Returns:
+        numpy.ndarray: The bound for each curve, with shape ``(m,)``.
+    """
+    _, num_nodes, num_pieces = pieces.shape
+    degree = num_nodes - 1
+    if degree < 2:
+        return np.zeros(num_pieces)
+
+    second_differences = (
+        pieces[:, 2:, :] - 2.0 * pieces[:, 1:-1, :] + pieces[:, :-2, :]
+    )
+    lengths = np.sqrt(np.sum(second_differences * second_differences, axis=0))
+    return 0.125 * degree * (degree - 1) * np.max(lengths, axis=0)
+
+
+def flatten(nodes, tolerance, kernel=None, max_depth=DEFAULT_MAX_DEPTH):
+    """Approximate a curve with a polyline, to within a chordal tolerance.
+
+    Starting from the whole curve, every piece whose
+    :func:`flatness_bound` exceeds ``tolerance`` is split into ``m`` equal
+    parts, where ``m = ceil(sqrt(bound / tolerance))`` (clipped to
+    ``[2, MAX_PARTS]``) is the number of parts expected to bring the
+    bound under ``tolerance``. Each round re-uses :func:`subdivide_many`
+    to get the control points of every piece. The ends of the pieces are
+    then evaluated in a single call to ``kernel``.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        tolerance (float): The largest allowed distance between the curve
+            and the polyline.
+        kernel (Optional[str]): The name of the kernel to use (e.g.
+            ``serial``). Defaults to :func:`select_kernel` for the chosen
+            values.
+        max_depth (Optional[int]): Pieces are never split below a width
+            (in ``s``) of ``0.5**max_depth``; a piece that is still too far
+            from its chord at that width is kept as is.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The polyline vertices, with
+        shape ``(d, k)``, and the (sorted) parameter values they are
+        evaluated at, with shape ``(k,)``.
+
+    Raises:
+        ValueError: If ``tolerance`` is not positive.
+    """
+    if not tolerance > 0.0:
+        raise ValueError("`tolerance` must be positive", tolerance)
+
+    dimension, num_nodes = nodes.shape
+    s_vals = np.array([0.0, 1.0])
+    min_width = 0.5 ** max_depth
+    while True:
+        pieces = _binary.subdivide_many(nodes, s_vals[1:-1])
+        bounds = flatness_bound(pieces)
+        widths = np.diff(s_vals)
+        too_far = (bounds > tolerance) & (widths > min_width)
+        if not np.any(too_far):
+            break
+
+        # NOTE: The second differences of a piece of width ``h`` shrink
+        #       like ``h**2``, so splitting a piece into ``m`` equal parts
+        #       divides its bound by roughly ``m**2``.
+        num_parts = np.ceil(np.sqrt(bounds[too_far] / tolerance))
+        num_parts = np.minimum(
+            np.clip(num_parts, 2.0, MAX_PARTS), widths[too_far] / min_width
+        ).astype(int)
+        starts = np.repeat(s_vals[:-1][too_far], num_parts - 1)
+        steps = np.repeat(widths[too_far] / num_parts, num_parts - 1)
+        # NOTE: The index of each new value within its piece, from 1 to
+        #       ``num_parts - 1``.
+        offsets = np.cumsum(num_parts - 1) - (num_parts - 1)
+        within = np.arange(starts.size) - np.repeat(offsets, num_parts - 1)
+        new_s_vals = starts + (within + 1) * steps
+        s_vals = np.sort(np.concatenate([s_vals, new_s_vals]))
+
+    (num_vals,) = s_vals.shape
+    if kernel is None:
+        kernel = _dispatch.select_kernel(dimension, num_nodes, num_vals)
+    polyline = getattr(_binary, kernel)(nodes, s_vals)
+    return polyline, s_vals
@@ -0,0 +1,128 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import functools
+
+import numpy as np
+
+from . import _binary
+
+
+PLAN_CACHE_SIZE = 64
+
+
+class BernsteinPlan:
+    """Precomputed Bernstein basis for a fixed degree and ``s_vals`` grid.
+
+    Evaluating a curve is linear in its nodes, so once the
+    ``(N + 1, k)`` basis matrix
+
+    .. math::
+
+       B_{j, i} = \\binom{N}{j} (1 - s_i)^{N - j} s_i^j
+
+    is known, any curve of degree ``N`` can be evaluated at the same
+    ``s_vals`` with a single matrix multiply ``nodes @ basis``.
+
+    The basis is computed by the ``serial`` kernel (i.e. via de Casteljau
+    applied to the columns of the identity), so it does not suffer from the
+    binomial overflow of the ``vs_algorithm*`` kernels.
+
+    Args:
+        num_nodes (int): The number of nodes ``N + 1``.
+        s_vals (numpy.ndarray): The parameter values to evaluate at, with
+            shape ``(k,)``.
+    """
+
+    def __init__(self, num_nodes, s_vals):
+        self.num_nodes = num_nodes
+        self.s_vals = np.array(s_vals, dtype=np.float64)
+        identity = np.eye(num_nodes, order="F")
+        self.basis = _binary.serial(identity, self.s_vals)
+        # NOTE: Plans are shared via ``get_plan()``, so guard against
+        #       accidental modification.
+        self.s_vals.setflags(write=False)
+        self.basis.setflags(write=False)
+
+    def evaluate(self, nodes, out=None):
+        """Evaluate a curve at the planned ``s_vals``.
+
+        Args:
+            nodes (numpy.ndarray): The nodes of the curve, with shape
+                ``(d, N + 1)``.
+            out (Optional[numpy.ndarray]): A Fortran-ordered array with shape
+                ``(d, k)`` to write the result into.
+
+        Returns:
+            numpy.ndarray: The evaluated points, with shape ``(d, k)``.
+        """
+        if out is None:
+            dimension, _ = nodes.shape
+            out = np.empty((dimension, self.basis.shape[1]), order="F")
+        return np.matmul(nodes, self.basis, out=out)
+
+    def evaluate_batch(self, nodes, out=None):
+        """Evaluate a stack of curves at the planned ``s_vals``.
+
+        Args:
+            nodes (numpy.ndarray): The nodes of the curves, a
+                Fortran-ordered array with shape ``(d, N + 1, num_curves)``
+                (the same layout used by the ``*_batch`` kernels).
+            out (Optional[numpy.ndarray]): A Fortran-ordered array with shape
+                ``(d, k, num_curves)`` to write the result into.
+
+        Returns:
+            numpy.ndarray: The evaluated points, with shape
+            ``(d, k, num_curves)``.
+        """
+        dimension, _, num_curves = nodes.shape
+        if out is None:
+            out = np.empty(
+                (dimension, self.basis.shape[1], num_curves), order="F"
+            )
+        # NOTE: Moving the curve axis to the front turns both arrays into a
+        #       stack of Fortran-ordered matrices (without copying), which
+        #       ``matmul`` hands to BLAS one curve at a time.
+        np.matmul(
+            nodes.transpose(2, 0, 1),
+            self.basis,
+            out=out.transpose(2, 0, 1),
+        )
+        return out
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_plan(num_nodes, s_vals_bytes):
+    s_vals = np.frombuffer(s_vals_bytes, dtype=np.float64)
+    return BernsteinPlan(num_nodes, s_vals)
+
+
+def get_plan(num_nodes, s_vals):
+    """Get a (possibly cached) plan for a degree and ``s_vals`` grid.
+
+    Plans are kept in an LRU cache keyed on ``num_nodes`` and the raw bytes
+    of ``s_vals``, so repeated calls with an identical grid (e.g. the same
+    ``np.linspace(0.0, 1.0, k)``) share a basis matrix.
+
+    Args:
+        num_nodes (int): The number of nodes ``N + 1``.
+        s_vals (numpy.ndarray): The parameter values to evaluate at, with
+            shape ``(k,)``.
+
+    Returns:
+        BernsteinPlan: The plan for ``num_nodes`` and ``s_vals``.
+    """
+    s_vals = np.ascontiguousarray(s_vals, dtype=np.float64)
+    return _cached_plan(num_nodes, s_vals.tobytes())
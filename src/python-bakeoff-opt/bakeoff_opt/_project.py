@@ -0,0 +1,166 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import concurrent.futures
+import os
+
+import numpy as np
+
+from . import _binary
+from . import _dispatch
+
+
+DEFAULT_NUM_GRID = 65
+DEFAULT_NUM_ITERATIONS = 8
+# NOTE: Each chunk needs a ``(num_grid, chunk_size)`` array of squared
+#       distances for the initial guess (4 MiB with the defaults).
+DEFAULT_PROJECT_CHUNK_SIZE = 8192
+
+
+def _squared_distances(points, queries):
+    differences = points - queries
+    return np.sum(differences * differences, axis=0)
+
+
+def _project_chunk(
+    evaluate,
+    nodes,
+    grid_s,
+    grid_points,
+    queries,
+    num_iterations,
+    s_vals,
+    closest,
+):
+    # NOTE: The nearest point of the coarse grid is the initial guess.
+    distances = np.sum(grid_points * grid_points, axis=0)[:, np.newaxis] - (
+        2.0 * grid_points.T @ queries
+    )
+    nearest = np.argmin(distances, axis=0)
+    s_vals[:] = grid_s[nearest]
+    grid_distances = _squared_distances(grid_points[:, nearest], queries)
+
+    # NOTE: Newton's method for a critical point of the squared distance
+    #       ``f(s) = |B(s) - q|^2 / 2``, i.e. a zero of
+    #       ``f'(s) = (B(s) - q) . B'(s)``.
+    for _ in range(num_iterations):
+        evaluated, first, second = _binary.serial_with_derivative(
+            nodes, s_vals, second_derivative=True
+        )
+        differences = evaluated - queries
+        gradient = np.sum(differences * first, axis=0)
+        hessian = np.sum(first * first + differences * second, axis=0)
+        # NOTE: Where ``f`` isn't convex, Newton's method would head for a
+        #       maximum, so those values stay where they are.
+        step = np.where(hessian > 0.0, gradient / hessian, 0.0)
+        updated = np.clip(s_vals - step, 0.0, 1.0)
+        converged = np.all(updated == s_vals)
+        s_vals[:] = updated
+        if converged:
+            break
+
+    evaluate(nodes, s_vals, out=closest)
+    # NOTE: Newton's method may end up at a (worse) local minimum than the
+    #       grid point it started from.
+    worse = _squared_distances(closest, queries) > grid_distances
+    s_vals[worse] = grid_s[nearest[worse]]
+    closest[:, worse] = grid_points[:, nearest[worse]]
+
+
+def project(
+    nodes,
+    points,
+    num_grid=DEFAULT_NUM_GRID,
+    num_iterations=DEFAULT_NUM_ITERATIONS,
+    chunk_size=DEFAULT_PROJECT_CHUNK_SIZE,
+    num_threads=None,
+):
+    """Find the closest point on a curve to each of many query points.
+
+    The curve is evaluated once on a uniform grid of ``num_grid`` values
+    and the nearest grid point is the initial guess for each query. Then
+    (a fixed number of) Newton iterations on the squared distance are done
+    for a whole chunk of queries at a time, each one a single batched call
+    to ``serial_with_derivative``. Chunks are independent and are handed
+    to a pool of threads (the kernels release the GIL).
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        points (numpy.ndarray): The query points, with shape ``(d, k)``.
+        num_grid (Optional[int]): The number of values in the coarse grid.
+            The projection can only be trusted if every local minimum of
+            the distance is near a grid point.
+        num_iterations (Optional[int]): The largest number of Newton
+            iterations.
+        chunk_size (Optional[int]): The number of queries in each chunk.
+        num_threads (Optional[int]): The number of threads. Defaults to
+            :func:`os.cpu_count` (or one if that is unknown).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The parameter values of the
+        closest points, with shape ``(k,)``, and the closest points
+        themselves, with shape ``(d, k)``.
+
+    Raises:
+        ValueError: If ``num_grid`` is less than two or if ``chunk_size``
+            or ``num_threads`` is not positive.
+    """
+    if num_grid < 2:
+        raise ValueError("`num_grid` must be at least 2", num_grid)
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be positive", chunk_size)
+    if num_threads is None:
+        # NOTE: ``os.cpu_count()`` is ``None`` if the count is unknown.
+        num_threads = os.cpu_count() or 1
+    if num_threads < 1:
+        raise ValueError("`num_threads` must be positive", num_threads)
+
+    dimension, num_nodes = nodes.shape
+    points = np.asfortranarray(points, dtype=np.float64)
+    _, num_points = points.shape
+
+    grid_s = np.linspace(0.0, 1.0, num_grid)
+    kernel = _dispatch.select_kernel(dimension, num_nodes, num_grid)
+    grid_points = getattr(_binary, kernel)(nodes, grid_s)
+    kernel = _dispatch.select_kernel(dimension, num_nodes, chunk_size)
+    evaluate = getattr(_binary, kernel)
+
+    s_vals = np.empty(num_points)
+    closest = np.empty((dimension, num_points), order="F")
+
+    def project_chunk(start):
+        stop = min(start + chunk_size, num_points)
+        _project_chunk(
+            evaluate,
+            nodes,
+            grid_s,
+            grid_points,
+            points[:, start:stop],
+            num_iterations,
+            s_vals[start:stop],
+            closest[:, start:stop],
+        )
+
+    starts = range(0, num_points, chunk_size)
+    if num_threads == 1 or num_points <= chunk_size:
+        for start in starts:
+            project_chunk(start)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+            # NOTE: Consume the results so exceptions are re-raised.
+            list(executor.map(project_chunk, starts))
+
+    return s_vals, closest
@@ -0,0 +1,171 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import numpy as np
+
+from . import _binary
+from . import _dispatch
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def iter_chunks(s_vals, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Split a stream of ``s``-values into contiguous ``float64`` chunks.
+
+    An array (e.g. a ``numpy.memmap``) is sliced, so only one chunk at a
+    time is read into memory. Any other iterable may yield scalars or
+    1D arrays of any length. Either way, the values are copied into a
+    single reused buffer of ``chunk_size`` values (which also makes a
+    read-only memory-mapped file usable by the kernels).
+
+    Args:
+        s_vals (Union[numpy.ndarray, Iterable]): The parameter values.
+        chunk_size (Optional[int]): The number of values in each chunk
+            (the last chunk may be shorter).
+
+    Yields:
+        numpy.ndarray: The contiguous chunks. Each chunk is a view of the
+        reused buffer, so it is only valid until the next chunk is
+        requested.
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be positive", chunk_size)
+
+    buffer = np.empty(chunk_size)
+    if isinstance(s_vals, np.ndarray):
+        (num_vals,) = s_vals.shape
+        for start in range(0, num_vals, chunk_size):
+            chunk = s_vals[start : start + chunk_size]
+            (size,) = chunk.shape
+            buffer[:size] = chunk
+            yield buffer[:size]
+        return
+
+    filled = 0
+    for item in s_vals:
+        values = np.asarray(item, dtype=np.float64).reshape(-1)
+        while values.size:
+            count = min(chunk_size - filled, values.size)
+            buffer[filled : filled + count] = values[:count]
+            filled += count
+            values = values[count:]
+            if filled == chunk_size:
+                yield buffer
+                filled = 0
+
+    if filled:
+        yield buffer[:filled]
+
+
+def _get_kernel(kernel, dimension, num_nodes, chunk_size):
+    if kernel is None:
+        kernel = _dispatch.select_kernel(dimension, num_nodes, chunk_size)
+    return getattr(_binary, kernel)
+
+
+def evaluate_stream(
+    nodes, s_vals, kernel=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Evaluate a curve over a stream of ``s``-values, one chunk at a time.
+
+    Peak memory is bounded by ``chunk_size`` (the input chunk, one reused
+    ``(d, chunk_size)`` output buffer and the kernel workspace) no matter
+    how many values are in the stream.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        s_vals (Union[numpy.ndarray, Iterable]): The parameter values, see
+            :func:`iter_chunks`.
+        kernel (Optional[str]): The name of the kernel to use (e.g.
+            ``serial``). Defaults to :func:`select_kernel` for a chunk.
+        chunk_size (Optional[int]): The number of values in each chunk.
+
+    Yields:
+        Tuple[int, numpy.ndarray]: The index of the first value in the
+        chunk and the evaluated points, with shape ``(d, chunk)``. The
+        points are a view of the reused output buffer, so they are only
+        valid until the next chunk is requested.
+    """
+    dimension, num_nodes = nodes.shape
+    fn = _get_kernel(kernel, dimension, num_nodes, chunk_size)
+
+    buffer = np.empty((dimension, chunk_size), order="F")
+    start = 0
+    for chunk in iter_chunks(s_vals, chunk_size=chunk_size):
+        (size,) = chunk.shape
+        # NOTE: Column slices of a Fortran-ordered array are contiguous, so
+        #       the kernel can write into the buffer directly.
+        evaluated = fn(nodes, chunk, out=buffer[:, :size])
+        yield start, evaluated
+        start += size
+
+
+def evaluate_stream_into(
+    nodes, s_vals, out, kernel=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Evaluate a curve over a stream of ``s``-values into ``out``.
+
+    Typically ``out`` is a memory-mapped array, e.g. from
+    ``numpy.lib.format.open_memmap(..., fortran_order=True)``, so that
+    neither the input nor the output needs to fit in memory.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        s_vals (Union[numpy.ndarray, Iterable]): The parameter values, see
+            :func:`iter_chunks`.
+        out (numpy.ndarray): The array to write the points into, with shape
+            ``(d, k)``. If it is Fortran-ordered, chunks are evaluated in
+            place rather than copied from a buffer.
+        kernel (Optional[str]): The name of the kernel to use (e.g.
+            ``serial``). Defaults to :func:`select_kernel` for a chunk.
+        chunk_size (Optional[int]): The number of values in each chunk.
+
+    Returns:
+        numpy.ndarray: ``out``.
+
+    Raises:
+        ValueError: If the number of values in ``s_vals`` is not the
+            number of columns of ``out``.
+    """
+    dimension, num_nodes = nodes.shape
+    _, num_vals = out.shape
+
+    start = 0
+    if out.flags.f_contiguous:
+        fn = _get_kernel(kernel, dimension, num_nodes, chunk_size)
+        for chunk in iter_chunks(s_vals, chunk_size=chunk_size):
+            (size,) = chunk.shape
+            if start + size > num_vals:
+                raise ValueError("`s_vals` has more values than `out`")
+            fn(nodes, chunk, out=out[:, start : start + size])
+            start += size
+    else:
+        for offset, evaluated in evaluate_stream(
+            nodes, s_vals, kernel=kernel, chunk_size=chunk_size
+        ):
+            _, size = evaluated.shape
+            start = offset + size
+            if start > num_vals:
+                raise ValueError("`s_vals` has more values than `out`")
+            out[:, offset:start] = evaluated
+
+    if start != num_vals:
+        raise ValueError(
+            "`s_vals` has fewer values than `out`", start, num_vals
+        )
+    return out
@@ -84,9 +84,34 @@ def get_extra_objects(here):
         os.path.join(here, "object_files", "spread_.o"),
         os.path.join(here, "object_files", "serial_.o"),
         os.path.join(here, "object_files", "vs_algorithm.o"),
+        os.path.join(here, "object_files", "derivative_.o"),
+        os.path.join(here, "object_files", "strided_.o"),
+        os.path.join(here, "object_files", "specialized_.o"),
+        os.path.join(here, "object_files", "subdivide_.o"),
+        os.path.join(here, "object_files", "surface_.o"),
+        os.path.join(here, "object_files", "compensated_.o"),
+        os.path.join(here, "object_files", "simd_.o"),
+        os.path.join(here, "object_files", "tiled_.o"),
+        os.path.join(here, "object_files", "build_info.o"),
     )
 
 
+def get_extra_link_args():
+    """Get linker flags needed by the Fortran object files.
+
+    If the object files were compiled with ``-fopenmp`` (signaled by a
+    non-empty ``OPENMP`` environment variable, as set by the ``Makefile``)
+    then the extension must also link against the OpenMP runtime.
+
+    Returns:
+        List[str]: The extra linker flags.
+    """
+    if os.environ.get("OPENMP"):
+        return ["-fopenmp"]
+
+    return []
+
+
 def extension_modules(here, name):
     extra_objects = get_extra_objects(here)
     missing = [path for path in extra_objects if not os.path.isfile(path)]
@@ -115,6 +140,7 @@ def extension_modules(here, name):
         include_dirs=[np.get_include()],
         libraries=["gfortran"],
         library_dirs=gfortran_search_path(),
+        extra_link_args=get_extra_link_args(),
     )
     return [extension]
 
@@ -11,3 +11,25 @@
 # limitations under the License.
 
 from bakeoff._binary import *
+from bakeoff._blocked import evaluate_blocked
+from bakeoff._dispatch import CANDIDATES
+from bakeoff._dispatch import VS_MAX_DEGREE
+from bakeoff._dispatch import evaluate
+from bakeoff._dispatch import load_tuning_table
+from bakeoff._dispatch import save_tuning_table
+from bakeoff._dispatch import select_kernel
+from bakeoff._dispatch import tuning_table_path
+from bakeoff._flatten import DEFAULT_MAX_DEPTH
+from bakeoff._flatten import flatness_bound
+from bakeoff._flatten import flatten
+from bakeoff._plan import BernsteinPlan
+from bakeoff._plan import get_plan
+from bakeoff._project import DEFAULT_NUM_GRID
+from bakeoff._project import DEFAULT_NUM_ITERATIONS
+from bakeoff._project import DEFAULT_PROJECT_CHUNK_SIZE
+from bakeoff._project import project
+from bakeoff._stream import DEFAULT_CHUNK_SIZE
+from bakeoff._stream import evaluate_stream
+from bakeoff._stream import evaluate_stream_into
+from bakeoff._stream import iter_chunks
+from bakeoff._surface import surface_grid
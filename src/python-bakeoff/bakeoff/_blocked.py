@@ -0,0 +1,76 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import numpy as np
+
+
+DEFAULT_MAX_WORKSPACE_BYTES = 64 * 1024 * 1024
+# NOTE: The ``spread*`` kernels allocate three ``(d, N + 1)`` arrays per
+#       value of ``s`` (``broadcast_s``, ``broadcast_one_less`` and
+#       ``workspace``), which is the most of any kernel.
+WORKSPACE_ARRAYS = 3
+
+
+def block_size(dimension, num_nodes, max_workspace_bytes):
+    """Get the number of ``s``-values that can be evaluated in one block.
+
+    Args:
+        dimension (int): The dimension ``d`` of the nodes.
+        num_nodes (int): The number of nodes ``N + 1``.
+        max_workspace_bytes (int): The maximum number of bytes the Fortran
+            workspace(s) may use for a single block.
+
+    Returns:
+        int: The number of values per block (at least one).
+    """
+    itemsize = np.dtype(np.float64).itemsize
+    bytes_per_value = WORKSPACE_ARRAYS * dimension * num_nodes * itemsize
+    return max(1, max_workspace_bytes // bytes_per_value)
+
+
+def evaluate_blocked(
+    fn, nodes, s_vals, max_workspace_bytes=DEFAULT_MAX_WORKSPACE_BYTES
+):
+    """Evaluate a curve with ``fn`` over blocks of ``s_vals``.
+
+    The kernels allocate workspace proportional to ``num_vals``, so this
+    bounds peak memory by handing ``fn`` contiguous slices of ``s_vals``
+    that fit in ``max_workspace_bytes``.
+
+    Args:
+        fn (Callable): Any of the kernels, e.g. ``forall1`` or ``spread3``.
+            Must accept an ``out=`` argument.
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        s_vals (numpy.ndarray): The contiguous parameter values to evaluate
+            at, with shape ``(k,)``.
+        max_workspace_bytes (Optional[int]): The maximum number of bytes the
+            kernel workspace(s) may use for each block.
+
+    Returns:
+        numpy.ndarray: The evaluated points, with shape ``(d, k)``.
+    """
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    step = block_size(dimension, num_nodes, max_workspace_bytes)
+
+    evaluated = np.empty((dimension, num_vals), order="F")
+    for start in range(0, num_vals, step):
+        stop = min(start + step, num_vals)
+        # NOTE: Column slices of a Fortran-ordered array are contiguous, so
+        #       each block is written in place.
+        fn(nodes, s_vals[start:stop], out=evaluated[:, start:stop])
+
+    return evaluated
@@ -0,0 +1,220 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import functools
+import json
+import math
+import os
+import pathlib
+import platform
+
+from . import _binary
+
+
+CANDIDATES = (
+    "forall1",
+    "forall2",
+    "forall3",
+    "do1",
+    "do2",
+    "do3",
+    "spread1",
+    "spread2",
+    "spread3",
+    "tiled",
+    "serial",
+    "simd",
+    "specialized",
+    "vs_algorithm32",
+    "vs_algorithm53",
+    "vs_algorithm64",
+    "vs_algorithm_stable",
+)
+# NOTE: ``specialized`` is ``serial`` for every shape other than the
+#       unrolled low degree cases in 2 and 3 dimensions.
+DEFAULT_KERNEL = "specialized"
+# NOTE: The largest degree ``N`` for which every binomial coefficient
+#       "numerator" ``(N - j) binom(N, j)`` is exact in the integer (or
+#       floating point) type used by each kernel. See
+#       ``vs-algorithm-overflow.ipynb`` for details.
+VS_MAX_DEGREE = {
+    "vs_algorithm32": 29,
+    "vs_algorithm53": 51,
+    "vs_algorithm64": 61,
+}
+TUNING_TABLE_ENV = "BAKEOFF_TUNING_TABLE"
+
+
+def tuning_table_path():
+    """Get the path of the tuning table for this machine.
+
+    The table depends on both the package (``bakeoff`` vs. ``bakeoff_opt``)
+    and the host, so both are part of the filename. The path can be
+    overridden with the ``BAKEOFF_TUNING_TABLE`` environment variable.
+
+    Returns:
+        pathlib.Path: The path to the (possibly non-existent) table.
+    """
+    override = os.environ.get(TUNING_TABLE_ENV)
+    if override:
+        return pathlib.Path(override)
+
+    filename = f"{__package__}-{platform.node()}.json"
+    return pathlib.Path.home() / ".cache" / "de-casteljau-bakeoff" / filename
+
+
+@functools.lru_cache(maxsize=None)
+def _read_entries(path):
+    if not path.is_file():
+        return ()
+
+    with open(path, "r") as file_obj:
+        table = json.load(file_obj)
+    return tuple(
+        (
+            entry["dimension"],
+            entry["num_nodes"],
+            entry["num_vals"],
+            entry["kernel"],
+        )
+        for entry in table["entries"]
+    )
+
+
+def load_tuning_table(path=None):
+    """Load the entries of a tuning table.
+
+    Args:
+        path (Optional[pathlib.Path]): The table to load. Defaults to
+            :func:`tuning_table_path`.
+
+    Returns:
+        Tuple[Tuple[int, int, int, str], ...]: The
+        ``(dimension, num_nodes, num_vals, kernel)`` entries (empty if
+        the table does not exist).
+    """
+    if path is None:
+        path = tuning_table_path()
+    return _read_entries(pathlib.Path(path))
+
+
+def save_tuning_table(entries, path=None):
+    """Save the entries of a tuning table.
+
+    Args:
+        entries (Iterable[Tuple[int, int, int, str]]): The
+            ``(dimension, num_nodes, num_vals, kernel)`` entries, where
+            ``kernel`` is the fastest of :data:`CANDIDATES` at that point.
+        path (Optional[pathlib.Path]): Where to save the table. Defaults to
+            :func:`tuning_table_path`.
+
+    Returns:
+        pathlib.Path: The path the table was written to.
+    """
+    if path is None:
+        path = tuning_table_path()
+    path = pathlib.Path(path)
+
+    table = {
+        "package": __package__,
+        "machine": platform.node(),
+        "entries": [
+            {
+                "dimension": dimension,
+                "num_nodes": num_nodes,
+                "num_vals": num_vals,
+                "kernel": kernel,
+            }
+            for dimension, num_nodes, num_vals, kernel in entries
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file_obj:
+        json.dump(table, file_obj, indent=2)
+        file_obj.write("\n")
+
+    _read_entries.cache_clear()
+    return path
+
+
+def _log_distance(entry, dimension, num_nodes, num_vals):
+    entry_dimension, entry_num_nodes, entry_num_vals, _ = entry
+    return (
+        (math.log2(entry_num_nodes) - math.log2(num_nodes)) ** 2
+        + (math.log2(entry_num_vals) - math.log2(num_vals)) ** 2
+        + (math.log2(entry_dimension) - math.log2(dimension)) ** 2
+    )
+
+
+def select_kernel(dimension, num_nodes, num_vals, table=None):
+    """Choose the kernel to use for a given problem size.
+
+    Uses the tuning table entry nearest to ``(d, N + 1, k)`` (measured on
+    a log scale, since the grid is roughly geometric). If there is no
+    table, or if the chosen ``vs_algorithm*`` kernel would overflow for
+    this degree, falls back to ``specialized``.
+
+    Args:
+        dimension (int): The dimension ``d`` of the nodes.
+        num_nodes (int): The number of nodes ``N + 1``.
+        num_vals (int): The number of parameter values ``k``.
+        table (Optional[Tuple[Tuple[int, int, int, str], ...]]): The tuning
+            table entries. Defaults to :func:`load_tuning_table`.
+
+    Returns:
+        str: The name of the chosen kernel.
+    """
+    if table is None:
+        table = load_tuning_table()
+    if not table or num_vals == 0:
+        return DEFAULT_KERNEL
+
+    nearest = min(
+        table,
+        key=lambda entry: _log_distance(entry, dimension, num_nodes, num_vals),
+    )
+    kernel = nearest[3]
+    if num_nodes - 1 > VS_MAX_DEGREE.get(kernel, num_nodes):
+        return DEFAULT_KERNEL
+
+    return kernel
+
+
+def evaluate(nodes, s_vals, out=None, return_kernel=False):
+    """Evaluate a curve with the fastest kernel for its size.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of the curve, a Fortran-contiguous
+            array with shape ``(d, N + 1)``.
+        s_vals (numpy.ndarray): The contiguous parameter values to evaluate
+            at, with shape ``(k,)``.
+        out (Optional[numpy.ndarray]): A Fortran-ordered array with shape
+            ``(d, k)`` to write the result into.
+        return_kernel (Optional[bool]): Also return the name of the kernel
+            that was used (e.g. for instrumentation).
+
+    Returns:
+        Union[numpy.ndarray, Tuple[numpy.ndarray, str]]: The evaluated
+        points, with shape ``(d, k)`` (and the kernel name if
+        ``return_kernel`` is set).
+    """
+    dimension, num_nodes = nodes.shape
+    (num_vals,) = s_vals.shape
+    kernel = select_kernel(dimension, num_nodes, num_vals)
+    evaluated = getattr(_binary, kernel)(nodes, s_vals, out=out)
+
+    if return_kernel:
+        return evaluated, kernel
+    return evaluated
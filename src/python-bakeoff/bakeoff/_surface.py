@@ -0,0 +1,74 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE: This file is copied (rather than symlinked) since a symlink **outside**
+#       of the package tree won't get copied during a ``pip install``.
+
+import numpy as np
+
+from . import _binary
+from . import _dispatch
+
+
+def _get_batch_kernel(kernel, dimension, num_nodes, num_vals):
+    if kernel is None:
+        kernel = _dispatch.select_kernel(dimension, num_nodes, num_vals)
+        # NOTE: Not every candidate (e.g. ``tiled``) has a batch variant.
+        if not hasattr(_binary, f"{kernel}_batch"):
+            kernel = _dispatch.DEFAULT_KERNEL
+    return getattr(_binary, f"{kernel}_batch")
+
+
+def surface_grid(nodes, u_vals, v_vals, kernel=None, out=None):
+    """Evaluate a tensor-product surface on a ``(u, v)`` grid.
+
+    Each row of control points is a curve in ``v``, so one batched call
+    evaluates all ``M + 1`` rows at every ``v``. For each ``v`` that gives
+    the ``M + 1`` control points of a curve in ``u``, and a second batched
+    call evaluates all ``k_v`` of those curves at every ``u``. Neither
+    reduction is repeated for every grid point, unlike
+    :func:`surface_points` on the flattened grid.
+
+    Args:
+        nodes (numpy.ndarray): The control points of the surface, a
+            Fortran-contiguous array with shape ``(d, M + 1, N + 1)``
+            (``M`` is the degree in ``u`` and ``N`` the degree in ``v``).
+        u_vals (numpy.ndarray): The contiguous ``u``-values, with shape
+            ``(k_u,)``.
+        v_vals (numpy.ndarray): The contiguous ``v``-values, with shape
+            ``(k_v,)``.
+        kernel (Optional[str]): The name of the curve kernel to use (e.g.
+            ``serial``). Must have a ``*_batch`` variant. Defaults to
+            :func:`select_kernel` for each of the two reductions.
+        out (Optional[numpy.ndarray]): A Fortran-ordered array with shape
+            ``(d, k_u, k_v)`` to write the result into.
+
+    Returns:
+        numpy.ndarray: The evaluated points, with shape ``(d, k_u, k_v)``,
+        i.e. ``out[:, i, j]`` is the point at ``(u_vals[i], v_vals[j])``.
+    """
+    dimension, num_nodes_u, num_nodes_v = nodes.shape
+    (num_u,) = u_vals.shape
+    (num_v,) = v_vals.shape
+    evaluate_rows = _get_batch_kernel(kernel, dimension, num_nodes_v, num_v)
+    evaluate_columns = _get_batch_kernel(
+        kernel, dimension, num_nodes_u, num_u
+    )
+
+    # NOTE: The batch kernels take curves as ``(d, num_nodes, num_curves)``,
+    #       so the rows (and then the partially evaluated columns) are
+    #       transposed into that layout. Both are much smaller than the
+    #       output.
+    rows = np.asfortranarray(nodes.transpose(0, 2, 1))
+    partial = evaluate_rows(rows, v_vals)
+    columns = np.asfortranarray(partial.transpose(0, 2, 1))
+    return evaluate_columns(columns, u_vals, out=out)
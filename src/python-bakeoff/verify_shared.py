@@ -10,6 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import fractions
+import pathlib
+import tempfile
+
 import numpy as np
 
 
@@ -26,6 +30,477 @@ def from_serial_inner(bakeoff_module):
     return serial_inner
 
 
+def report_max_errors(bakeoff_module):
+    functions = (
+        bakeoff_module.vs_algorithm32,
+        bakeoff_module.vs_algorithm53,
+        bakeoff_module.vs_algorithm64,
+        bakeoff_module.vs_algorithm_stable,
+    )
+    names = [fn.__name__ for fn in functions]
+    max_width = max(len(name) for name in names)
+    print("Max. relative error against `serial`")
+    print(" " * 7 + " ".join(f"{name:>{max_width}}" for name in names))
+
+    random_state = np.random.RandomState(seed=1405994551)
+    s_vals = np.linspace(0.0, 1.0, 513)
+    for exponent in range(1, 12 + 1):
+        degree = 2 ** exponent
+        nodes = np.asfortranarray(
+            random_state.uniform(-1000.0, 1000.0, size=(2, degree + 1))
+        )
+        expected = bakeoff_module.serial(nodes, s_vals)
+        scale = np.max(np.abs(expected))
+
+        errors = []
+        with np.errstate(invalid="ignore", over="ignore"):
+            for fn in functions:
+                evaluated = fn(nodes, s_vals)
+                errors.append(np.max(np.abs(evaluated - expected)) / scale)
+
+        parts = " ".join(f"{error:{max_width}.3e}" for error in errors)
+        print(f"N={degree:4d} {parts}")
+        assert errors[-1] < 1e-12
+
+
+def report_single_precision_errors(bakeoff_module):
+    functions = (
+        bakeoff_module.serial_single,
+        bakeoff_module.simd_single,
+        bakeoff_module.serial_mixed,
+        bakeoff_module.simd_mixed,
+    )
+    names = [fn.__name__ for fn in functions]
+    max_width = max(len(name) for name in names)
+    print("Max. relative error against float64 `serial`")
+    print(" " * 7 + " ".join(f"{name:>{max_width}}" for name in names))
+
+    random_state = np.random.RandomState(seed=1405994551)
+    s_vals = np.linspace(0.0, 1.0, 513, dtype=np.float32)
+    for exponent in range(1, 7 + 1):
+        degree = 2 ** exponent
+        nodes = np.asfortranarray(
+            random_state.uniform(-1000.0, 1000.0, size=(2, degree + 1)),
+            dtype=np.float32,
+        )
+        # NOTE: The reference uses the **same** (rounded) inputs, so only
+        #       the error from the arithmetic is measured.
+        expected = bakeoff_module.serial(
+            nodes.astype(np.float64), s_vals.astype(np.float64)
+        )
+        scale = np.max(np.abs(expected))
+
+        errors = []
+        for fn in functions:
+            evaluated = fn(nodes, s_vals)
+            assert evaluated.dtype == np.float32
+            errors.append(np.max(np.abs(evaluated - expected)) / scale)
+
+        parts = " ".join(f"{error:{max_width}.3e}" for error in errors)
+        print(f"N={degree:4d} {parts}")
+        # NOTE: Mixed precision only rounds the inputs (exact) and the
+        #       output, so the error is a few float32 ulps at most.
+        assert errors[2] < 4 * np.finfo(np.float32).eps
+        assert errors[3] < 4 * np.finfo(np.float32).eps
+
+
+def verify_dispatch(bakeoff_module, nodes, s_vals, expected):
+    evaluated, kernel = bakeoff_module.evaluate(
+        nodes, s_vals, return_kernel=True
+    )
+    assert kernel in bakeoff_module.CANDIDATES
+    assert np.all(evaluated == expected)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "tuning.json"
+        entries = [(2, 4, 3, "vs_algorithm64"), (2, 64, 3, "spread1")]
+        bakeoff_module.save_tuning_table(entries, path=path)
+        table = bakeoff_module.load_tuning_table(path=path)
+
+    assert table == tuple(entries)
+    select_kernel = bakeoff_module.select_kernel
+    assert select_kernel(2, 4, 3, table=table) == "vs_algorithm64"
+    assert select_kernel(3, 8, 9, table=table) == "vs_algorithm64"
+    assert select_kernel(2, 48, 3, table=table) == "spread1"
+    # NOTE: The nearest entry is ``vs_algorithm64``, but it overflows for
+    #       degree 62 so ``specialized`` must be used instead.
+    assert select_kernel(2, 63, 3, table=table[:1]) == "specialized"
+    assert select_kernel(2, 4, 3, table=()) == "specialized"
+    print("Verified: evaluate")
+
+
+def verify_with_derivative(bakeoff_module):
+    functions = (
+        bakeoff_module.serial_with_derivative,
+        bakeoff_module.vs_algorithm_with_derivative,
+    )
+    random_state = np.random.RandomState(seed=2109843263)
+    s_vals = np.linspace(0.0, 1.0, 65)
+    for num_nodes in (1, 2, 3, 8):
+        nodes = np.asfortranarray(
+            random_state.uniform(-10.0, 10.0, size=(2, num_nodes))
+        )
+        degree = num_nodes - 1
+        expected = bakeoff_module.serial(nodes, s_vals)
+        # NOTE: The hodograph of a constant curve is (a single node) zero.
+        first_nodes = np.asfortranarray(
+            degree * np.diff(nodes, axis=1) if degree else 0.0 * nodes
+        )
+        expected_first = bakeoff_module.serial(first_nodes, s_vals)
+        second_nodes = np.asfortranarray(
+            (degree - 1) * np.diff(first_nodes, axis=1)
+            if degree > 1
+            else 0.0 * nodes
+        )
+        expected_second = bakeoff_module.serial(second_nodes, s_vals)
+        for fn in functions:
+            evaluated, first = fn(nodes, s_vals)
+            assert np.allclose(evaluated, expected, rtol=1e-13, atol=1e-13)
+            assert np.allclose(first, expected_first, rtol=1e-13, atol=1e-12)
+            evaluated, first, second = fn(
+                nodes, s_vals, second_derivative=True
+            )
+            assert np.allclose(evaluated, expected, rtol=1e-13, atol=1e-13)
+            assert np.allclose(first, expected_first, rtol=1e-13, atol=1e-12)
+            assert np.allclose(
+                second, expected_second, rtol=1e-13, atol=1e-11
+            )
+
+    for fn in functions:
+        out = np.empty(expected.shape, order="F")
+        derivatives_out = np.empty(expected.shape + (2,), order="F")
+        evaluated, first, second = fn(
+            nodes,
+            s_vals,
+            second_derivative=True,
+            out=out,
+            derivatives_out=derivatives_out,
+        )
+        assert evaluated is out
+        assert np.all(first == derivatives_out[:, :, 0])
+        assert np.all(second == derivatives_out[:, :, 1])
+        assert np.allclose(out, expected, rtol=1e-13, atol=1e-13)
+        try:
+            fn(nodes, s_vals, derivatives_out=derivatives_out)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("`derivatives_out` with the wrong shape")
+        print(f"Verified: {fn.__name__}")
+
+
+def verify_stream(bakeoff_module):
+    s_vals = np.linspace(0.0, 1.0, 1001)
+    nodes = np.asfortranarray([[0.0, 1.0, 3.0, 4.0], [0.0, 2.0, -1.0, 0.5]])
+    expected = bakeoff_module.serial(nodes, s_vals)
+
+    # NOTE: Chunks of 64 do not divide 1001 and the generator yields pieces
+    #       of different sizes that do not line up with the chunks.
+    pieces = (s_vals[start : start + 37] for start in range(0, 1001, 37))
+    evaluated = np.empty(expected.shape, order="F")
+    for start, chunk in bakeoff_module.evaluate_stream(
+        nodes, pieces, kernel="serial", chunk_size=64
+    ):
+        _, size = chunk.shape
+        evaluated[:, start : start + size] = chunk
+    assert np.all(evaluated == expected)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        s_path = pathlib.Path(tmp_dir) / "s_vals.npy"
+        np.save(s_path, s_vals)
+        s_memmap = np.load(s_path, mmap_mode="r")
+        for fortran_order in (True, False):
+            out = np.lib.format.open_memmap(
+                pathlib.Path(tmp_dir) / f"evaluated-{fortran_order}.npy",
+                mode="w+",
+                shape=expected.shape,
+                fortran_order=fortran_order,
+            )
+            result = bakeoff_module.evaluate_stream_into(
+                nodes, s_memmap, out, kernel="serial", chunk_size=64
+            )
+            assert result is out
+            assert np.all(out == expected)
+            del result, out
+        del s_memmap
+
+    try:
+        bakeoff_module.evaluate_stream_into(
+            nodes, iter(s_vals), np.empty((2, 1000), order="F")
+        )
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Extra values in the stream were accepted")
+    print("Verified: evaluate_stream")
+
+
+def verify_strided(bakeoff_module):
+    functions = (
+        (bakeoff_module.serial_strided, bakeoff_module.serial),
+        (
+            bakeoff_module.vs_algorithm_stable_strided,
+            bakeoff_module.vs_algorithm_stable,
+        ),
+    )
+    random_state = np.random.RandomState(seed=316934013)
+    # NOTE: C-ordered ``(N + 1, d)`` nodes, i.e. the layout of ``nodes.T``.
+    nodes_transposed = random_state.uniform(-10.0, 10.0, size=(6, 3))
+    nodes = np.asfortranarray(nodes_transposed.T)
+    # NOTE: A column of a C-ordered table is strided.
+    table = random_state.uniform(0.0, 1.0, size=(33, 4))
+    s_vals = np.ascontiguousarray(table[:, 2])
+    read_only = table[:, 2]
+    read_only.flags.writeable = False
+
+    for strided_fn, fn in functions:
+        expected = fn(nodes, s_vals)
+        evaluated = strided_fn(nodes_transposed, table[:, 2], transposed=True)
+        assert np.all(evaluated == expected)
+        assert np.all(strided_fn(nodes, read_only) == expected)
+        # NOTE: Negative strides (reversed views) in every argument.
+        evaluated = strided_fn(
+            nodes[::-1, ::-1], table[::-1, 2], out=np.empty((3, 33), order="F")
+        )
+        expected = fn(
+            np.asfortranarray(nodes[::-1, ::-1]),
+            np.ascontiguousarray(s_vals[::-1]),
+        )
+        assert np.all(evaluated == expected)
+        print(f"Verified: {strided_fn.__name__}")
+
+
+def verify_specialized(bakeoff_module):
+    random_state = np.random.RandomState(seed=117208411)
+    s_vals = random_state.uniform(0.0, 1.0, size=(17,))
+    # NOTE: Every unrolled shape (2 to 6 nodes in 2 and 3 dimensions) and
+    #       a few shapes on either side that fall back to ``serial``.
+    for dimension in (1, 2, 3, 4):
+        for num_nodes in range(1, 9):
+            nodes = random_state.uniform(
+                -10.0, 10.0, size=(dimension, num_nodes)
+            )
+            nodes = np.asfortranarray(nodes)
+            expected = bakeoff_module.serial(nodes, s_vals)
+            evaluated = bakeoff_module.specialized(nodes, s_vals)
+            # NOTE: The unrolled kernels do the same operations in the same
+            #       order as ``serial``, but with ``-ffast-math`` the compiler
+            #       may contract them into FMAs differently.
+            assert np.allclose(evaluated, expected, atol=1e-13, rtol=1e-14)
+
+    print("Verified: specialized (against `serial`)")
+
+
+def verify_subdivide(bakeoff_module):
+    random_state = np.random.RandomState(seed=520374619)
+    nodes = np.asfortranarray(random_state.uniform(-10.0, 10.0, size=(3, 5)))
+    t_vals = np.linspace(0.0, 1.0, 9)
+
+    left, right = bakeoff_module.subdivide(nodes, 0.25)
+    assert left.shape == right.shape == nodes.shape
+    expected = bakeoff_module.serial(nodes, 0.25 * t_vals)
+    assert np.allclose(bakeoff_module.serial(left, t_vals), expected)
+    expected = bakeoff_module.serial(nodes, 0.25 + 0.75 * t_vals)
+    assert np.allclose(bakeoff_module.serial(right, t_vals), expected)
+    for bad_s_val in (-0.25, 1.25, np.nan):
+        try:
+            bakeoff_module.subdivide(nodes, bad_s_val)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid `s_val` was accepted", bad_s_val)
+    print("Verified: subdivide")
+
+    # NOTE: Includes a repeated value and both endpoints, which give
+    #       pieces that are a single point.
+    s_vals = np.array([0.0, 0.25, 0.5, 0.5, 0.875, 1.0])
+    out = np.empty((3, 5, 7), order="F")
+    pieces = bakeoff_module.subdivide_many(nodes, s_vals, out=out)
+    assert pieces is out
+    boundaries = np.concatenate([[0.0], s_vals, [1.0]])
+    for j in range(7):
+        start, end = boundaries[j], boundaries[j + 1]
+        expected = bakeoff_module.serial(nodes, start + (end - start) * t_vals)
+        evaluated = bakeoff_module.serial(pieces[:, :, j], t_vals)
+        assert np.allclose(evaluated, expected)
+    # NOTE: Adjacent pieces share the split point exactly.
+    assert np.all(pieces[:, -1, :-1] == pieces[:, 0, 1:])
+
+    pieces = bakeoff_module.subdivide_many(nodes, np.empty(0))
+    assert np.all(pieces[:, :, 0] == nodes)
+    bad_s_vals_list = (
+        [0.5, 0.25],
+        [-0.5, 0.5],
+        [0.5, 1.5],
+        [0.25, np.nan, 0.5],
+        [np.nan],
+    )
+    for bad_s_vals in bad_s_vals_list:
+        try:
+            bakeoff_module.subdivide_many(nodes, np.array(bad_s_vals))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid `s_vals` were accepted", bad_s_vals)
+    print("Verified: subdivide_many")
+
+
+def segment_distances(points, start, end):
+    direction = end - start
+    length_squared = np.sum(direction * direction, axis=0)
+    t_vals = np.sum((points - start) * direction, axis=0)
+    t_vals = np.clip(t_vals / np.maximum(length_squared, 1e-300), 0.0, 1.0)
+    closest = start + t_vals * direction
+    return np.sqrt(np.sum((points - closest) ** 2, axis=0))
+
+
+def verify_flatten(bakeoff_module):
+    random_state = np.random.RandomState(seed=902442437)
+    nodes = np.asfortranarray(random_state.uniform(0.0, 100.0, size=(2, 7)))
+    tolerance = 0.05
+    polyline, s_vals = bakeoff_module.flatten(nodes, tolerance)
+    (num_vals,) = s_vals.shape
+    assert s_vals[0] == 0.0 and s_vals[-1] == 1.0
+    assert np.all(np.diff(s_vals) > 0.0)
+    assert np.all(polyline == bakeoff_module.serial(nodes, s_vals))
+
+    # NOTE: Sample each piece densely and measure the distance to its
+    #       segment of the polyline.
+    local_t = np.linspace(0.0, 1.0, 65)
+    max_error = 0.0
+    for j in range(num_vals - 1):
+        start, end = s_vals[j], s_vals[j + 1]
+        points = bakeoff_module.serial(nodes, start + (end - start) * local_t)
+        distances = segment_distances(
+            points, polyline[:, j : j + 1], polyline[:, j + 1 : j + 2]
+        )
+        max_error = max(max_error, np.max(distances))
+    assert max_error <= tolerance
+
+    # NOTE: A line with evenly spaced nodes is (exactly) flat.
+    line = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 4.0]])
+    _, line_s_vals = bakeoff_module.flatten(line, tolerance)
+    assert np.all(line_s_vals == [0.0, 1.0])
+    try:
+        bakeoff_module.flatten(nodes, 0.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A non-positive `tolerance` was accepted")
+    print(
+        f"Verified: flatten ({num_vals} values, error {max_error:.3e} "
+        f"for tolerance {tolerance})"
+    )
+
+
+def verify_project(bakeoff_module):
+    random_state = np.random.RandomState(seed=1486920047)
+    nodes = np.asfortranarray(random_state.uniform(0.0, 10.0, size=(2, 5)))
+    points = random_state.uniform(-2.0, 12.0, size=(2, 300))
+    s_vals, closest = bakeoff_module.project(nodes, points)
+    assert np.allclose(closest, bakeoff_module.serial(nodes, s_vals))
+
+    # NOTE: Brute force: the nearest of many (dense) points on the curve.
+    dense = bakeoff_module.serial(nodes, np.linspace(0.0, 1.0, 4097))
+    differences = dense[:, :, np.newaxis] - points[:, np.newaxis, :]
+    dense_distances = np.sqrt(
+        np.min(np.sum(differences * differences, axis=0), axis=0)
+    )
+    distances = np.sqrt(np.sum((closest - points) ** 2, axis=0))
+    assert np.all(distances <= dense_distances + 1e-12)
+
+    # NOTE: Several chunks on several threads give the same result.
+    threaded = bakeoff_module.project(
+        nodes, points, chunk_size=64, num_threads=3
+    )
+    assert np.all(threaded[0] == s_vals)
+    assert np.all(threaded[1] == closest)
+    for kwargs in ({"num_grid": 1}, {"chunk_size": 0}, {"num_threads": 0}):
+        try:
+            bakeoff_module.project(nodes, points, **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid arguments were accepted", kwargs)
+    print("Verified: project")
+
+
+def verify_surface(bakeoff_module):
+    # NOTE: A bilinear patch (``M = N = 1``) is exact at dyadic ``(u, v)``.
+    nodes = np.asfortranarray(
+        [
+            [[0.0, 0.0], [4.0, 4.0]],
+            [[0.0, 2.0], [0.0, 2.0]],
+            [[0.0, 1.0], [1.0, 3.0]],
+        ]
+    )
+    u_vals = np.array([0.0, 0.25, 1.0])
+    v_vals = np.array([0.5, 0.5, 0.75])
+    expected = np.asfortranarray(
+        [[0.0, 1.0, 4.0], [1.0, 1.0, 1.5], [0.5, 0.875, 2.5]]
+    )
+    evaluated = bakeoff_module.surface_points(nodes, u_vals, v_vals)
+    assert np.all(evaluated == expected)
+    try:
+        bakeoff_module.surface_points(nodes, u_vals, v_vals[:2])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("`u_vals` and `v_vals` of different lengths")
+    print("Verified: surface_points")
+
+    random_state = np.random.RandomState(seed=2090615311)
+    nodes = np.asfortranarray(random_state.uniform(-1.0, 1.0, size=(3, 4, 6)))
+    u_vals = random_state.uniform(0.0, 1.0, size=(7,))
+    v_vals = random_state.uniform(0.0, 1.0, size=(5,))
+    u_grid, v_grid = np.meshgrid(u_vals, v_vals, indexing="ij")
+    expected = bakeoff_module.surface_points(
+        nodes, u_grid.ravel(order="F"), v_grid.ravel(order="F")
+    ).reshape((3, 7, 5), order="F")
+    for kernel in (None, "serial", "simd", "vs_algorithm_stable"):
+        evaluated = bakeoff_module.surface_grid(
+            nodes, u_vals, v_vals, kernel=kernel
+        )
+        assert np.allclose(evaluated, expected, atol=1e-15, rtol=1e-13)
+    out = np.empty((3, 7, 5), order="F")
+    evaluated = bakeoff_module.surface_grid(nodes, u_vals, v_vals, out=out)
+    assert evaluated is out
+    print("Verified: surface_grid")
+
+
+def exact_de_casteljau(nodes, s_val):
+    workspace = [fractions.Fraction(value) for value in nodes]
+    s_val = fractions.Fraction(s_val)
+    for i in range(len(workspace) - 1, 0, -1):
+        workspace = [
+            (1 - s_val) * workspace[j] + s_val * workspace[j + 1]
+            for j in range(i)
+        ]
+    return float(workspace[0])
+
+
+def verify_compensated(bakeoff_module):
+    # NOTE: ``(2s - 1)^N`` has a root of multiplicity ``N`` at ``s = 1/2``,
+    #       which makes it very ill-conditioned nearby.
+    degree = 9
+    nodes = np.asfortranarray(
+        [[(-1.0) ** (degree - j) for j in range(degree + 1)]]
+    )
+    s_vals = np.linspace(0.47, 0.53, 33)
+    expected = np.array([exact_de_casteljau(nodes[0, :], s) for s in s_vals])
+
+    compensated = bakeoff_module.compensated(nodes, s_vals)[0, :]
+    serial = bakeoff_module.serial(nodes, s_vals)[0, :]
+    compensated_error = np.max(np.abs(compensated - expected))
+    serial_error = np.max(np.abs(serial - expected))
+    assert compensated_error < serial_error
+    assert compensated_error <= np.max(np.spacing(np.abs(expected)))
+    print(
+        f"Verified: compensated (error {compensated_error:.3e} vs. "
+        f"{serial_error:.3e} for `serial`)"
+    )
+
+
 def do_verify(bakeoff_module):
     print(f"Verifying: {bakeoff_module}")
     functions = (
@@ -35,14 +510,21 @@ def do_verify(bakeoff_module):
         bakeoff_module.do1,
         bakeoff_module.do2,
         bakeoff_module.do3,
+        bakeoff_module.do3_omp,
         bakeoff_module.spread1,
         bakeoff_module.spread2,
         bakeoff_module.spread3,
+        bakeoff_module.tiled,
         bakeoff_module.serial,
+        bakeoff_module.serial_omp,
+        bakeoff_module.simd,
+        bakeoff_module.specialized,
         from_serial_inner(bakeoff_module),
         bakeoff_module.vs_algorithm32,
         bakeoff_module.vs_algorithm53,
         bakeoff_module.vs_algorithm64,
+        bakeoff_module.vs_algorithm_stable,
+        bakeoff_module.compensated,
     )
     nodes = np.asfortranarray([[1.0, 1.0, 2.0, 2.0], [0.0, 1.0, 0.0, 1.0]])
     s_vals = np.asfortranarray([0.0, 0.5, 1.0])
@@ -51,3 +533,113 @@ def do_verify(bakeoff_module):
         evaluated = fn(nodes, s_vals)
         assert np.all(evaluated == expected)
         print(f"Verified: {fn.__name__}")
+
+    batch_functions = (
+        bakeoff_module.forall1_batch,
+        bakeoff_module.forall2_batch,
+        bakeoff_module.forall3_batch,
+        bakeoff_module.do1_batch,
+        bakeoff_module.do2_batch,
+        bakeoff_module.do3_batch,
+        bakeoff_module.spread1_batch,
+        bakeoff_module.spread2_batch,
+        bakeoff_module.spread3_batch,
+        bakeoff_module.serial_batch,
+        bakeoff_module.simd_batch,
+        bakeoff_module.specialized_batch,
+        bakeoff_module.vs_algorithm32_batch,
+        bakeoff_module.vs_algorithm53_batch,
+        bakeoff_module.vs_algorithm64_batch,
+        bakeoff_module.vs_algorithm_stable_batch,
+    )
+    # NOTE: Scaling by a power of two is exact, so the second curve can be
+    #       verified with exact equality as well.
+    nodes_batch = np.asfortranarray(np.stack([nodes, 2.0 * nodes], axis=2))
+    expected_batch = np.asfortranarray(
+        np.stack([expected, 2.0 * expected], axis=2)
+    )
+    for fn in batch_functions:
+        evaluated = fn(nodes_batch, s_vals)
+        assert np.all(evaluated == expected_batch)
+        print(f"Verified: {fn.__name__}")
+
+    out = np.empty(expected.shape, order="F")
+    evaluated = bakeoff_module.serial(nodes, s_vals, out=out)
+    assert evaluated is out
+    assert np.all(out == expected)
+    out_batch = np.empty(expected_batch.shape, order="F")
+    evaluated = bakeoff_module.serial_batch(nodes_batch, s_vals, out=out_batch)
+    assert evaluated is out_batch
+    assert np.all(out_batch == expected_batch)
+    try:
+        bakeoff_module.serial(nodes, s_vals, out=out_batch)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("`out` with the wrong shape was accepted")
+    print("Verified: out=")
+
+    # NOTE: A single value of ``s`` needs 3 * 2 * 4 * 8 = 192 bytes, so this
+    #       forces blocks of two values.
+    evaluated = bakeoff_module.evaluate_blocked(
+        bakeoff_module.spread1, nodes, s_vals, max_workspace_bytes=384
+    )
+    assert np.all(evaluated == expected)
+    print("Verified: evaluate_blocked")
+
+    # NOTE: A tile of two values leaves a partial tile at the end.
+    evaluated = bakeoff_module.tiled(nodes, s_vals, tile_size=2)
+    assert np.all(evaluated == expected)
+    try:
+        bakeoff_module.tiled(nodes, s_vals, tile_size=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A non-positive `tile_size` was accepted")
+    print("Verified: tiled(tile_size=...)")
+
+    nodes32 = nodes.astype(np.float32, order="F")
+    s_vals32 = s_vals.astype(np.float32)
+    single_functions = (
+        bakeoff_module.serial_single,
+        bakeoff_module.simd_single,
+        bakeoff_module.serial_mixed,
+        bakeoff_module.simd_mixed,
+    )
+    for fn in single_functions:
+        evaluated = fn(nodes32, s_vals32)
+        assert evaluated.dtype == np.float32
+        assert np.all(evaluated == expected)
+        print(f"Verified: {fn.__name__}")
+
+    plan = bakeoff_module.get_plan(4, s_vals)
+    assert bakeoff_module.get_plan(4, s_vals.copy()) is plan
+    assert np.allclose(plan.evaluate(nodes), expected)
+    assert np.allclose(plan.evaluate_batch(nodes_batch), expected_batch)
+    print("Verified: BernsteinPlan")
+
+    verify_dispatch(bakeoff_module, nodes, s_vals, expected)
+
+    options = bakeoff_module.compiler_options()
+    version = bakeoff_module.compiler_version()
+    assert options
+    # NOTE: The ``Makefile`` adds ``-fopenmp-simd`` for the SIMD kernels.
+    assert "-fopenmp-simd" not in options
+    assert "-fopenmp-simd" in bakeoff_module.compiler_options("simd_batch")
+    assert "-ffp-contract=off" in bakeoff_module.compiler_options(
+        "compensated"
+    )
+    assert version.startswith("GCC version")
+    print("Verified: compiler_options")
+    print(f"Verified: compiler_version ({version})")
+    verify_with_derivative(bakeoff_module)
+    verify_stream(bakeoff_module)
+    verify_strided(bakeoff_module)
+    verify_specialized(bakeoff_module)
+    verify_subdivide(bakeoff_module)
+    verify_flatten(bakeoff_module)
+    verify_project(bakeoff_module)
+    verify_surface(bakeoff_module)
+    verify_compensated(bakeoff_module)
+    report_max_errors(bakeoff_module)
+    report_single_precision_errors(bakeoff_module)